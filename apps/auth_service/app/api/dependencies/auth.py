@@ -8,11 +8,14 @@ from typing import Annotated
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
-from apps.auth_service.app.api.dependencies.services import get_auth_service
-from apps.auth_service.app.core.constants import Role
-from apps.auth_service.app.exceptions.http import ForbiddenError
-from apps.auth_service.app.models.user import User
-from apps.auth_service.app.services.service import AuthService
+from backend.src.app.api.dependencies.services import (
+    get_auth_service,
+    get_read_auth_service,
+)
+from backend.src.app.core.constants import Role
+from backend.src.app.core.principal import Principal
+from backend.src.app.exceptions.http import ForbiddenError
+from backend.src.app.services.auth.service import AuthService
 
 # OAuth2 схема для извлечения Bearer токена из заголовка Authorization
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -21,7 +24,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service)
-) -> User:
+) -> Principal:
     """
     Получение текущего аутентифицированного пользователя из Bearer токена.
 
@@ -30,7 +33,7 @@ async def get_current_user(
         auth_service: Сервис аутентификации.
 
     Returns:
-        User: Модель текущего пользователя.
+        Principal: Снимок текущего пользователя (id, email, роль, активность).
 
     Raises:
         HTTPException: Если токен невалидный или истёк.
@@ -39,17 +42,30 @@ async def get_current_user(
     return await auth_service.get_current_user(token)
 
 
-async def require_admin(
-    current_user: User = Depends(get_current_user),
-) -> User:
+async def get_read_current_user(
+    token: str = Depends(oauth2_scheme),
+    auth_service: AuthService = Depends(get_read_auth_service)
+) -> Principal:
     """
-    Проверка роли ADMIN — выбрасывает 403 если не админ.
+    Текущий пользователь для маршрутов только на чтение.
+
+    При промахе кеша субъектов Principal читается через сессию чтения
+    (AUTOCOMMIT, реплика) — той же, что у самого маршрута, поэтому
+    GET запрос не открывает транзакцию в основной БД.
 
     Args:
-        current_user: Текущий аутентифицированный пользователь.
+        token: JWT токен из заголовка Authorization.
+        auth_service: Сервис аутентификации над сессией чтения.
 
     Returns:
-        User: Текущий пользователь (если админ).
+        Principal: Снимок текущего пользователя.
+    """
+    return await auth_service.get_current_user(token)
+
+
+def _ensure_admin(current_user: Principal) -> Principal:
+    """
+    Проверка роли ADMIN — выбрасывает 403 если не админ.
 
     Raises:
         ForbiddenError: Если у пользователя нет роли ADMIN.
@@ -62,6 +78,45 @@ async def require_admin(
     return current_user
 
 
-CurrentUser = Annotated[User, Depends(
+async def require_admin(
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
+    """
+    Проверка роли ADMIN — выбрасывает 403 если не админ.
+
+    Args:
+        current_user: Текущий аутентифицированный пользователь.
+
+    Returns:
+        Principal: Текущий пользователь (если админ).
+
+    Raises:
+        ForbiddenError: Если у пользователя нет роли ADMIN.
+    """
+    return _ensure_admin(current_user)
+
+
+async def require_read_admin(
+    current_user: Principal = Depends(get_read_current_user),
+) -> Principal:
+    """
+    Проверка роли ADMIN для маршрутов только на чтение.
+
+    Args:
+        current_user: Текущий пользователь (через сессию чтения).
+
+    Returns:
+        Principal: Текущий пользователь (если админ).
+
+    Raises:
+        ForbiddenError: Если у пользователя нет роли ADMIN.
+    """
+    return _ensure_admin(current_user)
+
+
+CurrentUser = Annotated[Principal, Depends(
     get_current_user)]  # Текущий пользователь
-AdminUser = Annotated[User, Depends(require_admin)]
+AdminUser = Annotated[Principal, Depends(require_admin)]
+# Для GET маршрутов: пользователь читается через сессию чтения
+ReadCurrentUser = Annotated[Principal, Depends(get_read_current_user)]
+ReadAdminUser = Annotated[Principal, Depends(require_read_admin)]
@@ -8,9 +8,9 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.app.core.database import get_session
+from backend.src.app.core.database import get_read_session, get_session
 from backend.src.app.repositories.user import UserRepository
-from backend.src.app.repositories.task import TaskRepository
+from backend.src.app.repositories.task import TaskRepository, TaskStatsRepository
 from backend.src.app.services.auth.service import AuthService
 from backend.src.app.services.tasks.service import TaskService
 from backend.src.app.services.notifications.service import NotificationService
@@ -44,6 +44,66 @@ def get_task_repository(session: AsyncSession = Depends(get_session)) -> TaskRep
     return TaskRepository(session)
 
 
+def get_read_user_repository(
+    session: AsyncSession = Depends(get_read_session),
+) -> UserRepository:
+    """
+    Фабрика UserRepository для маршрутов только на чтение.
+
+    Args:
+        session: Сессия чтения (реплика или основная БД).
+
+    Returns:
+        UserRepository: Экземпляр репозитория пользователей.
+    """
+    return UserRepository(session)
+
+
+def get_read_task_repository(
+    session: AsyncSession = Depends(get_read_session),
+) -> TaskRepository:
+    """
+    Фабрика TaskRepository для маршрутов только на чтение.
+
+    Args:
+        session: Сессия чтения (реплика или основная БД).
+
+    Returns:
+        TaskRepository: Экземпляр репозитория задач.
+    """
+    return TaskRepository(session)
+
+
+def get_task_stats_repository(
+    session: AsyncSession = Depends(get_session),
+) -> TaskStatsRepository:
+    """
+    Фабрика TaskStatsRepository для dependency injection.
+
+    Args:
+        session: Сессия БД (внедряется автоматически).
+
+    Returns:
+        TaskStatsRepository: Экземпляр репозитория счётчиков задач.
+    """
+    return TaskStatsRepository(session)
+
+
+def get_read_task_stats_repository(
+    session: AsyncSession = Depends(get_read_session),
+) -> TaskStatsRepository:
+    """
+    Фабрика TaskStatsRepository для маршрутов только на чтение.
+
+    Args:
+        session: Сессия чтения (реплика или основная БД).
+
+    Returns:
+        TaskStatsRepository: Экземпляр репозитория счётчиков задач.
+    """
+    return TaskStatsRepository(session)
+
+
 # ── Service factories (Фабрики сервисов) ─────────────────────────────────────
 
 def get_notification_service() -> NotificationService:
@@ -74,12 +134,32 @@ def get_auth_service(
     return AuthService(user_repo)
 
 
+def get_read_auth_service(
+    user_repo: UserRepository = Depends(get_read_user_repository),
+) -> AuthService:
+    """
+    Фабрика AuthService для маршрутов только на чтение.
+
+    Загружает текущего пользователя через сессию чтения;
+    методы записи этого экземпляра вызывать нельзя.
+
+    Args:
+        user_repo: Репозиторий пользователей над сессией чтения.
+
+    Returns:
+        AuthService: Экземпляр сервиса аутентификации.
+    """
+
+    return AuthService(user_repo)
+
+
 def get_task_service(
     task_repo: TaskRepository = Depends(
         get_task_repository),
     user_repo: UserRepository = Depends(get_user_repository),
     notifications: NotificationService = Depends(
         get_notification_service),
+    stats_repo: TaskStatsRepository = Depends(get_task_stats_repository),
 ) -> TaskService:
     """
     Фабрика TaskService для dependency injection.
@@ -88,9 +168,28 @@ def get_task_service(
         task_repo: Репозиторий задач.
         user_repo: Репозиторий пользователей.
         notifications: Сервис уведомлений.
+        stats_repo: Репозиторий счётчиков задач.
 
     Returns:
         TaskService: Экземпляр сервиса задач.
     """
     # Создаём сервис задач со всеми зависимостями
-    return TaskService(task_repo, user_repo, notifications)
+    return TaskService(task_repo, user_repo, notifications, stats_repo)
+
+
+def get_read_task_service(
+    task_repo: TaskRepository = Depends(get_read_task_repository),
+    user_repo: UserRepository = Depends(get_read_user_repository),
+    notifications: NotificationService = Depends(get_notification_service),
+    stats_repo: TaskStatsRepository = Depends(get_read_task_stats_repository),
+) -> TaskService:
+    """
+    Фабрика TaskService для маршрутов только на чтение.
+
+    Репозитории работают через сессию чтения, поэтому
+    методы записи этого экземпляра вызывать нельзя.
+
+    Returns:
+        TaskService: Экземпляр сервиса задач.
+    """
+    return TaskService(task_repo, user_repo, notifications, stats_repo)
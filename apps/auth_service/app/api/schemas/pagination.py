@@ -0,0 +1,13 @@
+"""Keyset pagination envelope."""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+ItemT = TypeVar("ItemT")
+
+
+class Page(BaseModel, Generic[ItemT]):
+    items: list[ItemT]
+    # Pass back as `cursor` to get the next page; None on the last page
+    next_cursor: str | None = None
@@ -0,0 +1,68 @@
+"""
+NDJSON выгрузка списков для массовых потребителей.
+
+Строки читаются серверным курсором пачками и сериализуются по одной,
+поэтому память не растёт с размером таблицы.
+"""
+
+# Импорты для типизации
+from collections.abc import AsyncIterator
+
+# Импорты FastAPI для потоковых ответов
+from fastapi.responses import StreamingResponse
+# Импорты Pydantic для схем ответа
+from pydantic import BaseModel
+
+# Импорты настроек приложения
+from backend.src.app.core.config import settings
+# Импорты фабрики сессий чтения (реплика или основная БД)
+from backend.src.app.core.database import read_session
+# Импорты базового репозитория
+from backend.src.app.repositories.base import BaseRepository
+
+# MIME тип NDJSON (одна JSON запись на строку)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_lines(
+    repository_class: type[BaseRepository],
+    schema: type[BaseModel],
+) -> AsyncIterator[str]:
+    """
+    Генератор строк NDJSON.
+
+    Сессия открывается здесь, а не через Depends: тело ответа
+    отдаётся уже после выхода из endpoint. Выгрузка читает из реплики,
+    если они настроены.
+
+    Args:
+        repository_class: Класс репозитория выгружаемой модели.
+        schema: Схема сериализации одной записи.
+
+    Yields:
+        str: JSON запись с переводом строки.
+    """
+    async with read_session() as session:
+        repository = repository_class(session)
+        async for instance in repository.stream_all(settings.EXPORT_YIELD_PER):
+            yield schema.model_validate(instance).model_dump_json() + "\n"
+
+
+def ndjson_response(
+    repository_class: type[BaseRepository],
+    schema: type[BaseModel],
+) -> StreamingResponse:
+    """
+    Потоковый ответ со всеми записями модели в формате NDJSON.
+
+    Args:
+        repository_class: Класс репозитория выгружаемой модели.
+        schema: Схема сериализации одной записи.
+
+    Returns:
+        StreamingResponse: Ответ application/x-ndjson.
+    """
+    return StreamingResponse(
+        _ndjson_lines(repository_class, schema),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
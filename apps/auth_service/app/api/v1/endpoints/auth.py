@@ -8,8 +8,13 @@ Endpoints аутентификации — регистрация, вход, о
 
 from fastapi import APIRouter, Depends
 
-from backend.src.app.api.dependencies.auth import CurrentUser
-from backend.src.app.api.dependencies.services import get_auth_service
+from backend.src.app.api.dependencies.auth import ReadCurrentUser
+from backend.src.app.api.dependencies.services import (
+    get_auth_service,
+    get_read_user_repository,
+)
+from backend.src.app.exceptions.http import NotFoundError
+from backend.src.app.repositories.user import UserRepository
 from backend.src.app.schemas.auth import LoginRequest, RefreshRequest, TokenPair
 from backend.src.app.schemas.user import UserCreate, UserOut
 from backend.src.app.services.auth.service import AuthService
@@ -92,15 +97,21 @@ async def refresh_tokens(
     summary="Get current user profile" 
 )
 async def me(
-    current_user: CurrentUser, 
+    current_user: ReadCurrentUser,
+    repo: UserRepository = Depends(get_read_user_repository),
 ) -> UserOut:
     """
     Получение профиля текущего аутентифицированного пользователя
 
     Args:
         current_user: Данные текущего пользователя (из JWT токена)
+        repo: Репозиторий пользователей (полный профиль)
     Returns:
         UserOut: Профиль пользователя
     """
+    # Principal содержит только поля авторизации — профиль читаем из БД
+    user = await repo.get_by_id(current_user.id)
+    if not user:
+        raise NotFoundError("User", str(current_user.id))
     # Преобразуем модель пользователя в схему ответа
-    return UserOut.model_validate(current_user)
+    return UserOut.model_validate(user)
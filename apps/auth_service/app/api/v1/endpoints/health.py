@@ -4,10 +4,19 @@ Endpoints для проверки работоспособности серви
 Используется мониторингом и load balancer'ами для проверки статуса сервиса.
 """
 
+from typing import Any
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
 from backend.src.app.core.config import settings
+from backend.src.app.core.database import (
+    pool_metrics,
+    replicas,
+    statement_cache_metrics,
+)
+from backend.src.app.core.principal_cache import principal_cache
+from backend.src.app.core.token_cache import token_cache
 
 
 router = APIRouter(tags=["Health"])
@@ -45,3 +54,46 @@ async def health_check() -> HealthResponse:
         version=settings.VERSION,
         environment=settings.ENVIRONMENT,
     )
+
+
+class DatabaseMetricsResponse(BaseModel):
+    """
+    Схема ответа метрик подключений к БД.
+
+    Attributes:
+        pools: Метрики пула каждого движка (основная БД и реплики).
+        statement_caches: Попадания в кеш скомпилированных выражений.
+        replicas: Состояние ротации реплик.
+        token_cache: Кеш проверенных JWT (запросы мимо проверки подписи).
+        principal_cache: Кеш субъектов (запросы мимо загрузки пользователя).
+    """
+    pools: list[dict[str, Any]]  # Счётчики и gauge'и пулов
+    statement_caches: list[dict[str, Any]]  # Кеш компиляции каждого движка
+    replicas: dict[str, Any]     # Реплик всего, исправных, исключений
+    token_cache: dict[str, Any]  # Размер, попадания, промахи, вытеснения
+    principal_cache: dict[str, Any]  # Размер, попадания, промахи, сбросы
+
+
+@router.get(
+    "/metrics/db",
+    response_model=DatabaseMetricsResponse,
+    summary="Database connection pool metrics"
+)
+async def database_metrics() -> DatabaseMetricsResponse:
+    """
+    Метрики пулов соединений (выдачи, ожидания, занятые соединения),
+    кешей скомпилированных SQL выражений и кешей, которые избавляют
+    запрос от обращения к БД: проверенных токенов и субъектов.
+
+    Returns:
+        DatabaseMetricsResponse: Снимок метрик на момент запроса.
+    """
+    return DatabaseMetricsResponse(
+        pools=[metrics.snapshot() for metrics in pool_metrics.values()],
+        statement_caches=[
+            metrics.snapshot() for metrics in statement_cache_metrics.values()
+        ],
+        replicas=replicas.stats(),
+        token_cache=token_cache.stats(),
+        principal_cache=principal_cache.stats(),
+    )
@@ -1,11 +1,32 @@
 """Task CRUD and workflow endpoints."""
 
 import uuid
-from fastapi import APIRouter, Depends
-
-from backend.src.app.api.dependencies.auth import CurrentUser
-from backend.src.app.api.dependencies.services import get_task_service
-from backend.src.app.schemas.task import TaskCreate, TaskOut, TaskUpdate
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from backend.src.app.api.dependencies.auth import (
+    CurrentUser,
+    ReadAdminUser,
+    ReadCurrentUser,
+)
+from backend.src.app.api.streaming import NDJSON_MEDIA_TYPE, ndjson_response
+from backend.src.app.api.dependencies.services import (
+    get_read_task_service,
+    get_task_service,
+)
+from backend.src.app.core.config import settings
+from backend.src.app.repositories.task import TaskRepository
+from backend.src.app.schemas.pagination import Page
+from backend.src.app.schemas.task import (
+    TaskBulkAssign,
+    TaskBulkCreate,
+    TaskBulkIds,
+    TaskBulkItemResult,
+    TaskCreate,
+    TaskOut,
+    TaskStatsOut,
+    TaskUpdate,
+)
 from backend.src.app.services.tasks.service import TaskService
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
@@ -13,14 +34,94 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 @router.get(
     "/", 
-    response_model=list[TaskOut], 
-    summary="List all tasks"
+    response_model=Page[TaskOut], 
+    summary="List tasks, newest first"
     )
 async def list_tasks(
-    _: CurrentUser,
+    _: ReadCurrentUser,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    service: TaskService = Depends(get_read_task_service),
+) -> Page[TaskOut]:
+    tasks, next_cursor = await service.get_page(limit, cursor)
+    return Page[TaskOut](items=tasks, next_cursor=next_cursor)
+
+
+@router.get(
+    "/export", 
+    response_class=StreamingResponse, 
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}, 
+    summary="Stream all tasks as NDJSON"
+    )
+async def export_tasks(_: ReadCurrentUser) -> StreamingResponse:
+    # Same access as list_tasks: any authenticated user
+    return ndjson_response(TaskRepository, TaskOut)
+
+
+@router.get(
+    "/stats", 
+    response_model=TaskStatsOut, 
+    summary="Task counts per status and assignee (admin only)"
+    )
+async def task_stats(
+    _: ReadAdminUser,
+    service: TaskService = Depends(get_read_task_service),
+) -> TaskStatsOut:
+    return await service.get_stats()
+
+
+# ── Bulk: one transaction, one statement per batch, a result per item ────────
+
+@router.post(
+    "/bulk", 
+    response_model=list[TaskBulkItemResult], 
+    summary="Create many tasks"
+    )
+async def create_tasks_bulk(
+    data: TaskBulkCreate,
+    current_user: CurrentUser,
+    service: TaskService = Depends(get_task_service),
+) -> list[TaskBulkItemResult]:
+    return await service.create_many(data.items, current_user)
+
+
+@router.post(
+    "/bulk/assign", 
+    response_model=list[TaskBulkItemResult], 
+    summary="Assign many tasks to a user"
+    )
+async def assign_tasks_bulk(
+    data: TaskBulkAssign,
+    current_user: CurrentUser,
     service: TaskService = Depends(get_task_service),
-) -> list[TaskOut]:
-    return await service.get_all()
+) -> list[TaskBulkItemResult]:
+    return await service.assign_many(data.task_ids, data.assignee_id, current_user)
+
+
+@router.post(
+    "/bulk/complete", 
+    response_model=list[TaskBulkItemResult], 
+    summary="Mark many tasks as completed"
+    )
+async def complete_tasks_bulk(
+    data: TaskBulkIds,
+    current_user: CurrentUser,
+    service: TaskService = Depends(get_task_service),
+) -> list[TaskBulkItemResult]:
+    return await service.complete_many(data.task_ids, current_user)
+
+
+@router.post(
+    "/bulk/delete", 
+    response_model=list[TaskBulkItemResult], 
+    summary="Delete many tasks"
+    )
+async def delete_tasks_bulk(
+    data: TaskBulkIds,
+    current_user: CurrentUser,
+    service: TaskService = Depends(get_task_service),
+) -> list[TaskBulkItemResult]:
+    return await service.delete_many(data.task_ids, current_user)
 
 
 @router.post(
@@ -44,8 +145,8 @@ async def create_task(
     )
 async def get_task(
     task_id: uuid.UUID,
-    _: CurrentUser,
-    service: TaskService = Depends(get_task_service),
+    _: ReadCurrentUser,
+    service: TaskService = Depends(get_read_task_service),
 ) -> TaskOut:
     return await service.get_by_id(task_id)
 
@@ -1,13 +1,25 @@
 """User management endpoints."""
 
 import uuid
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
-from backend.src.app.api.dependencies.auth import AdminUser, CurrentUser
+from backend.src.app.api.dependencies.auth import (
+    AdminUser,
+    CurrentUser,
+    ReadAdminUser,
+    ReadCurrentUser,
+)
 from backend.src.app.api.dependencies.services import get_auth_service
+from backend.src.app.api.streaming import NDJSON_MEDIA_TYPE, ndjson_response
 from backend.src.app.repositories.user import UserRepository
-from backend.src.app.api.dependencies.services import get_user_repository
+from backend.src.app.api.dependencies.services import (
+    get_read_user_repository,
+    get_user_repository,
+)
+from backend.src.app.core.config import settings
 from backend.src.app.exceptions.http import NotFoundError
+from backend.src.app.schemas.pagination import Page
 from backend.src.app.schemas.user import UserOut, UserUpdate
 from backend.src.app.services.auth.service import AuthService
 
@@ -19,15 +31,30 @@ router = APIRouter(
 
 @router.get(
     "/", 
-    response_model=list[UserOut], 
-    summary="List all users (admin only)"
+    response_model=Page[UserOut], 
+    summary="List users, newest first (admin only)"
     )
 async def list_users(
-    _: AdminUser,
-    repo: UserRepository = Depends(get_user_repository),
-) -> list[UserOut]:
-    users = await repo.get_all()
-    return [UserOut.model_validate(u) for u in users]
+    _: ReadAdminUser,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: str | None = None,
+    repo: UserRepository = Depends(get_read_user_repository),
+) -> Page[UserOut]:
+    users, next_cursor = await repo.get_page(limit, cursor)
+    return Page[UserOut](
+        items=[UserOut.model_validate(u) for u in users],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/export", 
+    response_class=StreamingResponse, 
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}, 
+    summary="Stream all users as NDJSON (admin only)"
+    )
+async def export_users(_: ReadAdminUser) -> StreamingResponse:
+    return ndjson_response(UserRepository, UserOut)
 
 
 @router.get(
@@ -37,8 +64,8 @@ async def list_users(
     )
 async def get_user(
     user_id: uuid.UUID,
-    current_user: CurrentUser,
-    repo: UserRepository = Depends(get_user_repository),
+    current_user: ReadCurrentUser,
+    repo: UserRepository = Depends(get_read_user_repository),
 ) -> UserOut:
     user = await repo.get_by_id(user_id)
     if not user:
@@ -5,16 +5,21 @@
 Никакой бизнес-логики здесь — только подключение компонентов (wiring).
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.src.app.core.config import settings
-from backend.src.app.core.database import engine, Base
+from backend.src.app.core.database import Base, engine, replicas
+from backend.src.app.core.jobs import reconcile_task_stats, run_periodically
 from backend.src.app.core.logging import configure_logging
+from backend.src.app.core.principal_cache import principal_cache
+from backend.src.app.core.security import configure_password_hashing, password_executor
 from backend.src.app.exceptions.handlers import register_exception_handlers
 from backend.src.app.middlewares.logging import RequestLoggingMiddleware
 from backend.src.app.api.v1.router import api_v1_router
+from backend.shared.security import calibrate
 
 
 @asynccontextmanager
@@ -26,10 +31,33 @@ async def lifespan(app: FastAPI):
     """
     configure_logging()
 
+    if settings.PASSWORD_HASH_TARGET_MS > 0:
+        # Подбираем стоимость хеша под железо этого узла
+        params = await asyncio.to_thread(
+            calibrate,
+            settings.PASSWORD_HASH_TARGET_MS,
+            settings.ARGON2_MEMORY_COST,
+            settings.ARGON2_PARALLELISM,
+        )
+        configure_password_hashing(params)
+
     if settings.DEBUG:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+    await principal_cache.start()
+    reconciler = None
+    if settings.TASK_STATS_RECONCILE_INTERVAL_SECONDS > 0:
+        reconciler = asyncio.create_task(run_periodically(
+            settings.TASK_STATS_RECONCILE_INTERVAL_SECONDS, reconcile_task_stats
+        ))
     yield
+    if reconciler is not None:
+        reconciler.cancel()
+        with suppress(asyncio.CancelledError):
+            await reconciler
+    await principal_cache.stop()
+    password_executor.shutdown()
+    await replicas.dispose()
     await engine.dispose()
 
 
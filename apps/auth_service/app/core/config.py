@@ -17,6 +17,25 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
 
 
+def to_async_driver(url: str) -> str:
+    """
+    Замена синхронного драйвера в URL базы данных на асинхронный.
+
+    Args:
+        url: Исходный URL базы данных.
+
+    Returns:
+        str: URL с async драйвером.
+    """
+    # Заменяем postgresql:// на postgresql+asyncpg://
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    # Заменяем sqlite:/// на sqlite+aiosqlite:///
+    if url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    return url
+
+
 class AppSettings(BaseSettings):
     """
     Класс основных настроек приложения.
@@ -41,6 +60,11 @@ class AppSettings(BaseSettings):
     API_V1_PREFIX: str = "/api/v1"  # Префикс для API версии 1
     DOCS_URL: str = "/docs"  # URL для Swagger документации
     OPENAPI_URL: str = "/openapi.json"  # URL для OpenAPI спецификации
+    PAGE_SIZE_DEFAULT: int = 50  # Размер страницы списков по умолчанию
+    PAGE_SIZE_MAX: int = 200  # Максимальный размер страницы (limit)
+    EXPORT_YIELD_PER: int = 1000  # Строк за одну выборку при NDJSON экспорте
+    # Период сверки счётчиков task_stats с задачами (секунды, 0 — не сверять)
+    TASK_STATS_RECONCILE_INTERVAL_SECONDS: int = 3600
 
     # ── CORS (Настройки Cross-Origin) ────────────────────────────────────────
     CORS_ORIGINS: list[str] = ["http://localhost:3000",
@@ -49,16 +73,58 @@ class AppSettings(BaseSettings):
 
     # ── Database (Настройки БД) ──────────────────────────────────────────────
     DATABASE_URL: str = "sqlite+aiosqlite:///./task_manager.db"  # URL подключения к БД
+    DATABASE_POOL_SIZE: int = 5  # Постоянных соединений в пуле
+    DATABASE_MAX_OVERFLOW: int = 10  # Дополнительных соединений сверх пула
+    DATABASE_POOL_TIMEOUT: float = 30.0  # Ожидание свободного соединения (секунды)
+    # LIFO: простаивающие соединения закрываются по pool_recycle, а не держатся все
+    DATABASE_POOL_USE_LIFO: bool = False
+    # Скомпилированных SQL выражений в кеше движка
+    DATABASE_QUERY_CACHE_SIZE: int = 500
+    # Реплики только для чтения (пусто — все запросы идут в основную БД)
+    DATABASE_REPLICA_URLS: list[str] = []
+    # На сколько реплика исключается из ротации после ошибки соединения (секунды)
+    DATABASE_REPLICA_EJECT_SECONDS: float = 30.0
+    # Сколько после записи клиент читает из основной БД (read-your-writes, секунды)
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # ── Passwords (Настройки хеширования паролей) ─────────────────────────────
+    # Сколько хеширований/проверок паролей выполняется одновременно
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 4
+    # Схемы хеширования: первая — основная, остальные перехешируются при входе
+    PASSWORD_SCHEMES: list[str] = ["argon2", "bcrypt"]
+    ARGON2_TIME_COST: int = 3  # argon2: число итераций
+    ARGON2_MEMORY_COST: int = 65536  # argon2: память на хеш (KiB)
+    ARGON2_PARALLELISM: int = 4  # argon2: потоков на хеш
+    BCRYPT_ROUNDS: int = 12  # bcrypt: log2 числа раундов
+    # Целевое время хеша для калибровки при старте (мс, 0 — не калибровать)
+    PASSWORD_HASH_TARGET_MS: int = 0
 
     # ── JWT (Настройки JWT токенов) ──────────────────────────────────────────
     JWT_PRIVATE_KEY_PATH: Path = BASE_DIR / "certs" / \
         "private.pem"  # Путь к приватному ключу
     JWT_PUBLIC_KEY_PATH: Path = BASE_DIR / "certs" / \
         "public.pem"  # Путь к публичному ключу
-    JWT_ALGORITHM: str = "RS256"  # Алгоритм подписи JWT
+    JWT_ALGORITHM: str = "RS256"  # Алгоритм подписи JWT (RS256/ES256/EdDSA)
+    JWT_BACKEND: str = "jose"  # Библиотека JWT: jose или pyjwt (нужна для EdDSA)
+    JWT_KEY_ID: str = "primary"  # kid активного ключа подписи
+    # Дополнительные публичные ключи для проверки (kid → путь), для ротации
+    JWT_VERIFICATION_KEYS: dict[str, Path] = {}
+    # Как часто проверять mtime/inode файлов ключей (секунды)
+    JWT_KEY_RELOAD_INTERVAL_SECONDS: float = 5.0
     # Время жизни access токена (минуты)
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # Время жизни refresh токена (дни)
+    # Размер кеша проверенных access токенов (0 — выключен)
+    JWT_TOKEN_CACHE_SIZE: int = 10_000
+    # Максимальное время жизни записи кеша токенов (секунды)
+    JWT_TOKEN_CACHE_TTL_SECONDS: int = 300
+
+    # ── Principal cache (Кеш аутентифицированных пользователей) ──────────────
+    PRINCIPAL_CACHE_SIZE: int = 10_000  # Размер кеша (0 — выключен)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30  # Время жизни записи (секунды)
+    # Канал инвалидации между воркерами: none, local или redis
+    PRINCIPAL_INVALIDATION_BACKEND: str = "none"
+    PRINCIPAL_INVALIDATION_CHANNEL: str = "principal-invalidation"  # Канал Redis
 
     # ── Redis (Настройки Redis) ──────────────────────────────────────────────
     REDIS_URL: str = "redis://localhost:6379/0"  # URL подключения к Redis
@@ -90,14 +156,21 @@ class AppSettings(BaseSettings):
         Returns:
             str: URL с async драйвером.
         """
-        # Обеспечиваем использование асинхронного драйвера
-        # Заменяем postgresql:// на postgresql+asyncpg://
-        if v.startswith("postgresql://"):
-            return v.replace("postgresql://", "postgresql+asyncpg://", 1)
-        # Заменяем sqlite:/// на sqlite+aiosqlite:///
-        if v.startswith("sqlite:///"):
-            return v.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
-        return v
+        return to_async_driver(v)
+
+    @field_validator("DATABASE_REPLICA_URLS", mode="after")
+    @classmethod
+    def validate_replica_urls(cls, v: list[str]) -> list[str]:
+        """
+        Валидатор URL реплик: те же async драйверы, что и у DATABASE_URL.
+
+        Args:
+            v: Список URL реплик.
+
+        Returns:
+            list[str]: URL с async драйверами.
+        """
+        return [to_async_driver(url) for url in v]
 
     @property
     def fastapi_kwargs(self) -> dict:
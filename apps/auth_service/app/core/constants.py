@@ -18,3 +18,7 @@ class Role(StrEnum):
 class TokenType(StrEnum):
     ACCESS = "access"
     REFRESH = "refresh"
+
+
+# Максимум элементов в одном bulk запросе
+BULK_MAX_ITEMS = 500
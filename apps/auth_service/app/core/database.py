@@ -3,43 +3,299 @@
 
 Настройка подключения к базе данных, создание сессий.
 Используется для dependency injection в API endpoints.
+
+Чтение может идти в реплики (DATABASE_REPLICA_URLS):
+- get_session      — основная БД, для запросов с записью
+- get_read_session — реплика по кругу (round-robin); реплика с ошибкой
+  соединения исключается на DATABASE_REPLICA_EJECT_SECONDS
+- read-your-writes — после фиксации записи клиент ещё
+  DATABASE_READ_YOUR_WRITES_SECONDS читает из основной БД,
+  чтобы видеть свои изменения несмотря на лаг репликации.
+  Клиент определяется по subject токена (переживает refresh токена).
+  Гарантия действует в пределах процесса: отметки хранятся в памяти
+  воркера, и запрос, попавший в другой воркер uvicorn, может прочитать
+  реплику с лагом. Нужна гарантия между воркерами — маршрутизация
+  клиента в один воркер (sticky sessions) на балансировщике.
+
+Сессии get_read_session работают в режиме AUTOCOMMIT: каждый SELECT
+выполняется без BEGIN/COMMIT, а запись в такой сессии запрещена.
+
+Схема: миграций у сервиса нет. Таблицы создаёт create_all (DEBUG),
+а индексы, объявленные в моделях позже таблиц, создаёт разовый скрипт
+scripts/create_missing_indexes.py (не при старте воркеров: DDL из
+нескольких воркеров сразу мешали бы друг другу и блокировали запись).
 """
 
+# Импорты для счётчика round-robin
+import itertools
+# Импорты для работы со временем
+import time
+# Импорты для LRU порядка записей
+from collections import OrderedDict
 # Импорты для асинхронных генераторов
 from collections.abc import AsyncGenerator
+# Импорты для асинхронных контекстных менеджеров
+from contextlib import asynccontextmanager
 # Импорты для аннотаций типов
 from typing import Annotated
 
 # Импорты FastAPI для зависимостей
-from fastapi import Depends
+from fastapi import Depends, Request
+# Импорты SQLAlchemy: события сессии и ошибки драйвера
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError, InvalidRequestError
 # Импорты SQLAlchemy для асинхронной работы с БД
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,  # Асинхронный движок
     AsyncSession,  # Асинхронная сессия
     async_sessionmaker,  # Фабрика сессий
     create_async_engine,  # Создание асинхронного движка
 )
 # Импорты базового класса для ORM моделей
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 # Импорты настроек приложения
 from backend.src.app.core.config import settings
+# Импорты метрик пула соединений и кеша компиляции
+from backend.shared.metrics import PoolMetrics, StatementCacheMetrics
+# Импорты кеша субъектов (сброс после фиксации изменений)
+from backend.src.app.core.principal_cache import principal_cache
+# Импорты проверки токена (subject клиента для read-your-writes)
+from backend.src.app.core.security import TokenError, decode_token_cached
 
+# Метрики пулов всех движков: имя пула → метрики
+pool_metrics: dict[str, PoolMetrics] = {}
+# Метрики кеша скомпилированных выражений: имя движка → метрики
+statement_cache_metrics: dict[str, StatementCacheMetrics] = {}
 
-# Создание асинхронного движка для подключения к БД
-engine = create_async_engine(
-    settings.DATABASE_URL,  # URL из настроек
-    echo=settings.DEBUG,  # Логирование SQL запросов в debug режиме
-    pool_pre_ping=True,  # Проверка соединения перед использованием
-    pool_recycle=3600,  # Пересоздание соединений через 1 час
-)
 
-# Фабрика для создания асинхронных сессий
-async_session_factory = async_sessionmaker(
-    bind=engine,  # Привязка к движку
-    class_=AsyncSession,  # Класс сессии
-    expire_on_commit=False,  # Не сбрасывать объекты после коммита
-    autoflush=False,  # Отключить авто-flush
+def _create_engine(url: str, name: str) -> AsyncEngine:
+    """
+    Создание асинхронного движка с общими параметрами пула.
+
+    Args:
+        url: URL подключения к БД.
+        name: Имя пула в метриках (primary, replica-0, ...).
+
+    Returns:
+        AsyncEngine: Асинхронный движок.
+    """
+    async_engine = create_async_engine(
+        url,  # URL из настроек
+        echo=settings.DEBUG,  # Логирование SQL запросов в debug режиме
+        pool_pre_ping=True,  # Проверка соединения перед использованием
+        pool_recycle=3600,  # Пересоздание соединений через 1 час
+        pool_size=settings.DATABASE_POOL_SIZE,  # Постоянных соединений
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,  # Соединений сверх пула
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,  # Ожидание соединения
+        pool_use_lifo=settings.DATABASE_POOL_USE_LIFO,  # Порядок выдачи
+        query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,  # Кеш компиляции
+    )
+    pool_metrics[name] = PoolMetrics(name).attach(async_engine)
+    statement_cache_metrics[name] = StatementCacheMetrics(name).attach(async_engine)
+    return async_engine
+
+
+def _create_session_factory(
+    bind: AsyncEngine, read_only: bool = False
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Создание фабрики асинхронных сессий для движка.
+
+    Args:
+        bind: Движок, к которому привязываются сессии.
+        read_only: Сессии без транзакций (AUTOCOMMIT), запись запрещена.
+
+    Returns:
+        async_sessionmaker: Фабрика сессий.
+    """
+    if read_only:
+        # Копия движка с общим пулом: соединения выдаются в AUTOCOMMIT
+        bind = bind.execution_options(isolation_level="AUTOCOMMIT")
+    return async_sessionmaker(
+        bind=bind,  # Привязка к движку
+        class_=AsyncSession,  # Класс сессии
+        expire_on_commit=False,  # Не сбрасывать объекты после коммита
+        autoflush=False,  # Отключить авто-flush
+        info={"read_only": read_only},  # Флаг для запрета записи
+    )
+
+
+# Создание асинхронного движка для подключения к основной БД
+engine = _create_engine(settings.DATABASE_URL, "primary")
+
+# Фабрика для создания асинхронных сессий основной БД
+async_session_factory = _create_session_factory(engine)
+# Фабрика сессий только для чтения (без BEGIN/COMMIT)
+read_only_session_factory = _create_session_factory(engine, read_only=True)
+
+
+# ── Replicas (Реплики только для чтения) ─────────────────────────────────────
+
+class ReplicaSet:
+    """
+    Реплики для чтения с выбором по кругу и исключением по ошибкам.
+
+    Attributes:
+        eject_seconds: На сколько реплика исключается после ошибки.
+        ejections: Число исключений (для мониторинга).
+    """
+
+    def __init__(self, urls: list[str], eject_seconds: float) -> None:
+        self.eject_seconds = eject_seconds
+        self.ejections = 0
+        self._engines = [
+            _create_engine(url, f"replica-{index}")
+            for index, url in enumerate(urls)
+        ]
+        self._factories = [_create_session_factory(e) for e in self._engines]
+        self._read_only_factories = [
+            _create_session_factory(e, read_only=True) for e in self._engines
+        ]
+        # Момент (monotonic), до которого реплика исключена
+        self._ejected_until = [0.0] * len(self._engines)
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def candidates(self) -> list[int]:
+        """
+        Исправные реплики в порядке обхода для очередного запроса.
+
+        Returns:
+            list[int]: Индексы реплик, начиная со следующей по кругу.
+        """
+        if not self._engines:
+            return []
+        now = time.monotonic()
+        start = next(self._counter)
+        size = len(self._engines)
+        return [
+            index
+            for index in ((start + offset) % size for offset in range(size))
+            if self._ejected_until[index] <= now
+        ]
+
+    def session(self, index: int, read_only: bool = False) -> AsyncSession:
+        """Новая сессия реплики `index` (read_only — в AUTOCOMMIT)."""
+        if read_only:
+            return self._read_only_factories[index]()
+        return self._factories[index]()
+
+    def eject(self, index: int) -> None:
+        """
+        Исключение реплики из ротации на eject_seconds.
+
+        По истечении срока реплика возвращается в ротацию сама:
+        если она всё ещё недоступна, первая же ошибка исключит её снова.
+        """
+        self._ejected_until[index] = time.monotonic() + self.eject_seconds
+        self.ejections += 1
+
+    def stats(self) -> dict:
+        """
+        Состояние реплик для мониторинга.
+
+        Returns:
+            dict: Число реплик, исправных сейчас, и число исключений.
+        """
+        return {
+            "replicas": len(self._engines),
+            "healthy": len(self.candidates()),
+            "ejections": self.ejections,
+        }
+
+    async def dispose(self) -> None:
+        """Закрытие пулов соединений всех реплик."""
+        for replica_engine in self._engines:
+            await replica_engine.dispose()
+
+
+class RecentWriters:
+    """
+    Клиенты, недавно фиксировавшие запись (read-your-writes).
+
+    Хранится в памяти воркера (другие воркеры отметку не видят);
+    срок у всех записей одинаковый,
+    поэтому порядок вставки совпадает с порядком истечения
+    и устаревшие записи снимаются с начала.
+    """
+
+    def __init__(self, window: float, max_size: int = 100_000) -> None:
+        self.window = window
+        self.max_size = max_size
+        # ключ клиента → момент (monotonic), до которого читаем из основной БД
+        self._until: OrderedDict[str, float] = OrderedDict()
+
+    def mark(self, key: str) -> None:
+        """Отметка записи клиента."""
+        now = time.monotonic()
+        self._until[key] = now + self.window
+        self._until.move_to_end(key)
+        while self._until and (
+            len(self._until) > self.max_size
+            or next(iter(self._until.values())) <= now
+        ):
+            self._until.popitem(last=False)
+
+    def is_recent(self, key: str) -> bool:
+        """Писал ли клиент в пределах окна."""
+        until = self._until.get(key)
+        return until is not None and until > time.monotonic()
+
+
+# Глобальные реплики и журнал записей (singleton)
+replicas = ReplicaSet(
+    settings.DATABASE_REPLICA_URLS, settings.DATABASE_REPLICA_EJECT_SECONDS
 )
+recent_writers = RecentWriters(settings.DATABASE_READ_YOUR_WRITES_SECONDS)
+
+
+def _client_key(request: Request) -> str:
+    """
+    Ключ клиента для read-your-writes.
+
+    Subject (sub) из Bearer токена — один и тот же до и после refresh
+    токена. Проверка идёт через кеш токенов, поэтому get_current_user
+    того же запроса не проверяет подпись повторно. Для анонимных
+    запросов и невалидных токенов — адрес клиента.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = decode_token_cached(token).get("sub")
+        except TokenError:
+            subject = None
+        if subject:
+            return f"sub:{subject}"
+    return f"addr:{request.client.host}" if request.client else ""
+
+
+def _mark_write(session: Session) -> None:
+    """
+    Отметка записи в сессии.
+
+    Raises:
+        InvalidRequestError: Сессия только для чтения — в AUTOCOMMIT
+            запись зафиксировалась бы сразу, без возможности отката.
+    """
+    if session.info.get("read_only"):
+        raise InvalidRequestError("Запись в сессии только для чтения")
+    session.info["has_writes"] = True
+
+
+# Отмечаем сессии, которые что-то записывают: flush единицы работы
+# или ORM INSERT/UPDATE/DELETE через session.execute
+@event.listens_for(Session, "before_flush")
+def _mark_flush(session: Session, flush_context, instances) -> None:
+    _mark_write(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        _mark_write(orm_execute_state.session)
 
 
 class Base(DeclarativeBase):
@@ -51,11 +307,13 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency: генератор асинхронной DB сессии для FastAPI.
 
-    Создаёт сессию, передаёт её в endpoint, затем фиксирует или откатывает.
+    Создаёт сессию основной БД, передаёт её в endpoint, затем фиксирует
+    или откатывает. Если сессия что-то записала, клиент на время окна
+    read-your-writes читает из основной БД.
 
     Yields:
         AsyncSession: Асинхронная сессия SQLAlchemy.
@@ -70,6 +328,12 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
             # Если всё успешно — коммитим транзакцию
             await session.commit()
+            if session.info.pop("has_writes", False):
+                recent_writers.mark(_client_key(request))
+            # Сбрасываем кеш изменённых пользователей во всех воркерах
+            stale = session.info.pop("stale_principals", None)
+            if stale:
+                await principal_cache.invalidate_everywhere(stale)
         except Exception:
             # При ошибке — откатываем транзакцию
             await session.rollback()
@@ -77,6 +341,97 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def _connect_replica(read_only: bool) -> tuple[int, AsyncSession] | None:
+    """
+    Сессия следующей исправной реплики с уже взятым соединением.
+
+    Реплика, не отдавшая соединение, исключается и пробуется следующая.
+
+    Args:
+        read_only: Сессия в AUTOCOMMIT (без транзакции).
+
+    Returns:
+        tuple | None: (индекс реплики, сессия) или None — реплик нет
+            или все исключены.
+    """
+    for index in replicas.candidates():
+        session = replicas.session(index, read_only=read_only)
+        try:
+            # Соединение берём сразу (с pre-ping), чтобы при сбое
+            # реплики успеть перейти на следующую
+            await session.connection()
+        except (DBAPIError, OSError):
+            await session.close()
+            replicas.eject(index)
+            continue
+        return index, session
+    return None
+
+
+@asynccontextmanager
+async def _replica_session(
+    index: int, session: AsyncSession
+) -> AsyncGenerator[AsyncSession, None]:
+    """Использование сессии реплики: разорванное соединение исключает реплику."""
+    try:
+        yield session
+    except DBAPIError as exc:
+        if exc.connection_invalidated:
+            replicas.eject(index)
+        raise
+    finally:
+        await session.close()
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency: сессия для маршрутов только на чтение.
+
+    Берёт следующую исправную реплику; реплика, не отдавшая соединение,
+    исключается и пробуется следующая. Без реплик, когда все исключены
+    или клиент недавно писал — сессия основной БД.
+
+    Сессия работает в AUTOCOMMIT: ни BEGIN, ни COMMIT/ROLLBACK
+    вокруг запросов не выполняются.
+
+    Yields:
+        AsyncSession: Асинхронная сессия SQLAlchemy.
+    """
+    if not recent_writers.is_recent(_client_key(request)):
+        replica = await _connect_replica(read_only=True)
+        if replica is not None:
+            async with _replica_session(*replica) as session:
+                yield session
+            return
+
+    async with read_only_session_factory() as session:
+        yield session
+
+
+@asynccontextmanager
+async def read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия для фоновых чтений вне запроса (экспорт и т.п.).
+
+    Реплика выбирается так же, как в get_read_session (с исключением
+    неисправных), но без read-your-writes; без реплик — основная БД.
+    Сессия транзакционная: серверному курсору выгрузки нужна транзакция.
+
+    Yields:
+        AsyncSession: Асинхронная сессия SQLAlchemy.
+    """
+    replica = await _connect_replica(read_only=False)
+    if replica is not None:
+        async with _replica_session(*replica) as session:
+            yield session
+        return
+
+    async with async_session_factory() as session:
+        yield session
+
+
 # Annotated сокращение для dependency injection в типах
 # Использование: session: DBSession в параметрах endpoint
 DBSession = Annotated[AsyncSession, Depends(get_session)]
+# Использование: session: ReadDBSession в маршрутах только на чтение
+ReadDBSession = Annotated[AsyncSession, Depends(get_read_session)]
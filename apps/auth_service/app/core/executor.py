@@ -0,0 +1,102 @@
+"""
+Модуль ограниченного пула потоков для CPU-тяжёлых синхронных вызовов.
+
+Используется, чтобы bcrypt и подобные операции не блокировали event loop.
+Число одновременных задач ограничено, а глубина очереди и задержки
+доступны как метрики.
+"""
+
+# Импорты для асинхронной работы
+import asyncio
+# Импорты для измерения времени
+import time
+# Импорты для пула потоков
+from concurrent.futures import ThreadPoolExecutor
+# Импорты для типизации
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Пул потоков с ограничением параллелизма и метриками.
+
+    Задачи сверх лимита ждут на семафоре в event loop — так видна
+    глубина очереди. Счётчики меняются только из потока event loop,
+    поэтому блокировки не нужны.
+    """
+
+    def __init__(self, max_concurrency: int, name: str) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix=name,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Метрики
+        self._waiting = 0
+        self._running = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Выполнение синхронной функции в пуле.
+
+        Args:
+            fn: Синхронная функция.
+            *args: Аргументы функции.
+
+        Returns:
+            T: Результат функции.
+        """
+        enqueued = time.perf_counter()
+        # Ожидаем свободный слот (глубина очереди = _waiting)
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        started = time.perf_counter()
+        self._running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            finished = time.perf_counter()
+            self._running -= 1
+            self._semaphore.release()
+            # Обновляем метрики задержек
+            wait = started - enqueued
+            self._completed += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._run_total += finished - started
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Метрики пула для мониторинга.
+
+        Returns:
+            dict: Лимит, занятые слоты, глубина очереди и задержки (мс).
+        """
+        completed = self._completed
+        return {
+            "max_concurrency": self.max_concurrency,
+            "running": self._running,
+            "queue_depth": self._waiting,
+            "completed": completed,
+            "avg_wait_ms": self._wait_total / completed * 1000 if completed else 0.0,
+            "max_wait_ms": self._wait_max * 1000,
+            "avg_run_ms": self._run_total / completed * 1000 if completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        """Остановка пула (ожидающие задачи отменяются)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,58 @@
+"""
+Модуль фоновых задач обслуживания.
+
+Задачи запускаются из lifespan приложения и работают до его остановки.
+Ошибка одного прогона логируется и не останавливает следующие.
+"""
+
+# Импорты для асинхронной работы
+import asyncio
+# Импорты для работы с логированием
+import logging
+# Импорты для типизации
+from collections.abc import Awaitable, Callable
+
+# Импорты фабрики сессий основной БД
+from backend.src.app.core.database import async_session_factory
+# Импорты репозитория счётчиков задач
+from backend.src.app.repositories.task import TaskStatsRepository
+
+logger = logging.getLogger("task_manager.jobs")
+
+
+async def reconcile_task_stats() -> None:
+    """
+    Сверка счётчиков task_stats с пересчётом GROUP BY по задачам.
+
+    Расхождения исправляются и пишутся в лог. Сверку выполняет один
+    экземпляр приложения за раз: остальные пропускают прогон.
+    """
+    async with async_session_factory() as session:
+        drift = await TaskStatsRepository(session).reconcile()
+        await session.commit()
+    if drift is None:
+        logger.debug("task_stats reconcile skipped: another instance is running it")
+    elif drift:
+        logger.warning(
+            "task_stats drift corrected: %s",
+            {f"{status}/{assignee_id}": delta
+             for (status, assignee_id), delta in drift.items()},
+        )
+
+
+async def run_periodically(
+    interval: float, job: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Выполнение job сразу и затем каждые interval секунд.
+
+    Args:
+        interval: Пауза между прогонами (секунды).
+        job: Асинхронная задача без аргументов.
+    """
+    while True:
+        try:
+            await job()
+        except Exception:
+            logger.exception("Periodic job %s failed", job.__name__)
+        await asyncio.sleep(interval)
@@ -0,0 +1,250 @@
+"""
+Модуль кольца ключей JWT (keyring) с горячей перезагрузкой.
+
+Ключи читаются с диска и разбираются один раз на процесс.
+Файл перечитывается только при изменении его mtime/inode.
+Несколько публичных ключей различаются по заголовку `kid`,
+что позволяет ротировать ключи без перезапуска сервиса.
+О замене или удалении файла ключа кольцо сообщает через `on_change`
+(приложение сбрасывает кеш проверенных токенов).
+"""
+
+# Импорты для работы с файловой системой
+import os
+# Импорты для блокировок (ключи читаются из разных потоков)
+import threading
+# Импорты для монотонного времени
+import time
+# Импорты для типизации
+from collections.abc import Callable
+from typing import Any
+# Импорты для неизменяемых контейнеров
+from dataclasses import dataclass
+# Импорты для работы с путями
+from pathlib import Path
+
+# Импорты настроек приложения
+from backend.src.app.core.config import settings
+# Импорты бэкендов JWT (разбор ключей)
+from backend.shared.security import JWTBackend, TokenError
+
+
+# ── Helpers (Вспомогательные функции) ────────────────────────────────────────
+
+def _stat_key(path: Path) -> os.stat_result:
+    """
+    Получение метаданных файла ключа.
+
+    Args:
+        path: Путь к файлу с ключом.
+
+    Returns:
+        os.stat_result: Метаданные файла.
+
+    Raises:
+        FileNotFoundError: Если файл ключа не найден.
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        raise _missing_key(path) from None
+
+
+def _missing_key(path: Path) -> FileNotFoundError:
+    return FileNotFoundError(
+        f"JWT ключ не найден в {path}. "
+        "Запустите `python scripts/generate_keys.py` для генерации."
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _LoadedKey:
+    """Разобранный ключ и отпечаток файла, из которого он прочитан."""
+
+    key: Any
+    stamp: tuple[int, int, int]  # (st_dev, st_ino, st_mtime_ns)
+
+
+class _KeyFile:
+    """
+    Один файл ключа с кешем разобранного значения.
+
+    Проверяет отпечаток файла не чаще, чем раз в `check_interval` секунд,
+    и перечитывает ключ только если отпечаток изменился. Замена
+    загруженного ключа или пропажа его файла вызывает `on_change`.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        parse: Callable[[str], Any],
+        check_interval: float,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        self.path = path
+        self.parse = parse
+        self.check_interval = check_interval
+        self.on_change = on_change
+        self._loaded: _LoadedKey | None = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """
+        Получение разобранного ключа.
+
+        Returns:
+            Any: Ключ бэкенда JWT, готовый к подписи/проверке.
+
+        Raises:
+            FileNotFoundError: Если файл ключа не найден.
+        """
+        # Быстрый путь: ключ загружен и время проверки не наступило
+        loaded = self._loaded
+        if loaded is not None and time.monotonic() < self._next_check:
+            return loaded.key
+
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_check:
+                if self._loaded is None:
+                    # Файла не было на прошлой проверке: без повторного stat
+                    raise _missing_key(self.path)
+                return self._loaded.key
+            previous = self._loaded
+            try:
+                # Сначала stat, затем чтение: подмена файла между ними
+                # приведёт лишь к лишней перезагрузке на следующей проверке
+                st = _stat_key(self.path)
+            except FileNotFoundError:
+                # Ключ удалён: токены, проверенные им, больше не доверенные
+                self._loaded = None
+                self._next_check = now + self.check_interval
+                if previous is not None:
+                    self._changed()
+                raise
+            stamp = (st.st_dev, st.st_ino, st.st_mtime_ns)
+            if previous is None or previous.stamp != stamp:
+                key = self.parse(self.path.read_text())
+                self._loaded = _LoadedKey(key=key, stamp=stamp)
+                if previous is not None:
+                    self._changed()
+            self._next_check = now + self.check_interval
+            return self._loaded.key
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
+
+
+# ── KeyRing (Кольцо ключей) ──────────────────────────────────────────────────
+
+class KeyRing:
+    """
+    Набор ключей подписи и проверки JWT.
+
+    Подписывает активным приватным ключом (`signing_kid`),
+    проверяет публичным ключом, выбранным по заголовку `kid` токена.
+    """
+
+    def __init__(
+        self,
+        backend: JWTBackend,
+        algorithm: str,
+        signing_kid: str,
+        private_key_path: Path,
+        public_key_paths: dict[str, Path],
+        check_interval: float,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        self.algorithm = algorithm
+        self.signing_kid = signing_kid
+        self._private = _KeyFile(
+            private_key_path,
+            lambda pem: backend.load_private_key(pem, algorithm),
+            check_interval,
+            on_change,
+        )
+        self._public = {
+            kid: _KeyFile(
+                path,
+                lambda pem: backend.load_public_key(pem, algorithm),
+                check_interval,
+                on_change,
+            )
+            for kid, path in public_key_paths.items()
+        }
+
+    def signing_key(self) -> tuple[str, Any]:
+        """
+        Активный ключ подписи.
+
+        Returns:
+            tuple[str, Any]: Идентификатор ключа (kid) и приватный ключ.
+        """
+        return self.signing_kid, self._private.get()
+
+    def verification_key(self, kid: str | None) -> Any:
+        """
+        Публичный ключ для проверки подписи.
+
+        Args:
+            kid: Идентификатор ключа из заголовка токена
+                (None — токен выпущен до ротации, берём активный ключ).
+
+        Returns:
+            Any: Публичный ключ.
+
+        Raises:
+            TokenError: Если ключ с таким kid неизвестен.
+        """
+        key_file = self._public.get(kid or self.signing_kid)
+        if key_file is None:
+            raise TokenError(f"Неизвестный идентификатор ключа: {kid}")
+        return key_file.get()
+
+    def refresh(self) -> None:
+        """
+        Проверка файлов всех ключей (каждый не чаще `check_interval`).
+
+        Ключи, которые давно не запрашивались (токены из кеша проверенных
+        не доходят до verification_key), тоже замечают ротацию и удаление.
+        Пропавшие файлы здесь не ошибка: они сообщаются через `on_change`.
+        """
+        for key_file in (self._private, *self._public.values()):
+            try:
+                key_file.get()
+            except FileNotFoundError:
+                pass
+
+
+def build_keyring(
+    backend: JWTBackend,
+    on_change: Callable[[], None] | None = None,
+) -> KeyRing:
+    """
+    Создание кольца ключей из настроек приложения.
+
+    Файлы не читаются при создании — только при первом обращении.
+
+    Args:
+        backend: Бэкенд JWT, которым разбираются ключи.
+        on_change: Вызывается при замене или удалении файла ключа.
+
+    Returns:
+        KeyRing: Кольцо ключей.
+    """
+    public_key_paths = {
+        **settings.JWT_VERIFICATION_KEYS,
+        settings.JWT_KEY_ID: settings.JWT_PUBLIC_KEY_PATH,
+    }
+    return KeyRing(
+        backend=backend,
+        algorithm=settings.JWT_ALGORITHM,
+        signing_kid=settings.JWT_KEY_ID,
+        private_key_path=settings.JWT_PRIVATE_KEY_PATH,
+        public_key_paths=public_key_paths,
+        check_interval=settings.JWT_KEY_RELOAD_INTERVAL_SECONDS,
+        on_change=on_change,
+    )
+
@@ -0,0 +1,22 @@
+"""
+CLI калибровки стоимости хеширования паролей.
+
+Сама калибровка — backend.shared.security.password_calibration;
+здесь она запускается с параметрами памяти из настроек приложения:
+
+    python -m backend.src.app.core.password_calibration --target-ms 250
+"""
+
+# Импорты общей калибровки
+from backend.shared.security.password_calibration import cli
+
+
+def main() -> None:
+    """Точка входа CLI: печатает параметры в формате .env."""
+    from backend.src.app.core.config import settings
+
+    cli(settings.ARGON2_MEMORY_COST, settings.ARGON2_PARALLELISM)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Модуль аутентифицированного субъекта (principal).
+
+Для авторизации запроса нужны только id, email, роль и флаг активности,
+поэтому вместо ORM модели User зависимости получают лёгкий
+неизменяемый снимок этих полей — без связей и без привязки к сессии.
+"""
+
+# Импорты для генерации UUID
+import uuid
+# Импорты для неизменяемых контейнеров
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Снимок пользователя, достаточный для авторизации.
+
+    Attributes:
+        id: Идентификатор пользователя.
+        email: Email (subject токена).
+        role: Роль пользователя (USER, ADMIN, etc.).
+        is_active: Активен ли пользователь.
+    """
+
+    id: uuid.UUID
+    email: str
+    role: str
+    is_active: bool
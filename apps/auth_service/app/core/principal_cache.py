@@ -0,0 +1,281 @@
+"""
+Модуль кеша аутентифицированных субъектов (principal).
+
+После проверки токена get_current_user больше не ходит в БД на каждый
+запрос: снимок Principal кешируется по subject (email) с ограниченным TTL.
+Изменения пользователя сбрасывают запись синхронно в этом воркере,
+а через канал инвалидации (опционально) — и в остальных воркерах.
+
+Каналы инвалидации (PRINCIPAL_INVALIDATION_BACKEND):
+- "none"  — только локальный сброс (TTL ограничивает рассинхронизацию)
+- "local" — шина в памяти процесса (замена брокера в тестах)
+- "redis" — Redis pub/sub по REDIS_URL
+"""
+
+# Импорты для асинхронной работы
+import asyncio
+# Импорты для работы с логированием
+import logging
+# Импорты для блокировок (кеш используется из нескольких потоков)
+import threading
+# Импорты для работы со временем
+import time
+# Импорты для LRU порядка записей
+from collections import OrderedDict
+# Импорты для типизации
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Protocol
+
+# Импорты настроек приложения
+from backend.src.app.core.config import settings
+# Импорты снимка пользователя
+from backend.src.app.core.principal import Principal
+
+logger = logging.getLogger("task_manager.principal_cache")
+
+# Обработчик сообщения инвалидации: получает subject
+InvalidationHandler = Callable[[str], Awaitable[None] | None]
+
+
+# ── Invalidation channels (Каналы инвалидации) ───────────────────────────────
+
+class InvalidationChannel(Protocol):
+    """Канал рассылки инвалидаций между воркерами."""
+
+    async def publish(self, subject: str) -> None:
+        """Отправка subject всем подписчикам."""
+        ...
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        """Подписка: handler вызывается на каждое сообщение."""
+        ...
+
+    async def stop(self) -> None:
+        """Отписка и освобождение ресурсов."""
+        ...
+
+
+class LocalInvalidationChannel:
+    """
+    Шина в памяти процесса.
+
+    Доставляет сообщения всем подписанным кешам этого процесса —
+    используется как замена брокера в тестах.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: list[InvalidationHandler] = []
+
+    async def publish(self, subject: str) -> None:
+        for handler in list(self._handlers):
+            result = handler(subject)
+            if result is not None:
+                await result
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        self._handlers.append(handler)
+
+    async def stop(self) -> None:
+        self._handlers.clear()
+
+
+class RedisInvalidationChannel:
+    """Redis pub/sub (требуется пакет redis)."""
+
+    def __init__(self, url: str, channel: str) -> None:
+        from redis import asyncio as aioredis
+
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._channel = channel
+        self._listener: asyncio.Task | None = None
+
+    async def publish(self, subject: str) -> None:
+        await self._redis.publish(self._channel, subject)
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self._channel)
+        self._listener = asyncio.create_task(self._listen(pubsub, handler))
+
+    async def _listen(self, pubsub: Any, handler: InvalidationHandler) -> None:
+        async for message in pubsub.listen():
+            # Ошибка одного сообщения не должна останавливать подписку:
+            # иначе воркер молча перестаёт получать инвалидации
+            try:
+                result = handler(message["data"])
+                if result is not None:
+                    await result
+            except Exception:
+                logger.exception(
+                    "Principal invalidation for %r failed", message.get("data")
+                )
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._redis.aclose()
+
+
+def build_invalidation_channel(backend: str) -> InvalidationChannel | None:
+    """
+    Создание канала инвалидации по имени из настроек.
+
+    Args:
+        backend: "none", "local" или "redis".
+
+    Returns:
+        InvalidationChannel | None: Канал или None для "none".
+
+    Raises:
+        ValueError: Если имя канала неизвестно.
+    """
+    if backend == "none":
+        return None
+    if backend == "local":
+        return LocalInvalidationChannel()
+    if backend == "redis":
+        return RedisInvalidationChannel(
+            settings.REDIS_URL, settings.PRINCIPAL_INVALIDATION_CHANNEL
+        )
+    raise ValueError(
+        f"Неизвестный канал инвалидации '{backend}'. "
+        "Допустимы: none, local, redis"
+    )
+
+
+# ── PrincipalCache (Кеш субъектов) ───────────────────────────────────────────
+
+class PrincipalCache:
+    """
+    Потокобезопасный LRU кеш снимков Principal с TTL.
+
+    Attributes:
+        max_size: Максимальное число записей (0 — кеш выключен).
+        ttl: Время жизни записи (секунды).
+        hits: Число попаданий.
+        misses: Число промахов.
+        invalidations: Число сброшенных записей.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        channel: InvalidationChannel | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.channel = channel
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # subject → (момент истечения по monotonic, снимок)
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, subject: str) -> Principal | None:
+        """
+        Получение снимка по subject.
+
+        Args:
+            subject: Subject токена (email).
+
+        Returns:
+            Principal | None: Снимок или None при промахе/истечении.
+        """
+        if self.max_size <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or entry[0] <= now:
+                self._entries.pop(subject, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, subject: str, principal: Principal) -> None:
+        """
+        Сохранение снимка.
+
+        Args:
+            subject: Subject токена (email).
+            principal: Снимок пользователя.
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, subject: str) -> None:
+        """
+        Синхронный сброс записи в этом воркере.
+
+        Args:
+            subject: Subject токена (email).
+        """
+        with self._lock:
+            if self._entries.pop(subject, None) is not None:
+                self.invalidations += 1
+
+    async def invalidate_everywhere(self, subjects: Iterable[str]) -> None:
+        """
+        Сброс записей локально и рассылка в остальные воркеры.
+
+        Args:
+            subjects: Subjects изменённых пользователей.
+        """
+        for subject in subjects:
+            self.invalidate(subject)
+            if self.channel is not None:
+                await self.channel.publish(subject)
+
+    async def start(self) -> None:
+        """Подписка на канал инвалидации (если настроен)."""
+        if self.channel is not None:
+            await self.channel.start(self.invalidate)
+
+    async def stop(self) -> None:
+        """Отписка от канала инвалидации."""
+        if self.channel is not None:
+            await self.channel.stop()
+
+    def clear(self) -> None:
+        """Удаление всех записей."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Счётчики кеша для мониторинга.
+
+        Returns:
+            dict: Размер, попадания, промахи, сбросы и доля попаданий.
+        """
+        with self._lock:
+            size = len(self._entries)
+            hits, misses = self.hits, self.misses
+            invalidations = self.invalidations
+        total = hits + misses
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "hits": hits,
+            "misses": misses,
+            "invalidations": invalidations,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+
+# Глобальный кеш субъектов (singleton)
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    channel=build_invalidation_channel(settings.PRINCIPAL_INVALIDATION_BACKEND),
+)
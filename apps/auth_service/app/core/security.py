@@ -1,42 +1,86 @@
 """
 Модуль хеширования паролей и кодирования/декодирования JWT.
 
-Использует bcrypt для паролей и RS256 асимметричные JWT токены.
+Использует passlib (argon2, устаревшие bcrypt хеши перехешируются при входе)
+для паролей и асимметричные JWT токены (RS256/ES256/EdDSA)
+через бэкенд, выбранный настройкой JWT_BACKEND.
 Предоставляет access токены (короткоживущие) и refresh токены (долгоживущие).
 """
 
 # Импорты для работы со временем
 from datetime import datetime, timedelta, timezone
-# Импорты для работы с путями
-from pathlib import Path
 
-# Импорты для bcrypt хеширования
-import bcrypt
-# Импорты для JWT работы
-from jose import JWTError, jwt
+# Импорты контекста хеширования паролей
+from passlib.context import CryptContext
 
 # Импорты настроек приложения
 from backend.src.app.core.config import settings
 # Импорты констант типов токенов
 from backend.src.app.core.constants import TokenType
+# Импорты ограниченного пула потоков
+from backend.src.app.core.executor import BoundedExecutor
+# Импорты бэкендов JWT, общей ошибки токена и параметров хеширования
+from backend.shared.security import HashParams, TokenError, get_jwt_backend
+# Импорты кольца ключей JWT
+from backend.src.app.core.keyring import build_keyring
+# Импорты кеша проверенных токенов
+from backend.src.app.core.token_cache import token_cache
+
+
+# Бэкенд JWT, выбранный в настройках
+jwt_backend = get_jwt_backend(settings.JWT_BACKEND)
+# Кольцо ключей процесса (singleton): ключи разбираются выбранным бэкендом.
+# Замена или удаление ключа сбрасывает кеш проверенных им токенов
+keyring = build_keyring(jwt_backend, on_change=token_cache.clear)
+# Пул потоков для хеширования: не блокирует event loop
+password_executor = BoundedExecutor(
+    settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    name="password-hash",
+)
+# Контекст хеширования: первая схема — основная, остальные устаревшие
+pwd_context = CryptContext(
+    schemes=settings.PASSWORD_SCHEMES,
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    # Хеши с меньшим time_cost считаются устаревшими
+    argon2__min_rounds=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 # ── Password (Пароли) ────────────────────────────────────────────────────────
 
+def configure_password_hashing(params: HashParams) -> None:
+    """
+    Применение параметров стоимости (например, после калибровки).
+
+    Хеши со старыми параметрами будут перехешированы при следующем входе.
+
+    Args:
+        params: Параметры стоимости хеширования.
+    """
+    pwd_context.update(
+        argon2__time_cost=params.argon2_time_cost,
+        argon2__min_rounds=params.argon2_time_cost,
+        argon2__memory_cost=params.argon2_memory_cost,
+        argon2__parallelism=params.argon2_parallelism,
+        bcrypt__rounds=params.bcrypt_rounds,
+    )
+
+
 def hash_password(plain: str) -> str:
     """
-    Хеширование пароля алгоритмом bcrypt.
+    Хеширование пароля основной схемой контекста.
 
     Args:
         plain: Исходный пароль в открытом виде.
 
     Returns:
-        str: Хешированный пароль (UTF-8 строка).
+        str: Хешированный пароль (строка с параметрами схемы).
     """
-    # Создаём хеш пароля с солью
-    hashed = bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt())
-    # Преобразуем байты в строку для хранения в БД
-    return hashed.decode("utf-8")
+    return pwd_context.hash(plain)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -51,32 +95,88 @@ def verify_password(plain: str, hashed: str) -> bool:
         bool: True если пароль совпадает с хешем.
     """
     # Сравниваем введённый пароль с хешем
-    return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+    return pwd_context.verify(plain, hashed)
 
 
-# ── Helpers (Вспомогательные функции) ────────────────────────────────────────
+def verify_and_update_password(plain: str, hashed: str) -> tuple[bool, str | None]:
+    """
+    Проверка пароля с перехешированием устаревшего хеша.
+
+    Args:
+        plain: Пароль в открытом виде для проверки.
+        hashed: Хешированный пароль из базы данных.
 
-def _read_key(path: Path) -> str:
+    Returns:
+        tuple[bool, str | None]: Совпал ли пароль и новый хеш, если старый
+            устарел (другая схема или параметры), иначе None.
     """
-    Чтение ключа JWT из файла.
+    return pwd_context.verify_and_update(plain, hashed)
+
+
+async def hash_password_async(plain: str) -> str:
+    """
+    Хеширование пароля в пуле потоков (не блокирует event loop).
 
     Args:
-        path: Путь к файлу с ключом.
+        plain: Исходный пароль в открытом виде.
 
     Returns:
-        str: Содержимое файла ключа.
+        str: Хешированный пароль (UTF-8 строка).
+    """
+    return await password_executor.run(hash_password, plain)
 
-    Raises:
-        FileNotFoundError: Если файл ключа не найден.
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """
+    Проверка пароля в пуле потоков (не блокирует event loop).
+
+    Args:
+        plain: Пароль в открытом виде для проверки.
+        hashed: Хешированный пароль из базы данных.
+
+    Returns:
+        bool: True если пароль совпадает с хешем.
+    """
+    return await password_executor.run(verify_password, plain, hashed)
+
+
+async def verify_and_update_password_async(
+    plain: str,
+    hashed: str,
+) -> tuple[bool, str | None]:
+    """
+    Проверка пароля с перехешированием в пуле потоков.
+
+    Args:
+        plain: Пароль в открытом виде для проверки.
+        hashed: Хешированный пароль из базы данных.
+
+    Returns:
+        tuple[bool, str | None]: Совпал ли пароль и новый хеш (или None).
     """
-    # Проверяем существование файла
-    if not path.exists():
-        raise FileNotFoundError(
-            f"JWT ключ не найден в {path}. "
-            "Запустите `python scripts/generate_keys.py` для генерации."
-        )
-    # Читаем содержимое файла
-    return path.read_text()
+    return await password_executor.run(verify_and_update_password, plain, hashed)
+
+
+# ── Helpers (Вспомогательные функции) ────────────────────────────────────────
+
+def _encode(payload: dict) -> str:
+    """
+    Подпись полезной нагрузки активным ключом из кольца ключей.
+
+    Args:
+        payload: Полезная нагрузка токена.
+
+    Returns:
+        str: Подписанный JWT токен с заголовком `kid`.
+    """
+    # Берём уже разобранный ключ — без чтения файла и парсинга PEM
+    kid, key = keyring.signing_key()
+    return jwt_backend.encode(
+        payload,
+        key,
+        algorithm=settings.JWT_ALGORITHM,
+        headers={"kid": kid},  # По kid проверяющая сторона выберет ключ
+    )
 
 
 # ── JWT (JSON Web Tokens) ────────────────────────────────────────────────────
@@ -102,7 +202,7 @@ def create_access_token(subject: str) -> str:
         "exp": now + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
     }
     # Кодируем и подписываем токен приватным ключом
-    return jwt.encode(payload, _read_key(settings.JWT_PRIVATE_KEY_PATH), algorithm=settings.JWT_ALGORITHM)
+    return _encode(payload)
 
 
 def create_refresh_token(subject: str) -> str:
@@ -126,7 +226,7 @@ def create_refresh_token(subject: str) -> str:
         "exp": now + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS),
     }
     # Кодируем и подписываем токен приватным ключом
-    return jwt.encode(payload, _read_key(settings.JWT_PRIVATE_KEY_PATH), algorithm=settings.JWT_ALGORITHM)
+    return _encode(payload)
 
 
 def decode_token(token: str) -> dict:
@@ -140,11 +240,35 @@ def decode_token(token: str) -> dict:
         dict: Расшифрованная полезная нагрузка токена.
 
     Raises:
-        jose.JWTError: Если токен невалидный или истёк.
+        TokenError: Если токен невалидный или истёк.
     """
+    # Выбираем публичный ключ по kid из (ещё не проверенного) заголовка
+    kid = jwt_backend.get_unverified_header(token).get("kid")
     # Декодируем токен с использованием публичного ключа
-    return jwt.decode(
+    return jwt_backend.decode(
         token,
-        _read_key(settings.JWT_PUBLIC_KEY_PATH),  # Публичный ключ для проверки
+        keyring.verification_key(kid),  # Публичный ключ для проверки
         algorithms=[settings.JWT_ALGORITHM],  # Разрешённые алгоритмы
     )
+
+
+def decode_token_cached(token: str) -> dict:
+    """
+    Декодирование токена с кешем результатов проверки подписи.
+
+    Повторный токен возвращается из кеша без проверки RS256 подписи.
+    Запись кеша истекает не позже `exp` токена. Перед кешем кольцо
+    ключей сверяет файлы ключей: после ротации или удаления ключа кеш
+    сброшен, и токен проверяется заново.
+
+    Args:
+        token: JWT токен для декодирования.
+
+    Returns:
+        dict: Расшифрованная полезная нагрузка токена.
+
+    Raises:
+        TokenError: Если токен невалидный или истёк.
+    """
+    keyring.refresh()
+    return token_cache.get_or_decode(token, decode_token)
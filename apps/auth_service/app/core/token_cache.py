@@ -0,0 +1,16 @@
+"""
+Модуль кеша проверенных JWT токенов.
+
+Экземпляр кеша приложения; сам кеш — backend.shared.security.token_cache.
+"""
+
+# Импорты настроек приложения
+from backend.src.app.core.config import settings
+# Импорты общего кеша проверенных токенов
+from backend.shared.security import VerifiedTokenCache
+
+# Глобальный кеш проверенных access токенов (singleton)
+token_cache = VerifiedTokenCache(
+    max_size=settings.JWT_TOKEN_CACHE_SIZE,
+    max_ttl=settings.JWT_TOKEN_CACHE_TTL_SECONDS,
+)
@@ -1,6 +1,6 @@
 from backend.src.app.models.base import BaseModel
 from backend.src.app.models.user import User
-from backend.src.app.models.task import Task
+from backend.src.app.models.task import Task, TaskStat
 from backend.src.app.models.token import RefreshToken
 
-__all__ = ["BaseModel", "User", "Task", "RefreshToken"]
+__all__ = ["BaseModel", "User", "Task", "TaskStat", "RefreshToken"]
@@ -1,45 +1,84 @@
 """Abstract base model with id / created_at / updated_at."""
 
+import os
+import threading
+import time
 import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.types import TypeDecorator, CHAR
+from sqlalchemy.types import BINARY, TypeDecorator
 
 from backend.src.app.core.database import Base
 
+_uuid7_lock = threading.Lock()
+_uuid7_last = (0, 0)  # (unix ms, 12-bit sequence) of the last id
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7).
+
+    48-bit unix milliseconds, then a 12-bit sequence that counts up
+    within the same millisecond, then 62 random bits. Ids from one
+    process are strictly increasing, so inserts append to the right
+    edge of the primary key index instead of landing at random pages.
+    """
+    global _uuid7_last
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        last_ms, seq = _uuid7_last
+        if ms <= last_ms:
+            # Same millisecond (or the clock stepped back): keep counting
+            ms, seq = last_ms, seq + 1
+            if seq > 0xFFF:
+                ms, seq = ms + 1, 0
+        else:
+            # Start low in the range so the sequence rarely overflows
+            seq = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        _uuid7_last = (ms, seq)
+    rand = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=(ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand)
+
 
 class UUIDType(TypeDecorator):
-    """Cross-database UUID — native PG UUID or CHAR(36) for SQLite."""
+    """Cross-database UUID — native PG UUID, BINARY(16) elsewhere."""
 
-    impl = CHAR
+    impl = BINARY
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == "postgresql":
             from sqlalchemy.dialects.postgresql import UUID as PG_UUID
             return dialect.type_descriptor(PG_UUID(as_uuid=True))
-        return dialect.type_descriptor(CHAR(36))
+        return dialect.type_descriptor(BINARY(16))
 
     def process_bind_param(self, value, dialect):
-        if value is None:
+        # Fast path first: ids are almost always uuid.UUID already
+        if type(value) is uuid.UUID:
+            return value if dialect.name == "postgresql" else value.bytes
+        if value is None or isinstance(value, bytes):
             return value
-        if dialect.name == "postgresql":
-            return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
-        return str(value) if isinstance(value, uuid.UUID) else value
+        value = value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+        return value if dialect.name == "postgresql" else value.bytes
 
     def process_result_value(self, value, dialect):
-        if value is None:
+        if value is None or type(value) is uuid.UUID:
             return value
+        if isinstance(value, bytes):
+            return uuid.UUID(bytes=value)
         return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
 
 
 class BaseModel(Base):
     __abstract__ = True
+    # Fetch server-generated created_at/updated_at with RETURNING in the
+    # same INSERT/UPDATE, so writes don't need a follow-up refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUIDType, primary_key=True, default=uuid.uuid4, index=True
+        UUIDType, primary_key=True, default=uuid7, index=True
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -47,20 +47,22 @@ class User(BaseModel):
     )
 
     # ── Relationships (Связи с другими таблицами) ─────────────────────────────
+    # Коллекции задач не загружаются неявно: eager loading включается
+    # явно в запросе (WITH_TASKS в UserRepository), иначе доступ — ошибка
 
     # Связь: Задачи назначенные пользователю (Many-to-One)
     assigned_tasks: Mapped[list["Task"]] = relationship(  # type: ignore[name-defined]
         "Task",  # Имя связанной модели
         foreign_keys="Task.assigned_to_id",  # Внешний ключ
         back_populates="assigned_to",  # Обратная связь
-        lazy="selectin",  # Стратегия загрузки (eager loading)
+        lazy="raise_on_sql",  # Только явная загрузка (selectinload)
     )
     # Связь: Задачи выполненные пользователем (Many-to-One)
     completed_tasks: Mapped[list["Task"]] = relationship(  # type: ignore[name-defined]
         "Task",  # Имя связанной модели
         foreign_keys="Task.completed_by_id",  # Внешний ключ
         back_populates="completed_by",  # Обратная связь
-        lazy="selectin",  # Стратегия загрузки
+        lazy="raise_on_sql",  # Только явная загрузка (selectinload)
     )
     # Связь: Refresh токены пользователя (One-to-Many, каскадное удаление)
     refresh_tokens: Mapped[list["RefreshToken"]] = relationship(  # type: ignore[name-defined]
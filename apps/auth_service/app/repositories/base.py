@@ -1,40 +1,318 @@
 """Generic async repository."""
 
+import base64
+import binascii
+import json
 import uuid
-from typing import Generic, Optional, Type, TypeVar
+from collections.abc import AsyncIterator
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Generic, Optional, Type, TypeVar
 
-from sqlalchemy import select
+from pydantic import BaseModel as Schema, TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    bindparam,
+    delete,
+    insert,
+    inspect,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
 
+from backend.src.app.exceptions.http import UnprocessableError
 from backend.src.app.models.base import BaseModel
 
 ModelT = TypeVar("ModelT", bound=BaseModel)
+SchemaT = TypeVar("SchemaT", bound=Schema)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: type[SchemaT]) -> TypeAdapter[list[SchemaT]]:
+    """One TypeAdapter per output schema, built on first use."""
+    return TypeAdapter(list[schema])
+
+
+@lru_cache(maxsize=None)
+def _select_by_id(model: type[BaseModel]) -> Select:
+    """
+    Pre-built `SELECT ... WHERE id = :entity_id`, one per model.
+
+    Reusing the statement object skips building it on every call, and
+    its cache key is memoized, so the compiled form comes straight from
+    the engine's cache.
+    """
+    return select(model).where(model.id == bindparam("entity_id"))
+
+
+@lru_cache(maxsize=None)
+def _projection(model: type[BaseModel], schema: type[Schema]) -> tuple[Any, ...]:
+    """Model columns named by the schema fields, plus the keyset key."""
+    columns = inspect(model).columns
+    names = [name for name in schema.model_fields if name in columns]
+    names += [key for key in ("created_at", "id") if key not in names]
+    return tuple(columns[name] for name in names)
+
+
+@lru_cache(maxsize=None)
+def _select_projected_by_id(model: type[BaseModel], schema: type[Schema]) -> Select:
+    """Pre-built projected `SELECT <schema columns> WHERE id = :entity_id`."""
+    return select(*_projection(model, schema)).where(
+        model.id == bindparam("entity_id")
+    )
+
+
+def encode_cursor(created_at: datetime, entity_id: uuid.UUID) -> str:
+    """Opaque keyset cursor for the row a page ended on."""
+    raw = json.dumps([created_at.isoformat(), str(entity_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, entity_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(entity_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise UnprocessableError("Invalid pagination cursor")
 
 
 class BaseRepository(Generic[ModelT]):
-    """CRUD base — subclasses declare `model_class`."""
+    """
+    CRUD base — subclasses declare `model_class`.
+
+    Relationships are not loaded unless the caller passes loader
+    options (e.g. `selectinload(...)`) for that query.
+    """
 
     model_class: Type[ModelT]
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get_by_id(self, entity_id: uuid.UUID) -> Optional[ModelT]:
-        result = await self._session.execute(
-            select(self.model_class).where(self.model_class.id == entity_id)
-        )
+    async def get_by_id(
+        self, entity_id: uuid.UUID, *options: LoaderOption
+    ) -> Optional[ModelT]:
+        stmt = _select_by_id(self.model_class)
+        if options:
+            stmt = stmt.options(*options)
+        result = await self._session.execute(stmt, {"entity_id": entity_id})
         return result.scalar_one_or_none()
 
-    async def get_all(self) -> list[ModelT]:
-        result = await self._session.execute(select(self.model_class))
+    async def get_all(self, *options: LoaderOption) -> list[ModelT]:
+        result = await self._session.execute(
+            select(self.model_class).options(*options)
+        )
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        *options: LoaderOption,
+    ) -> tuple[list[ModelT], str | None]:
+        """
+        Keyset page ordered by (created_at, id), newest first.
+
+        The WHERE on the last seen key keeps the cost of a page constant
+        however deep it is. Returns the rows and the cursor of the next
+        page (None on the last page).
+        """
+        stmt = self._keyset(select(self.model_class), limit, cursor)
+        result = await self._session.execute(stmt.options(*options))
+        rows = list(result.scalars().all())
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(last.created_at, last.id)
+
+    async def get_page_projected(
+        self,
+        schema: type[SchemaT],
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[SchemaT], str | None]:
+        """
+        Keyset page read straight into `schema`, skipping the ORM.
+
+        Only the schema's columns are selected as Core rows (no identity
+        map, no relationship state) and the page is validated in one
+        TypeAdapter call.
+        """
+        stmt = self._keyset(
+            select(*_projection(self.model_class, schema)), limit, cursor
+        )
+        rows = list((await self._session.execute(stmt)).mappings().all())
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+        return _list_adapter(schema).validate_python(rows), next_cursor
+
+    async def get_by_id_projected(
+        self, schema: type[SchemaT], entity_id: uuid.UUID
+    ) -> Optional[SchemaT]:
+        """Single row read straight into `schema`, skipping the ORM."""
+        result = await self._session.execute(
+            _select_projected_by_id(self.model_class, schema),
+            {"entity_id": entity_id},
+        )
+        rows = _list_adapter(schema).validate_python(result.mappings().all())
+        return rows[0] if rows else None
+
+    def _keyset(self, stmt: Select, limit: int, cursor: str | None) -> Select:
+        """Order by (created_at, id) desc and seek past `cursor`."""
+        model = self.model_class
+        stmt = stmt.order_by(
+            model.created_at.desc(), model.id.desc()
+        ).limit(limit + 1)
+        if cursor:
+            created_at, entity_id = decode_cursor(cursor)
+            # Bind the cursor with the columns' types (UUIDType, not Uuid)
+            stmt = stmt.where(
+                tuple_(model.created_at, model.id)
+                < tuple_(
+                    created_at,
+                    entity_id,
+                    types=[model.created_at.type, model.id.type],
+                )
+            )
+        return stmt
+
+    async def stream_all(self, yield_per: int) -> AsyncIterator[ModelT]:
+        """
+        Iterate over every row with a server-side cursor.
+
+        Rows are fetched `yield_per` at a time, so memory stays flat
+        regardless of table size.
+        """
+        model = self.model_class
+        result = await self._session.stream_scalars(
+            select(model)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .execution_options(yield_per=yield_per)
+        )
+        async for instance in result:
+            yield instance
+
     async def add(self, instance: ModelT) -> ModelT:
+        # One INSERT ... RETURNING (eager_defaults on BaseModel)
         self._session.add(instance)
         await self._session.flush()
-        await self._session.refresh(instance)
         return instance
 
+    async def update_fields(self, instance: ModelT, **fields: Any) -> ModelT:
+        """
+        Set the given non-None fields and flush a single UPDATE ... RETURNING.
+
+        Fields equal to their current value are ignored; with nothing
+        left to change no statement is issued at all.
+        """
+        changed = self._apply(instance, fields)
+        if changed:
+            await self._session.flush()
+        return instance
+
+    async def update_where(
+        self,
+        entity_id: uuid.UUID,
+        *conditions: ColumnElement[bool],
+        **values: Any,
+    ) -> Optional[ModelT]:
+        """
+        Conditional update in one statement:
+        UPDATE ... WHERE id = :id AND <conditions> RETURNING *.
+
+        The check and the write happen atomically in the database, so two
+        concurrent transitions can't both pass the same precondition.
+        Returns the updated row, or None if no row matched.
+        """
+        model = self.model_class
+        result = await self._session.execute(
+            update(model)
+            .where(model.id == entity_id, *conditions)
+            .values(**values)
+            .returning(model),
+            execution_options={"populate_existing": True},
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _apply(
+        instance: ModelT, fields: dict[str, Any], skip_none: bool = True
+    ) -> dict[str, Any]:
+        """Assign the actual changes and return them."""
+        changed = {
+            key: value
+            for key, value in fields.items()
+            if (value is not None or not skip_none)
+            and getattr(instance, key) != value
+        }
+        for key, value in changed.items():
+            setattr(instance, key, value)
+        return changed
+
     async def delete(self, instance: ModelT) -> None:
         await self._session.delete(instance)
         await self._session.flush()
+
+    # ── Bulk (set-based, one statement each) ─────────────────────────────────
+
+    async def get_many(self, entity_ids: list[uuid.UUID]) -> dict[uuid.UUID, ModelT]:
+        result = await self._session.execute(
+            select(self.model_class).where(self.model_class.id.in_(entity_ids))
+        )
+        return {instance.id: instance for instance in result.scalars()}
+
+    async def add_many(self, rows: list[dict[str, Any]]) -> list[ModelT]:
+        """Multi-row INSERT ... RETURNING; instances come back in input order."""
+        if not rows:
+            return []
+        result = await self._session.scalars(
+            insert(self.model_class).returning(
+                self.model_class, sort_by_parameter_order=True
+            ),
+            rows,
+        )
+        return list(result.all())
+
+    async def update_many_where(
+        self,
+        entity_ids: list[uuid.UUID],
+        *conditions: ColumnElement[bool],
+        **values: Any,
+    ) -> list[ModelT]:
+        """UPDATE ... WHERE id IN (...) AND <conditions> RETURNING *."""
+        if not entity_ids:
+            return []
+        model = self.model_class
+        result = await self._session.execute(
+            update(model)
+            .where(model.id.in_(entity_ids), *conditions)
+            .values(**values)
+            .returning(model),
+            execution_options={"populate_existing": True},
+        )
+        return list(result.scalars().all())
+
+    async def delete_many_where(
+        self,
+        entity_ids: list[uuid.UUID],
+        *conditions: ColumnElement[bool],
+    ) -> list[uuid.UUID]:
+        """DELETE ... WHERE id IN (...) AND <conditions> RETURNING id."""
+        if not entity_ids:
+            return []
+        model = self.model_class
+        result = await self._session.execute(
+            delete(model)
+            .where(model.id.in_(entity_ids), *conditions)
+            .returning(model.id),
+            execution_options={"synchronize_session": False},
+        )
+        return list(result.scalars().all())
@@ -2,29 +2,62 @@
 
 from typing import Optional
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
+from backend.src.app.core.principal import Principal
+from backend.src.app.core.principal_cache import principal_cache
 from backend.src.app.models.user import User
 from backend.src.app.repositories.base import BaseRepository
 
+# Opt-in eager loading of the task collections, e.g.
+# `await repo.get_by_id(user_id, *WITH_TASKS)`
+WITH_TASKS: tuple[LoaderOption, ...] = (
+    selectinload(User.assigned_tasks),
+    selectinload(User.completed_tasks),
+)
+
+# Hot lookups by email, built once and executed with {"email": ...}
+_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_PRINCIPAL_BY_EMAIL = select(
+    User.id, User.email, User.role, User.is_active
+).where(User.email == bindparam("email"))
+_ID_BY_EMAIL = select(User.id).where(User.email == bindparam("email"))
+
 
 class UserRepository(BaseRepository[User]):
     model_class = User
 
-    async def get_by_email(self, email: str) -> Optional[User]:
+    async def get_by_email(
+        self, email: str, *options: LoaderOption
+    ) -> Optional[User]:
+        stmt = _BY_EMAIL.options(*options) if options else _BY_EMAIL
+        result = await self._session.execute(stmt, {"email": email.lower()})
+        return result.scalar_one_or_none()
+
+    async def get_principal(self, email: str) -> Optional[Principal]:
+        """Load only the columns needed to authorize a request."""
         result = await self._session.execute(
-            select(User).where(User.email == email.lower())
+            _PRINCIPAL_BY_EMAIL, {"email": email.lower()}
         )
-        return result.scalar_one_or_none()
+        row = result.one_or_none()
+        return Principal(*row) if row else None
 
     async def email_exists(self, email: str) -> bool:
-        return await self.get_by_email(email) is not None
+        result = await self._session.execute(
+            _ID_BY_EMAIL, {"email": email.lower()}
+        )
+        return result.first() is not None
 
     async def update_fields(self, user: User, **fields) -> User:
-        for key, value in fields.items():
-            if value is not None:
-                setattr(user, key, value)
+        email = user.email
+        if not self._apply(user, fields):
+            return user
+        # Cached principals are dropped now and again after commit
+        # (see get_session), so a concurrent reload can't keep stale data
+        self._session.info.setdefault("stale_principals", set()).add(email)
+        principal_cache.invalidate(email)
         await self._session.flush()
-        await self._session.refresh(user)
         return user
@@ -10,14 +10,18 @@ import uuid
 from datetime import datetime, timedelta, timezone
 
 from backend.src.app.core.security import (
+    TokenError,
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    decode_token_cached,
+    hash_password_async,
+    verify_and_update_password_async,
 )
 from backend.src.app.core.config import settings
 from backend.src.app.core.constants import TokenType
+from backend.src.app.core.principal import Principal
+from backend.src.app.core.principal_cache import principal_cache
 from backend.src.app.exceptions.http import ConflictError, UnauthorizedError
 from backend.src.app.models.token import RefreshToken
 from backend.src.app.models.user import User
@@ -38,7 +42,7 @@ class AuthService:
             first_name=data.first_name,
             last_name=data.last_name,
             email=data.email,
-            password_hash=hash_password(data.password),
+            password_hash=await hash_password_async(data.password),
             role=data.role,
         )
         user = await self._users.add(user)
@@ -46,8 +50,16 @@ class AuthService:
 
     async def login(self, data: LoginRequest) -> TokenPair:
         user = await self._users.get_by_email(data.email)
-        if not user or not verify_password(data.password, user.password_hash):
+        if not user:
             raise UnauthorizedError("Invalid email or password")
+        is_valid, new_hash = await verify_and_update_password_async(
+            data.password, user.password_hash
+        )
+        if not is_valid:
+            raise UnauthorizedError("Invalid email or password")
+        if new_hash:
+            # Устаревшая схема или параметры — сохраняем свежий хеш
+            await self._users.update_fields(user, password_hash=new_hash)
         if not user.is_active:
             raise UnauthorizedError("Account is deactivated")
 
@@ -58,17 +70,16 @@ class AuthService:
 
     async def refresh(self, refresh_token: str) -> TokenPair:
         """Issue a new token pair from a valid refresh token."""
-        from jose import JWTError
         try:
             payload = decode_token(refresh_token)
-        except JWTError:
+        except TokenError:
             raise UnauthorizedError("Invalid or expired refresh token")
 
         if payload.get("type") != TokenType.REFRESH:
             raise UnauthorizedError("Token type mismatch")
 
         email: str = payload.get("sub", "")
-        user = await self._users.get_by_email(email)
+        user = await self._users.get_principal(email)
         if not user or not user.is_active:
             raise UnauthorizedError("User not found or deactivated")
 
@@ -77,19 +88,22 @@ class AuthService:
             refresh_token=create_refresh_token(user.email),
         )
 
-    async def get_current_user(self, token: str) -> User:
-        """Decode access token and return the User instance."""
-        from jose import JWTError
+    async def get_current_user(self, token: str) -> Principal:
+        """Decode access token and return the authenticated principal."""
         try:
-            payload = decode_token(token)
-        except JWTError:
+            payload = decode_token_cached(token)
+        except TokenError:
             raise UnauthorizedError("Invalid or expired token")
 
         if payload.get("type") != TokenType.ACCESS:
             raise UnauthorizedError("Token type mismatch")
 
         email: str = payload.get("sub", "")
-        user = await self._users.get_by_email(email)
-        if not user or not user.is_active:
+        principal = principal_cache.get(email)
+        if principal is None:
+            principal = await self._users.get_principal(email)
+            if principal is not None:
+                principal_cache.put(email, principal)
+        if not principal or not principal.is_active:
             raise UnauthorizedError("User not found or deactivated")
-        return user
+        return principal
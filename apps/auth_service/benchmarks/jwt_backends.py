@@ -0,0 +1,90 @@
+"""
+Бенчмарк бэкендов JWT: подписей и проверок в секунду
+
+Для каждой пары бэкенд × алгоритм (jose/pyjwt × RS256/ES256/EdDSA)
+ключи генерируются заново и разбираются один раз (load_*_key), как в
+кольце ключей, затем замеряются --iterations подписей и проверок.
+Пары, которые бэкенд не поддерживает (EdDSA в python-jose), печатаются
+как unsupported. По таблице выбираются JWT_BACKEND и JWT_ALGORITHM.
+
+Запуск вручную:
+
+    python -m backend.service_user.benchmarks.jwt_backends --iterations 2000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Tuple
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+_BACKENDS = ("jose", "pyjwt")
+_ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
+
+def _generate_pem(algorithm: str) -> Tuple[str, str]:
+    """Новая пара ключей алгоритма в PEM: (приватный, публичный)"""
+
+    if algorithm == "RS256":
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif algorithm == "ES256":
+        key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption())
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo)
+    return private_pem.decode(), public_pem.decode()
+
+
+def _ops_per_second(operation: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """ Таблица подписей/проверок в секунду """
+
+    from backend.shared.security import get_jwt_backend
+
+    parser = argparse.ArgumentParser(description="Бэкенды JWT: ops/s")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    claims = {"sub": "bench@example.com", "type": "access",
+              "iat": now, "exp": now + timedelta(minutes=30)}
+
+    print(f"iterations={args.iterations:,}")
+    print(f"{'backend':<8} {'algorithm':<10} {'sign/s':>10} {'verify/s':>10}")
+    for algorithm in _ALGORITHMS:
+        private_pem, public_pem = _generate_pem(algorithm)
+        for name in _BACKENDS:
+            backend = get_jwt_backend(name)
+            try:
+                private_key = backend.load_private_key(private_pem, algorithm)
+                public_key = backend.load_public_key(public_pem, algorithm)
+            except ValueError:
+                print(f"{name:<8} {algorithm:<10} {'unsupported':>21}")
+                continue
+
+            token = backend.encode(claims, private_key, algorithm=algorithm)
+            sign = _ops_per_second(
+                lambda: backend.encode(claims, private_key, algorithm=algorithm),
+                args.iterations)
+            verify = _ops_per_second(
+                lambda: backend.decode(token, public_key, algorithms=[algorithm]),
+                args.iterations)
+            print(f"{name:<8} {algorithm:<10} {sign:>10,.0f} {verify:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Бенчмарк ключей JWT: чтение PEM на каждый вызов против кольца ключей
+
+До кольца ключей create_access_token и decode_token на каждый вызов
+проверяли наличие файла ключа, читали его (_read_key) и заново разбирали
+PEM. Кольцо ключей (core/keyring.py) разбирает ключ один раз и только
+сверяет отпечаток файла раз в JWT_KEY_RELOAD_INTERVAL_SECONDS.
+
+Бенчмарк создаёт пару RS256 во временном каталоге и прогоняет
+--iterations подписей и проверок обоими путями. Печатает операций/с
+и ускорение.
+
+Запуск вручную:
+
+    python -m backend.service_user.benchmarks.jwt_keyring \\
+        --iterations 2000 --backend jose
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Tuple
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+_ALGORITHM = "RS256"
+_KID = "primary"
+
+
+def _write_keys(directory: Path) -> Tuple[Path, Path]:
+    """Пара RSA 2048 в PEM: (приватный, публичный)"""
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_path = directory / "private.pem"
+    public_path = directory / "public.pem"
+    private_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()))
+    public_path.write_bytes(key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo))
+    return private_path, public_path
+
+
+def _read_key(path: Path) -> str:
+    """Чтение ключа на каждый вызов — как до кольца ключей"""
+
+    if not path.exists():
+        raise FileNotFoundError(f"JWT ключ не найден в {path}")
+    return path.read_text()
+
+
+def _ops_per_second(operation: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """ Замер подписи и проверки обоими путями """
+
+    from backend.shared.security import get_jwt_backend
+    from backend.src.app.core.keyring import KeyRing
+
+    parser = argparse.ArgumentParser(description="Ключи JWT: файл против keyring")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--backend", choices=["jose", "pyjwt"], default="jose")
+    args = parser.parse_args()
+
+    backend = get_jwt_backend(args.backend)
+    now = datetime.now(timezone.utc)
+    claims = {"sub": "bench@example.com", "type": "access",
+              "iat": now, "exp": now + timedelta(minutes=30)}
+
+    with tempfile.TemporaryDirectory() as directory:
+        private_path, public_path = _write_keys(Path(directory))
+        keyring = KeyRing(
+            backend=backend,
+            algorithm=_ALGORITHM,
+            signing_kid=_KID,
+            private_key_path=private_path,
+            public_key_paths={_KID: public_path},
+            check_interval=5.0,
+        )
+
+        def encode_per_call() -> str:
+            key = backend.load_private_key(_read_key(private_path), _ALGORITHM)
+            return backend.encode(claims, key, algorithm=_ALGORITHM,
+                                  headers={"kid": _KID})
+
+        def encode_keyring() -> str:
+            kid, key = keyring.signing_key()
+            return backend.encode(claims, key, algorithm=_ALGORITHM,
+                                  headers={"kid": kid})
+
+        token = encode_keyring()
+
+        def decode_per_call() -> dict:
+            key = backend.load_public_key(_read_key(public_path), _ALGORITHM)
+            return backend.decode(token, key, algorithms=[_ALGORITHM])
+
+        def decode_keyring() -> dict:
+            kid = backend.get_unverified_header(token).get("kid")
+            return backend.decode(token, keyring.verification_key(kid),
+                                  algorithms=[_ALGORITHM])
+
+        print(f"backend={backend.name} algorithm={_ALGORITHM} "
+              f"iterations={args.iterations:,}")
+        print(f"{'operation':<8} {'per call':>12} {'keyring':>12} {'speedup':>8}")
+        for name, per_call, cached in (
+            ("encode", encode_per_call, encode_keyring),
+            ("decode", decode_per_call, decode_keyring),
+        ):
+            before = _ops_per_second(per_call, args.iterations)
+            after = _ops_per_second(cached, args.iterations)
+            print(f"{name:<8} {before:>10,.0f}/s {after:>10,.0f}/s "
+                  f"{after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
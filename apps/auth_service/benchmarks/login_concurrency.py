@@ -0,0 +1,192 @@
+"""
+Нагрузочный тест входа на одном воркере: синхронная сессия против
+AsyncSession
+
+Для каждого уровня --concurrency одновременно выполняется --logins
+входов в одном event loop — как запросы к одному воркеру uvicorn.
+Вход — работа AuthService.authenticate_and_create_tokens с БД:
+поиск пользователя по email и запись refresh токена (INSERT, COMMIT).
+Хеш пароля не считается: его замеряет password_hash_concurrency.
+
+    sync  — синхронная Session прямо в корутине, как до перехода на
+            AsyncSession: каждый запрос к БД блокирует event loop
+    async — SQLUserRepository и SQLTokenRepository на AsyncSession
+
+Печатает входов/с, p50/p99 задержки входа и наибольшую задержку
+event loop (lag): пока он заблокирован, воркер не отвечает ни на
+какие запросы, включая health. Синхронный вход не отдаёт управление
+вовсе, поэтому его lag близок ко времени всего прогона. На SQLite
+запросы не ждут сети, а запись идёт под одной блокировкой файла,
+поэтому пропускную способность и p99 AsyncSession имеет смысл
+сравнивать на PostgreSQL; lag виден и здесь.
+
+Запуск вручную (URL синхронный, асинхронный драйвер подбирается
+как в приложении):
+
+    python -m backend.service_user.benchmarks.login_concurrency \\
+        --url sqlite:///./login_bench.db --concurrency 1,8,32
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List
+
+_SEED_CHUNK = 10_000
+
+
+def _seed(engine, users: int) -> None:
+    """Дозаполнение users до нужного числа"""
+
+    from sqlalchemy import func, insert, select
+
+    from backend.service_user.src.models import User
+    from backend.shared.models.base_model import BaseModel
+
+    BaseModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        existing = conn.execute(select(func.count()).select_from(User)).scalar_one()
+    for start in range(existing, users, _SEED_CHUNK):
+        with engine.begin() as conn:
+            conn.execute(insert(User), [
+                {"id": uuid.uuid4(), "user_name": f"bench{i}",
+                 "email": f"bench{i}@example.com", "hashed_password": "x"}
+                for i in range(start, min(start + _SEED_CHUNK, users))
+            ])
+
+
+def _logins(engine, async_engine) -> Dict[str, Callable[[str], Awaitable[None]]]:
+    """Оба варианта входа: (email) -> корутина"""
+
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.service_user.src.infrastructure.database import (
+        create_session_factory)
+    from backend.service_user.src.models import RefreshToken
+    from backend.service_user.src.repositories.sql_token_repository import (
+        SQLTokenRepository, token_digest)
+    from backend.service_user.src.repositories.sql_user_repository import (
+        _BY_EMAIL, SQLUserRepository)
+    from backend.service_user.src.schemas.auth.auth_dto import (
+        RefreshTokenDataDTO)
+
+    sync_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    async_factory = create_session_factory(async_engine)
+
+    def expires_at() -> datetime:
+        return datetime.now(timezone.utc) + timedelta(days=7)
+
+    async def sync_login(email: str) -> None:
+        with sync_factory() as session:
+            user = session.scalar(_BY_EMAIL, {"email": email})
+            token = RefreshToken(user_id=user.id,
+                                 token_hash=token_digest(uuid.uuid4().hex),
+                                 expires_at=expires_at())
+            session.add(token)
+            session.commit()
+            session.refresh(token)
+
+    async def async_login(email: str) -> None:
+        async with async_factory() as session:
+            user = await SQLUserRepository(session).get_user_by_email(email)
+            await SQLTokenRepository(session).create_refresh_token(
+                RefreshTokenDataDTO(user_id=user.id, token=uuid.uuid4().hex,
+                                    expires_at=expires_at()))
+
+    return {"sync": sync_login, "async": async_login}
+
+
+async def _load(
+    login: Callable[[str], Awaitable[None]],
+    emails: List[str],
+    concurrency: int
+) -> dict:
+    """Все входы не более чем по concurrency одновременно"""
+
+    gate = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    lag = 0.0
+    running = True
+
+    async def ticker() -> None:
+        nonlocal lag
+        while running:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - started - 0.001)
+
+    async def one(email: str) -> None:
+        async with gate:
+            started = time.perf_counter()
+            await login(email)
+            latencies.append(time.perf_counter() - started)
+
+    watcher = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(one(email) for email in emails))
+    elapsed = time.perf_counter() - started
+    running = False
+    await watcher
+
+    latencies.sort()
+    return {
+        "logins_per_second": len(emails) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "lag_ms": lag * 1000,
+    }
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from backend.service_user.src.infrastructure.database import to_async_url
+
+    url = make_url(args.url)
+    engine = create_engine(url)
+    async_engine = create_async_engine(to_async_url(url))
+    _seed(engine, args.users)
+    emails = [f"bench{i % args.users}@example.com" for i in range(args.logins)]
+    logins = _logins(engine, async_engine)
+
+    print(f"users={args.users:,} logins={args.logins:,}")
+    print(f"{'conc':>5} {'session':<6} {'login/s':>8} {'p50 ms':>7} "
+          f"{'p99 ms':>7} {'lag ms':>7}")
+    try:
+        for concurrency in args.concurrency:
+            for name, login in logins.items():
+                await login(emails[0])  # прогрев: соединения и кеш компиляции
+                row = await _load(login, emails, concurrency)
+                print(f"{concurrency:>5} {name:<6} "
+                      f"{row['logins_per_second']:>8,.0f} {row['p50_ms']:>7.1f} "
+                      f"{row['p99_ms']:>7.1f} {row['lag_ms']:>7.1f}")
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+
+
+def main() -> None:
+    """ Печать таблицы результатов """
+
+    parser = argparse.ArgumentParser(
+        description="Вход на одном воркере: Session против AsyncSession")
+    parser.add_argument("--url", default="sqlite:///./login_bench.db",
+                        help="Синхронный URL БД")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(item) for item in value.split(",")],
+        default=[1, 8, 32]
+    )
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--logins", type=int, default=2_000)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
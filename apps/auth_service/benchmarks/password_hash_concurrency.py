@@ -0,0 +1,167 @@
+"""
+Бенчмарк PasswordService: пропускная способность против памяти
+
+Для каждого уровня параллелизма в отдельном процессе выполняется
+--requests одновременных hash_password_async и замеряются хешей/с
+и пиковый RSS (процесс + процессы пула). Рядом печатается оценка
+лимита: max_concurrency * memory_cost — по ней выбирается
+PASSWORD_HASH_MEMORY_BUDGET_MB
+
+Запуск вручную (Linux: RSS читается из /proc):
+
+    python -m backend.service_user.benchmarks.password_hash_concurrency \\
+        --mode thread --concurrency 1,2,4,8 --memory-cost 65536
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from typing import Dict, List
+
+
+_PAGE_KIB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def _rss_kib(pid: int) -> int:
+    """RSS процесса (KiB), 0 — процесс уже завершился"""
+
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_KIB
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+class _PeakRss:
+    """Фоновый замер суммарного RSS процесса и его детей"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak_kib = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            pids = [os.getpid()] + [
+                child.pid for child in multiprocessing.active_children()]
+            self.peak_kib = max(self.peak_kib, sum(map(_rss_kib, pids)))
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "_PeakRss":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+async def _hash_all(service, requests: int) -> List[float]:
+    """Одновременные хеши, возвращает задержку каждого (секунды)"""
+
+    async def one(i: int) -> float:
+        started = time.perf_counter()
+        await service.hash_password_async(f"benchmark-password-{i}")
+        return time.perf_counter() - started
+
+    return await asyncio.gather(*(one(i) for i in range(requests)))
+
+
+def _run_level(args: argparse.Namespace, concurrency: int, out) -> None:
+    """Один уровень параллелизма (в отдельном процессе: чистый RSS)"""
+
+    from backend.service_user.src.core.service_password import (
+        PasswordService)
+
+    service = PasswordService(
+        mode=args.mode,
+        workers=concurrency,
+        memory_budget_mb=args.budget_mb,
+        queue_timeout=600.0,
+        time_cost=args.time_cost,
+        memory_cost=args.memory_cost,
+        parallelism=args.parallelism
+    )
+    # Прогрев: пул процессов и аллокатор, чтобы не мерить их старт
+    asyncio.run(_hash_all(service, service.max_concurrency))
+    baseline_kib = _rss_kib(os.getpid()) + sum(
+        _rss_kib(child.pid) for child in multiprocessing.active_children())
+
+    with _PeakRss() as peak:
+        started = time.perf_counter()
+        latencies = sorted(asyncio.run(_hash_all(service, args.requests)))
+        elapsed = time.perf_counter() - started
+    service.shutdown()
+
+    out.send({
+        "concurrency": concurrency,
+        "cap": service.max_concurrency,
+        "hashes_per_second": args.requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "baseline_mb": baseline_kib / 1024,
+        "peak_mb": peak.peak_kib / 1024,
+        "estimate_mb": service.max_concurrency * args.memory_cost / 1024,
+    })
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, float]]:
+    """Прогон всех уровней параллелизма"""
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for concurrency in args.concurrency:
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_level, args=(args, concurrency, sender))
+        process.start()
+        sender.close()
+        try:
+            results.append(receiver.recv())
+        except EOFError:
+            raise RuntimeError(
+                f"concurrency={concurrency}: процесс замера завершился "
+                f"с кодом {process.exitcode}") from None
+        finally:
+            process.join()
+    return results
+
+
+def main() -> None:
+    """ Печать таблицы результатов """
+
+    parser = argparse.ArgumentParser(
+        description="PasswordService: хешей/с против пиковой памяти")
+    parser.add_argument("--mode", choices=("thread", "process"),
+                        default="thread")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(item) for item in value.split(",")],
+        default=[1, 2, 4, 8]
+    )
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--time-cost", type=int, default=3)
+    parser.add_argument("--memory-cost", type=int, default=65536,
+                        help="KiB на один хеш")
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--budget-mb", type=int, default=1 << 20,
+                        help="По умолчанию без ограничения по памяти")
+    args = parser.parse_args()
+
+    print(f"mode={args.mode} memory_cost={args.memory_cost}KiB "
+          f"time_cost={args.time_cost} requests={args.requests}")
+    print(f"{'conc':>5} {'cap':>4} {'hash/s':>8} {'p50 ms':>8} "
+          f"{'p99 ms':>8} {'base MB':>8} {'peak MB':>8} {'cap*mem MB':>10}")
+    for row in run(args):
+        print(f"{row['concurrency']:>5} {row['cap']:>4} "
+              f"{row['hashes_per_second']:>8.1f} {row['p50_ms']:>8.0f} "
+              f"{row['p99_ms']:>8.0f} {row['baseline_mb']:>8.0f} "
+              f"{row['peak_mb']:>8.0f} {row['estimate_mb']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
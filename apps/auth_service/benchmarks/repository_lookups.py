@@ -0,0 +1,181 @@
+"""
+Бенчмарк горячих выборок репозиториев: готовые выражения против
+построения на каждый вызов
+
+UserRepository (_BY_EMAIL, _PRINCIPAL_BY_EMAIL, _ID_BY_EMAIL) и
+BaseRepository.get_by_id (_select_by_id) выполняют выражения,
+построенные один раз с bindparam: cache key такого объекта вычисляется
+однажды и дальше берётся из памяти, скомпилированный SQL — из кеша
+движка. Раньше выражение select(...).where(...) строилось заново на
+каждый вызов, и каждый раз заново считался его cache key.
+
+Для каждой выборки печатаются:
+
+    build µs — только построение выражения и его cache key, без БД
+    calls/s  — полный вызов через сессию на SQLite (лучший из --repeat)
+
+Засев: --users пользователей; выборки идут по случайным из них.
+DATABASE_URL берётся из --url до импорта приложения.
+
+Запуск вручную:
+
+    python -m backend.service_user.benchmarks.repository_lookups \\
+        --url sqlite+aiosqlite:///./lookups_bench.db --iterations 5000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+_SEED_CHUNK = 10_000
+
+
+async def _seed(users: int) -> List[Tuple[object, str]]:
+    """Дозаполнение users до нужного числа; возвращает (id, email)"""
+
+    from sqlalchemy import func, insert, select
+
+    from backend.src.app.core.database import engine
+    from backend.src.app.models import BaseModel, User
+    from backend.src.app.models.base import uuid7
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+        existing = (await conn.execute(select(func.count()).select_from(User))).scalar_one()
+    for start in range(existing, users, _SEED_CHUNK):
+        async with engine.begin() as conn:
+            await conn.execute(insert(User), [
+                {"id": uuid7(), "first_name": "Bench", "last_name": str(i),
+                 "email": f"bench{i}@example.com", "password_hash": "x"}
+                for i in range(start, min(start + _SEED_CHUNK, users))
+            ])
+    async with engine.connect() as conn:
+        return [tuple(row) for row in await conn.execute(select(User.id, User.email))]
+
+
+def _lookups() -> Dict[str, Tuple[Callable, Callable, Callable, Callable]]:
+    """
+    Для каждой выборки: выполнение (session, user_id, email) готовым
+    выражением и построенным на вызов, затем построение (user_id, email)
+    тех же двух выражений без БД
+    """
+
+    from sqlalchemy import select
+
+    from backend.src.app.models import User
+    from backend.src.app.repositories.base import _select_by_id
+    from backend.src.app.repositories.user import (
+        _BY_EMAIL,
+        _ID_BY_EMAIL,
+        _PRINCIPAL_BY_EMAIL,
+    )
+
+    def by_email(email):
+        return select(User).where(User.email == email)
+
+    def principal_by_email(email):
+        return select(User.id, User.email, User.role, User.is_active).where(
+            User.email == email)
+
+    def id_by_email(email):
+        return select(User.id).where(User.email == email)
+
+    def by_id(user_id):
+        return select(User).where(User.id == user_id)
+
+    return {
+        "get_by_email": (
+            lambda s, user_id, email: s.execute(_BY_EMAIL, {"email": email}),
+            lambda s, user_id, email: s.execute(by_email(email)),
+            lambda user_id, email: _BY_EMAIL._generate_cache_key(),
+            lambda user_id, email: by_email(email)._generate_cache_key(),
+        ),
+        "get_principal": (
+            lambda s, user_id, email: s.execute(_PRINCIPAL_BY_EMAIL, {"email": email}),
+            lambda s, user_id, email: s.execute(principal_by_email(email)),
+            lambda user_id, email: _PRINCIPAL_BY_EMAIL._generate_cache_key(),
+            lambda user_id, email: principal_by_email(email)._generate_cache_key(),
+        ),
+        "email_exists": (
+            lambda s, user_id, email: s.execute(_ID_BY_EMAIL, {"email": email}),
+            lambda s, user_id, email: s.execute(id_by_email(email)),
+            lambda user_id, email: _ID_BY_EMAIL._generate_cache_key(),
+            lambda user_id, email: id_by_email(email)._generate_cache_key(),
+        ),
+        "get_by_id": (
+            lambda s, user_id, email: s.execute(
+                _select_by_id(User), {"entity_id": user_id}),
+            lambda s, user_id, email: s.execute(by_id(user_id)),
+            lambda user_id, email: _select_by_id(User)._generate_cache_key(),
+            lambda user_id, email: by_id(user_id)._generate_cache_key(),
+        ),
+    }
+
+
+def _build_us(build: Callable, keys: List[Tuple[object, str]]) -> float:
+    """Микросекунд на построение выражения и его cache key"""
+
+    started = time.perf_counter()
+    for user_id, email in keys:
+        build(user_id, email)
+    return (time.perf_counter() - started) / len(keys) * 1_000_000
+
+
+async def _calls_per_second(
+    execute: Callable[..., Awaitable], keys: List[Tuple[object, str]], repeat: int
+) -> float:
+    from backend.src.app.core.database import async_session_factory
+
+    best = float("inf")
+    async with async_session_factory() as session:
+        user_id, email = keys[0]
+        (await execute(session, user_id, email)).all()  # прогрев кеша компиляции
+        for _ in range(repeat):
+            session.expunge_all()
+            started = time.perf_counter()
+            for user_id, email in keys:
+                (await execute(session, user_id, email)).all()
+            best = min(best, time.perf_counter() - started)
+    return len(keys) / best
+
+
+async def _run(users: int, iterations: int, repeat: int) -> None:
+    from backend.src.app.core.database import engine
+
+    rows = await _seed(users)
+    keys = [random.choice(rows) for _ in range(iterations)]
+    lookups = _lookups()
+    # Холодный проход: страницы БД в кеш SQLite до первого замера
+    await _calls_per_second(lookups["get_by_email"][0], keys, 1)
+
+    print(f"users={users:,} iterations={iterations:,}")
+    print(f"{'lookup':<14} {'path':<9} {'build µs':>9} {'calls/s':>10}")
+    for name, (prebuilt, per_call, build_prebuilt, build_per_call) in lookups.items():
+        for path, execute, build in (
+            ("prebuilt", prebuilt, build_prebuilt),
+            ("per call", per_call, build_per_call),
+        ):
+            print(f"{name:<14} {path:<9} {_build_us(build, keys):>9.1f} "
+                  f"{await _calls_per_second(execute, keys, repeat):>10,.0f}")
+    await engine.dispose()
+
+
+def main() -> None:
+    """ Засев и замер готовых выражений против построения на вызов """
+
+    parser = argparse.ArgumentParser(description="Готовые выражения репозиториев")
+    parser.add_argument("--url", default="sqlite+aiosqlite:///./lookups_bench.db")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = args.url
+    asyncio.run(_run(args.users, args.iterations, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
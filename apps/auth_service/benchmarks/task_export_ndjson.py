@@ -0,0 +1,113 @@
+"""
+Бенчмарк NDJSON выгрузки задач (GET /tasks/export)
+
+Засевает --rows задач (по умолчанию 1M) и прогоняет через генератор
+строк выгрузки — тот же путь, что у StreamingResponse: серверный
+курсор, yield_per, сериализация TaskOut по одной строке. Печатает
+строк/с, объём и RSS по ходу выгрузки: при потоковой выдаче он
+не должен расти вместе с числом строк.
+
+Засев выполняется в отдельном процессе, чтобы не влиять на RSS замера.
+DATABASE_URL берётся из --url до импорта приложения.
+
+Запуск вручную (Linux: RSS читается из /proc):
+
+    python -m backend.service_user.benchmarks.task_export_ndjson \\
+        --url sqlite+aiosqlite:///./export_bench.db --rows 1000000
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import time
+
+
+_PAGE_MB = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+_SEED_CHUNK = 10_000
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * _PAGE_MB
+
+
+async def _seed(rows: int) -> None:
+    """Засев задач пачками по _SEED_CHUNK (многострочный INSERT)"""
+
+    from sqlalchemy import func, insert, select
+
+    from backend.src.app.core.database import engine
+    from backend.src.app.models import BaseModel, Task
+    from backend.src.app.models.base import uuid7
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+        existing = (await conn.execute(select(func.count()).select_from(Task))).scalar_one()
+    for start in range(existing, rows, _SEED_CHUNK):
+        async with engine.begin() as conn:
+            await conn.execute(insert(Task), [
+                {"id": uuid7(), "title": f"task {i}", "description": "benchmark row"}
+                for i in range(start, min(start + _SEED_CHUNK, rows))
+            ])
+    await engine.dispose()
+
+
+def _seed_process(url: str, rows: int) -> None:
+    os.environ["DATABASE_URL"] = url
+    asyncio.run(_seed(rows))
+
+
+async def _export(checkpoints: int) -> dict:
+    """Выгрузка через генератор endpoint'а с замерами RSS"""
+
+    from backend.src.app.api.streaming import _ndjson_lines
+    from backend.src.app.core.database import engine
+    from backend.src.app.repositories.task import TaskRepository
+    from backend.src.app.schemas.task import TaskOut
+
+    rss = [("start", _rss_mb())]
+    lines = size = 0
+    started = time.perf_counter()
+    async for line in _ndjson_lines(TaskRepository, TaskOut):
+        lines += 1
+        size += len(line)
+        if lines % checkpoints == 0:
+            rss.append((f"{lines:,}", _rss_mb()))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    return {"lines": lines, "bytes": size, "seconds": elapsed, "rss": rss}
+
+
+def main() -> None:
+    """ Засев и замер выгрузки """
+
+    parser = argparse.ArgumentParser(description="NDJSON выгрузка задач")
+    parser.add_argument("--url", default="sqlite+aiosqlite:///./export_bench.db")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--checkpoints", type=int, default=10,
+                        help="Сколько раз замерить RSS по ходу выгрузки")
+    args = parser.parse_args()
+
+    seeding = time.perf_counter()
+    process = multiprocessing.get_context("spawn").Process(
+        target=_seed_process, args=(args.url, args.rows))
+    process.start()
+    process.join()
+    if process.exitcode:
+        raise SystemExit(f"Засев завершился с кодом {process.exitcode}")
+    print(f"seeded {args.rows:,} rows in {time.perf_counter() - seeding:.1f}s")
+
+    os.environ["DATABASE_URL"] = args.url
+    result = asyncio.run(_export(max(1, args.rows // args.checkpoints)))
+
+    print(f"streamed {result['lines']:,} lines, "
+          f"{result['bytes'] / 1024 / 1024:.0f} MB in {result['seconds']:.1f}s "
+          f"({result['lines'] / result['seconds']:,.0f} rows/s)")
+    print(f"{'after':>12} {'RSS MB':>8}")
+    for label, rss in result["rss"]:
+        print(f"{label:>12} {rss:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
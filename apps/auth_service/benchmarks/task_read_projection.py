@@ -0,0 +1,124 @@
+"""
+Бенчмарк чтения задач: ORM объекты против проекции колонок
+
+Для каждого размера из --sizes (по умолчанию 10k и 100k строк) читает
+страницу задач двумя путями:
+
+    orm        — TaskRepository.get_page: Task ORM объекты (identity map,
+                 состояние отношений), затем TaskOut.model_validate по одному
+    projection — TaskRepository.get_page_projected: только колонки TaskOut
+                 Core строками, одна проверка TypeAdapter(list[TaskOut])
+
+Печатает строк/с (лучший из --repeat прогонов) и аллокации одного
+прогона по tracemalloc: пик памяти и он же в байтах на строку.
+Время и аллокации замеряются в разных прогонах — tracemalloc
+замедляет код.
+
+Засев идёт в ту же БД и дозаполняет её до наибольшего размера.
+DATABASE_URL берётся из --url до импорта приложения.
+
+Запуск вручную:
+
+    python -m backend.service_user.benchmarks.task_read_projection \\
+        --url sqlite+aiosqlite:///./projection_bench.db --sizes 10000,100000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Dict, List
+
+_SEED_CHUNK = 10_000
+
+
+async def _seed(rows: int) -> None:
+    """Дозаполнение таблицы задач до rows строк"""
+
+    from sqlalchemy import func, insert, select
+
+    from backend.src.app.core.database import engine
+    from backend.src.app.models import BaseModel, Task
+    from backend.src.app.models.base import uuid7
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+        existing = (await conn.execute(select(func.count()).select_from(Task))).scalar_one()
+    for start in range(existing, rows, _SEED_CHUNK):
+        async with engine.begin() as conn:
+            await conn.execute(insert(Task), [
+                {"id": uuid7(), "title": f"task {i}", "description": "benchmark row"}
+                for i in range(start, min(start + _SEED_CHUNK, rows))
+            ])
+
+
+def _readers(rows: int) -> Dict[str, Callable[[], Awaitable[int]]]:
+    """Оба пути чтения одной страницы в rows строк, каждый в своей сессии"""
+
+    from backend.src.app.core.database import async_session_factory
+    from backend.src.app.repositories.task import TaskRepository
+    from backend.src.app.schemas.task import TaskOut
+
+    async def orm() -> int:
+        async with async_session_factory() as session:
+            tasks, _ = await TaskRepository(session).get_page(rows)
+            return len([TaskOut.model_validate(task) for task in tasks])
+
+    async def projection() -> int:
+        async with async_session_factory() as session:
+            tasks, _ = await TaskRepository(session).get_page_projected(TaskOut, rows)
+            return len(tasks)
+
+    return {"orm": orm, "projection": projection}
+
+
+async def _measure(read: Callable[[], Awaitable[int]], repeat: int) -> dict:
+    """Лучшее время из repeat прогонов и аллокации ещё одного"""
+
+    await read()  # прогрев: кеш компиляции, TypeAdapter
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = await read()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    await read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"rows": rows, "seconds": best, "peak": peak}
+
+
+async def _run(sizes: List[int], repeat: int) -> None:
+    from backend.src.app.core.database import engine
+
+    await _seed(max(sizes))
+    print(f"{'rows':>8} {'path':<11} {'rows/s':>10} {'peak MB':>8} {'B/row':>7}")
+    for rows in sizes:
+        for name, read in _readers(rows).items():
+            result = await _measure(read, repeat)
+            print(f"{result['rows']:>8,} {name:<11} "
+                  f"{result['rows'] / result['seconds']:>10,.0f} "
+                  f"{result['peak'] / 1024 / 1024:>8.1f} "
+                  f"{result['peak'] / result['rows']:>7,.0f}")
+    await engine.dispose()
+
+
+def main() -> None:
+    """ Засев и замер обоих путей чтения """
+
+    parser = argparse.ArgumentParser(description="ORM против проекции TaskOut")
+    parser.add_argument("--url", default="sqlite+aiosqlite:///./projection_bench.db")
+    parser.add_argument("--sizes", default="10000,100000",
+                        help="Размеры страницы через запятую")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = args.url
+    sizes = [int(size) for size in args.sizes.split(",")]
+    asyncio.run(_run(sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Бенчмарк первичных ключей UUID: скорость вставки и размер индекса
+
+Для каждой схемы ключа создаётся отдельная таблица с первичным ключом
+и индексом по id (как у BaseModel), затем в неё вставляется --rows
+строк пачками по --batch в отдельных транзакциях:
+
+    uuid4-char36   — случайный uuid4 строкой CHAR(36), как до UUIDType
+    uuid4-binary16 — случайный uuid4 через UUIDType (BINARY(16) / uuid PG)
+    uuid7-binary16 — uuid7 через UUIDType: ключи растут, вставка идёт
+                     в правый край индекса
+
+Печатает строк/с и размер таблицы и индексов после вставки (и он же
+в байтах на строку). Размер берётся из dbstat в SQLite и из
+pg_relation_size/pg_indexes_size в PostgreSQL. CHAR(36) против
+BINARY(16) показывает цену ключа строкой, uuid4 против uuid7 — цену
+вставки в случайное место индекса.
+
+Таблицы создаются заново на каждый запуск и удаляются в конце.
+
+Запуск вручную:
+
+    python -m backend.service_user.benchmarks.uuid_keys \\
+        --url sqlite+aiosqlite:///./uuid_bench.db --rows 200000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import Column, Index, MetaData, String, Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.types import TypeEngine
+
+
+def _schemes() -> List[Tuple[str, TypeEngine, Callable[[], object]]]:
+    """(схема, тип колонки id, генератор значения id)"""
+
+    from backend.src.app.models.base import UUIDType, uuid7
+
+    return [
+        ("uuid4-char36", String(36), lambda: str(uuid.uuid4())),
+        ("uuid4-binary16", UUIDType(), uuid.uuid4),
+        ("uuid7-binary16", UUIDType(), uuid7),
+    ]
+
+
+def _table(metadata: MetaData, scheme: str, id_type: TypeEngine) -> Table:
+    name = "bench_keys_" + scheme.replace("-", "_")
+    table = Table(
+        name, metadata,
+        Column("id", id_type, primary_key=True),
+        Column("title", String(64), nullable=False),
+    )
+    Index(f"ix_{name}_id", table.c.id)
+    return table
+
+
+async def _sizes(conn: AsyncConnection, table: Table) -> Dict[str, int]:
+    """Размер таблицы и её индексов в байтах"""
+
+    if conn.dialect.name == "postgresql":
+        table_bytes = (await conn.execute(
+            text("SELECT pg_relation_size(:name)"), {"name": table.name}
+        )).scalar_one()
+        index_bytes = (await conn.execute(
+            text("SELECT pg_indexes_size(:name)"), {"name": table.name}
+        )).scalar_one()
+        return {"table": table_bytes, "indexes": index_bytes}
+
+    # dbstat: страницы каждого B-дерева; индексы SQLite принадлежат таблице
+    rows = (await conn.execute(text(
+        "SELECT name, SUM(pgsize) FROM dbstat "
+        "WHERE name = :name OR name IN "
+        "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :name) "
+        "GROUP BY name"
+    ), {"name": table.name})).all()
+    sizes = dict(rows)
+    table_bytes = sizes.pop(table.name, 0)
+    return {"table": table_bytes, "indexes": sum(sizes.values())}
+
+
+async def _run(url: str, rows: int, batch: int) -> None:
+    engine = create_async_engine(url)
+    metadata = MetaData()
+    tables = {
+        scheme: (_table(metadata, scheme, id_type), new_id)
+        for scheme, id_type, new_id in _schemes()
+    }
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+    print(f"dialect={engine.dialect.name} rows={rows:,} batch={batch:,}")
+    print(f"{'scheme':<15} {'rows/s':>10} {'table MB':>9} {'index MB':>9} {'B/row':>6}")
+    try:
+        for scheme, (table, new_id) in tables.items():
+            elapsed = 0.0
+            for start in range(0, rows, batch):
+                values = [
+                    {"id": new_id(), "title": f"task {i}"}
+                    for i in range(start, min(start + batch, rows))
+                ]
+                started = time.perf_counter()
+                async with engine.begin() as conn:
+                    await conn.execute(insert(table), values)
+                elapsed += time.perf_counter() - started
+
+            async with engine.connect() as conn:
+                sizes = await _sizes(conn, table)
+            print(f"{scheme:<15} {rows / elapsed:>10,.0f} "
+                  f"{sizes['table'] / 1024 / 1024:>9.1f} "
+                  f"{sizes['indexes'] / 1024 / 1024:>9.1f} "
+                  f"{sizes['indexes'] / rows:>6,.0f}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    """ Вставка и размер индексов для каждой схемы ключа """
+
+    parser = argparse.ArgumentParser(description="UUID ключи: вставка и индексы")
+    parser.add_argument("--url", default="sqlite+aiosqlite:///./uuid_bench.db")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1_000,
+                        help="Строк в одной транзакции")
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.url, args.rows, args.batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """ API Routers Auth  """
 
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 
 from backend.service_user.src.protocols.token_repository import (
@@ -33,11 +33,13 @@ router = APIRouter(
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     responses={
-        401: {"description": "Неверные учетные данные"}
+        401: {"description": "Неверные учетные данные"},
+        429: {"description": "Слишком много попыток входа"}
     }
 )
 async def login_user(
     login_data: LoginRequest,
+    request: Request,
     auth_service: AuthService = Depends(get_auth_service)
 ) -> TokenResponse:
     """
@@ -50,9 +52,11 @@ async def login_user(
     """
 
     # Вызываем метод аутентификации с распакованными данными
-    token_pair = auth_service.authenticate_and_create_tokens(
+    token_pair = await auth_service.authenticate_and_create_tokens(
         email=login_data.email,
-        password=login_data.password
+        password=login_data.password,
+        ip_address=request.client.host if request.client else "unknown",
+        user_agent=request.headers.get("user-agent")
     )
 
     return TokenResponse.model_validate(token_pair.to_repository_dict())
@@ -80,7 +84,7 @@ async def refresh_token(
     Возвращает новую пару токенов
     """
 
-    token_pair = auth_service.refresh_access_token(
+    token_pair = await auth_service.refresh_access_token(
         refresh_token=refresh_data.refresh_token
     )
 
@@ -103,5 +107,5 @@ async def logout(
 ):
     """Выход из системы (инвалидация refresh токена)"""
 
-    token_repo.revoke_token(logout_data.refresh_token)
+    await token_repo.revoke_token(logout_data.refresh_token)
     return MessageResponse(message="Вы успешно вышли из системы")
@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter
 
+from backend.service_user.src.infrastructure.container import container
+
 router = APIRouter(tags=["Health"])
 
 
@@ -9,3 +11,18 @@ router = APIRouter(tags=["Health"])
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "user_service"}
+
+
+@router.get("/metrics/db")
+async def database_metrics():
+    """Метрики пулов и кеша компиляции (sync — gRPC, async — HTTP API)"""
+    return {
+        "pools": [
+            container.sync_pool_metrics().snapshot(),
+            container.async_pool_metrics().snapshot(),
+        ],
+        "statement_caches": [
+            container.sync_statement_cache_metrics().snapshot(),
+            container.async_statement_cache_metrics().snapshot(),
+        ]
+    }
@@ -39,7 +39,7 @@ async def register_user(
     Сервис возвращает готовый UserResponseDTO
     """
 
-    return register_service.register_user(register_data)
+    return await register_service.register_user(register_data)
 
 
 # @router.get(
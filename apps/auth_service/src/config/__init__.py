@@ -8,11 +8,13 @@ from .config_auth import AuthConfig
 from .base import BaseConfig
 from .config_cors import CORSConfig
 from .config_grpc import GrpcConfig
+from .config_pool import PoolConfig
 
 __all__ = [
     "ApiConfig",
     "AuthConfig",
     "BaseConfig",
     "CORSConfig",
-    "GrpcConfig"
+    "GrpcConfig",
+    "PoolConfig"
 ]
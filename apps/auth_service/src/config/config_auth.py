@@ -1,6 +1,8 @@
 """ Аутентификация и JWT """
 
 
+from typing import Optional
+
 from pydantic import Field
 from .base import BaseConfig
 
@@ -10,11 +12,112 @@ class AuthConfig(BaseConfig):
 
     ALGORITHM: str = Field(description="Проверка пароля")
     SECRET_KEY: str = Field(description="Секретный ключ для JWT")
+    JWT_BACKEND: str = Field(
+        default="jose",
+        description="Библиотека JWT: jose или pyjwt (нужна для EdDSA)"
+    )
+    PRIVATE_KEY_PATH: Optional[str] = Field(
+        default=None,
+        description="PEM ключ подписи для RS256/ES256/EdDSA"
+    )
+    PUBLIC_KEY_PATH: Optional[str] = Field(
+        default=None,
+        description="PEM ключ проверки для RS256/ES256/EdDSA"
+    )
 
     # JWT конфигурация
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(description="")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(description="40 кликов")
 
+    # Кеш проверенных токенов
+    TOKEN_CACHE_SIZE: int = Field(
+        default=10_000,
+        description="Размер кеша проверенных токенов (0 - выключен)"
+    )
+    TOKEN_CACHE_TTL_SECONDS: int = Field(
+        default=300,
+        description="Максимальное время жизни записи кеша токенов"
+    )
+
+    # Хеширование паролей (argon2)
+    PASSWORD_HASH_MODE: str = Field(
+        default="thread",
+        description="thread - в пуле потоков, process - в пуле процессов"
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=2,
+        description="Максимум процессов пула хеширования"
+    )
+    PASSWORD_HASH_MEMORY_BUDGET_MB: int = Field(
+        default=512,
+        description="Бюджет памяти на одновременные argon2 хеши (МБ)"
+    )
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = Field(
+        default=2.0,
+        description="Сколько ждать свободный слот до отказа 503 (0 - сразу)"
+    )
+    ARGON2_TIME_COST: int = Field(
+        default=3,
+        description="argon2: число итераций"
+    )
+    ARGON2_MEMORY_COST: int = Field(
+        default=65536,
+        description="argon2: память на один хеш (KiB)"
+    )
+    ARGON2_PARALLELISM: int = Field(
+        default=4,
+        description="argon2: число потоков на один хеш"
+    )
+    PASSWORD_HASH_TARGET_MS: int = Field(
+        default=0,
+        description="Целевое время хеша для калибровки при старте (0 - выкл)"
+    )
+
+    # Ограничение попыток входа (скользящее окно)
+    LOGIN_THROTTLE_WINDOW_SECONDS: int = Field(
+        default=900,
+        description="Длина окна подсчёта неудачных попыток"
+    )
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = Field(
+        default=20,
+        description="Неудачных попыток с одного IP за окно"
+    )
+    LOGIN_MAX_ATTEMPTS_PER_EMAIL: int = Field(
+        default=5,
+        description="Неудачных попыток на один email за окно"
+    )
+    LOGIN_THROTTLE_SHARDS: int = Field(
+        default=16,
+        description="Число шардов счётчиков (меньше конкуренции за блокировку)"
+    )
+    LOGIN_ATTEMPT_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=5.0,
+        description="Как часто сохранять накопленные попытки в БД"
+    )
+    LOGIN_ATTEMPT_BATCH_SIZE: int = Field(
+        default=500,
+        description="Максимум попыток в одной пачке вставки"
+    )
+
+    # Очистка refresh токенов
+    TOKEN_PURGE_INTERVAL_SECONDS: float = Field(
+        default=3600.0,
+        description="Как часто удалять просроченные и отозванные токены "
+                    "(0 — не удалять)"
+    )
+    TOKEN_PURGE_BATCH_SIZE: int = Field(
+        default=1000,
+        description="Токенов в одной пачке удаления (одна короткая транзакция)"
+    )
+    TOKEN_PURGE_BATCH_PAUSE_SECONDS: float = Field(
+        default=0.1,
+        description="Пауза между пачками удаления"
+    )
+    TOKEN_PURGE_TIME_BUDGET_SECONDS: float = Field(
+        default=30.0,
+        description="Максимальная длительность одного прогона очистки"
+    )
+
     # Пароли
     MIN_PASSWORD_LENGTH: int = Field(
         description="Минимальная длина пароля"
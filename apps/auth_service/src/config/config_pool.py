@@ -0,0 +1,30 @@
+""" Конфигурация пула соединений """
+
+from pydantic import Field
+
+from .base import BaseConfig
+
+
+class PoolConfig(BaseConfig):
+    """Конфигурация пула асинхронного engine"""
+
+    DB_POOL_SIZE: int = Field(
+        default=5,
+        description="Постоянных соединений в пуле"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        description="Дополнительных соединений сверх пула"
+    )
+    DB_POOL_TIMEOUT: float = Field(
+        default=30.0,
+        description="Ожидание свободного соединения (секунды)"
+    )
+    DB_POOL_USE_LIFO: bool = Field(
+        default=False,
+        description="Выдавать последнее возвращённое соединение (LIFO)"
+    )
+    DB_QUERY_CACHE_SIZE: int = Field(
+        default=500,
+        description="Скомпилированных SQL выражений в кеше engine"
+    )
@@ -1,3 +1,6 @@
+from backend.shared.security import VerifiedTokenCache
+
+from .login_throttle import LoginThrottle
 from .service_jwt import JWTService
 from .service_password import PasswordService
 from .validator_auth import AuthValidator
@@ -5,7 +8,9 @@ from .validator_name import UserUniquenessValidator
 
 __all__ = [
     "JWTService",
+    "LoginThrottle",
     "PasswordService",
     "UserUniquenessValidator",
-    "AuthValidator"
+    "AuthValidator",
+    "VerifiedTokenCache"
 ]
@@ -0,0 +1,278 @@
+"""
+Ограничение частоты попыток входа (скользящее окно)
+
+Счётчики неудачных попыток по IP и по email хранятся в памяти,
+разбитые на шарды с отдельными блокировками. Окно считается
+по двум соседним фиксированным интервалам (предыдущий
+с весом остатка окна + текущий), поэтому проверка и запись — O(1).
+
+Попытка резервируется в счётчиках ещё в check(), под блокировкой
+шарда: параллельные запросы на один email не проходят проверку
+раньше, чем кто-то из них запишет неудачу
+
+Попытки копятся в буфере и пачками сохраняются в LoginAttempt:
+для аудита и для восстановления счётчиков после рестарта (restore)
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from backend.service_user.src.exception.auth import TooManyAttemptsException
+
+
+# Счётчик ключа: (номер интервала, попыток в предыдущем, попыток в текущем)
+_Counter = Tuple[int, int, int]
+
+
+class _Shard:
+    """Часть счётчиков со своей блокировкой"""
+
+    __slots__ = ("lock", "counters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[str, _Counter] = {}
+
+
+class LoginThrottle:
+    """
+    Счётчики попыток входа по IP и email
+
+    - check():   до проверки пароля; резервирует попытку в обоих
+                 счётчиках или отвечает 429 при превышении лимита
+    - release(): возврат резерва (проверка не состоялась)
+    - record():  после проверки; неудача остаётся в счётчиках,
+                 успех возвращает резерв IP и сбрасывает счётчик email
+    - drain():   пачка накопленных попыток для сохранения в БД
+    - restore(): загрузка попыток из БД после рестарта
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 900,
+        max_per_ip: int = 20,
+        max_per_email: int = 5,
+        shards: int = 16,
+        buffer_limit: int = 10_000
+    ):
+        self.window = window_seconds
+        self.max_per_ip = max_per_ip
+        self.max_per_email = max_per_email
+        self.rejected = 0
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        # Буфер ограничен: при недоступной БД теряются самые старые записи
+        self._pending: Deque[Dict[str, Any]] = deque(maxlen=buffer_limit)
+
+    def check(self, ip_address: str, email: str) -> float:
+        """
+        Проверка лимитов и резерв попытки до вычисления хеша
+
+        Returns: время резерва — передаётся в record() или release()
+        """
+
+        now = time.time()
+        ip_key = f"ip:{ip_address}"
+        email_key = f"email:{email.lower()}"
+
+        retry_after = self._reserve(ip_key, now, self.max_per_ip)
+        if retry_after is None:
+            retry_after = self._reserve(email_key, now, self.max_per_email)
+            if retry_after is None:
+                return now
+            self._unhit(ip_key, now)
+
+        self.rejected += 1
+        raise TooManyAttemptsException(
+            details={"retry_after": retry_after}
+        )
+
+    def release(self, ip_address: str, email: str, reserved_at: float) -> None:
+        """Возврат резерва check() (например, ошибка до проверки пароля)"""
+
+        self._unhit(f"ip:{ip_address}", reserved_at)
+        self._unhit(f"email:{email.lower()}", reserved_at)
+
+    def record(
+        self,
+        ip_address: str,
+        email: str,
+        is_successful: bool,
+        reserved_at: float,
+        user_id: Optional[UUID] = None,
+        user_agent: Optional[str] = None,
+        failure_reason: Optional[str] = None
+    ) -> None:
+        """
+        Учёт попытки в буфере для БД
+
+        Неудача уже учтена резервом check(); успех возвращает
+        резерв IP и сбрасывает счётчик email
+        """
+
+        now = time.time()
+        email = email.lower()
+        if is_successful:
+            self._unhit(f"ip:{ip_address}", reserved_at)
+            self._reset(f"email:{email}")
+
+        self._pending.append({
+            "user_id": user_id,
+            "email": email,
+            "ip_address": ip_address,
+            "user_agent": user_agent[:500] if user_agent else None,
+            "is_successful": is_successful,
+            "failure_reason": failure_reason,
+            "created_at": datetime.fromtimestamp(now, timezone.utc),
+        })
+
+    def drain(self, max_items: int = 500) -> List[Dict[str, Any]]:
+        """Извлечение пачки попыток для сохранения"""
+
+        batch = []
+        while self._pending and len(batch) < max_items:
+            batch.append(self._pending.popleft())
+        return batch
+
+    def requeue(self, batch: List[Dict[str, Any]]) -> None:
+        """Возврат несохранённой пачки в начало буфера"""
+
+        self._pending.extendleft(reversed(batch))
+
+    def restore(
+        self,
+        attempts: Iterable[Tuple[str, str, bool, datetime]]
+    ) -> None:
+        """
+        Восстановление счётчиков из попыток (ip, email, успех, время)
+
+        Попытки идут по времени и повторяют record(): успешный вход
+        сбрасывает счётчик email, учитываются только неудачи после него
+        """
+
+        for ip_address, email, is_successful, created_at in attempts:
+            email_key = f"email:{email.lower()}"
+            if is_successful:
+                self._reset(email_key)
+                continue
+            at = created_at.timestamp()
+            self._hit(f"ip:{ip_address}", at)
+            self._hit(email_key, at)
+
+    def prune(self) -> int:
+        """Удаление счётчиков, вышедших из окна"""
+
+        current = int(time.time() // self.window)
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                stale = [
+                    key for key, (bucket, _, _) in shard.counters.items()
+                    if bucket < current - 1
+                ]
+                for key in stale:
+                    del shard.counters[key]
+                removed += len(stale)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики для мониторинга"""
+
+        return {
+            "keys": sum(len(shard.counters) for shard in self._shards),
+            "pending": len(self._pending),
+            "rejected": self.rejected,
+        }
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _estimate(self, counter: _Counter, now: float) -> float:
+        """Число попыток за последние window секунд"""
+
+        bucket, previous, current = counter
+        now_bucket = int(now // self.window)
+        elapsed = (now % self.window) / self.window
+        if now_bucket == bucket:
+            return previous * (1 - elapsed) + current
+        if now_bucket == bucket + 1:
+            return current * (1 - elapsed)
+        return 0.0
+
+    def _retry_after(self, counter: _Counter, now: float, limit: int) -> int:
+        """Секунд до момента, когда оценка окна опустится ниже limit"""
+
+        bucket, previous, current = counter
+        if int(now // self.window) == bucket and current < limit:
+            # Хватит доли предыдущего интервала, оставшейся в окне
+            fraction = 1 - (limit - current) / previous
+            at = bucket * self.window + self.window * fraction
+        else:
+            # Ждём, пока текущий интервал не станет предыдущим
+            fraction = 1 - limit / current if current else 0.0
+            at = (bucket + 1) * self.window + self.window * fraction
+        return max(1, math.floor(at - now) + 1)
+
+    def _reserve(self, key: str, now: float, limit: int) -> Optional[int]:
+        """
+        Атомарная проверка и учёт попытки
+
+        Returns: None — попытка учтена, иначе Retry-After в секундах
+        """
+
+        shard = self._shard(key)
+        with shard.lock:
+            counter = shard.counters.get(key)
+            if counter is not None and self._estimate(counter, now) >= limit:
+                return self._retry_after(counter, now, limit)
+            self._apply_hit(shard, key, int(now // self.window))
+        return None
+
+    def _hit(self, key: str, at: float) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            self._apply_hit(shard, key, int(at // self.window))
+
+    @staticmethod
+    def _apply_hit(shard: _Shard, key: str, bucket: int) -> None:
+        old_bucket, previous, current = shard.counters.get(
+            key, (bucket, 0, 0))
+        if bucket == old_bucket:
+            counter = (bucket, previous, current + 1)
+        elif bucket == old_bucket + 1:
+            counter = (bucket, current, 1)
+        elif bucket > old_bucket + 1:
+            counter = (bucket, 0, 1)
+        elif bucket == old_bucket - 1:
+            # Запоздавшая запись (restore не по порядку)
+            counter = (old_bucket, previous + 1, current)
+        else:
+            return
+        shard.counters[key] = counter
+
+    def _unhit(self, key: str, at: float) -> None:
+        """Возврат попытки в тот интервал, куда она была учтена"""
+
+        bucket = int(at // self.window)
+        shard = self._shard(key)
+        with shard.lock:
+            counter = shard.counters.get(key)
+            if counter is None:
+                return
+            old_bucket, previous, current = counter
+            if bucket == old_bucket:
+                counter = (old_bucket, previous, max(current - 1, 0))
+            elif bucket == old_bucket - 1:
+                counter = (old_bucket, max(previous - 1, 0), current)
+            else:
+                return
+            shard.counters[key] = counter
+
+    def _reset(self, key: str) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.counters.pop(key, None)
@@ -0,0 +1,29 @@
+"""
+CLI калибровки стоимости argon2 под текущее железо
+
+Сама калибровка — backend.shared.security.password_calibration
+(новые хеши сервиса — только argon2, BCRYPT_ROUNDS не подбирается)
+
+Запуск вручную:
+
+    python -m backend.service_user.src.core.password_calibration --target-ms 250
+"""
+
+from backend.shared.security.password_calibration import cli
+
+
+def main() -> None:
+    """ Печать подобранных параметров в формате .env """
+
+    from backend.service_user.src.config import AuthConfig
+
+    config = AuthConfig()
+    cli(
+        config.ARGON2_MEMORY_COST,
+        config.ARGON2_PARALLELISM,
+        bcrypt_rounds=False
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,15 @@
 
 
 from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
+from pathlib import Path
 from typing import Dict, Optional
 
+from backend.shared.security import (
+    TokenError,
+    VerifiedTokenCache,
+    get_jwt_backend
+)
+
 
 class JWTService:
     """Сервис для работы с JWT токенами (без доступа к БД)"""
@@ -17,11 +23,36 @@ class JWTService:
         algorithm: str,
         access_token_expire_minutes: int,
         refresh_token_expire_days: int,
+        token_cache: Optional[VerifiedTokenCache] = None,
+        backend: str = "jose",
+        private_key_path: Optional[str] = None,
+        public_key_path: Optional[str] = None,
     ):
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
+        self.token_cache = token_cache
+        self.backend = get_jwt_backend(backend)
+
+        # Ключи разбираются один раз при создании сервиса
+        if algorithm.startswith("HS"):
+            self._signing_key = self.backend.load_private_key(
+                secret_key, algorithm
+            )
+            self._verification_key = self._signing_key
+        else:
+            if not private_key_path or not public_key_path:
+                raise ValueError(
+                    f"Для алгоритма {algorithm} нужны PRIVATE_KEY_PATH "
+                    "и PUBLIC_KEY_PATH"
+                )
+            self._signing_key = self.backend.load_private_key(
+                Path(private_key_path).read_text(), algorithm
+            )
+            self._verification_key = self.backend.load_public_key(
+                Path(public_key_path).read_text(), algorithm
+            )
 
     def create_access_token(
         self,
@@ -43,9 +74,9 @@ class JWTService:
             "type": "access"
         })
 
-        return jwt.encode(
+        return self.backend.encode(
             to_encode,
-            self.secret_key,
+            self._signing_key,
             algorithm=self.algorithm
         )
 
@@ -69,25 +100,31 @@ class JWTService:
             "type": "refresh"
         })
 
-        return jwt.encode(
+        return self.backend.encode(
             to_encode,
-            self.secret_key,
+            self._signing_key,
             algorithm=self.algorithm
         )
 
     def decode_token(self, token: str) -> Optional[Dict]:
-        """Декодирование токена"""
+        """Декодирование токена (успешные проверки кешируются)"""
 
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm]
-            )
-            return payload
-        except JWTError:
+            if self.token_cache is None:
+                return self._decode(token)
+            return self.token_cache.get_or_decode(token, self._decode)
+        except TokenError:
             return None
 
+    def _decode(self, token: str) -> Dict:
+        """Полная проверка подписи и claims (TokenError при ошибке)"""
+
+        return self.backend.decode(
+            token,
+            self._verification_key,
+            algorithms=[self.algorithm]
+        )
+
     def verify_token_type(self, token: str, expected_type: str) -> bool:
         """Проверка типа токена"""
 
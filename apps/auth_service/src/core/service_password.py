@@ -2,18 +2,126 @@
 Служба для работы с паролями
 """
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
 from passlib.context import CryptContext
 
+from backend.service_user.src.exception.base import (
+    ServiceUnavailableException)
+
+
+# Контекст хеширования внутри процесса пула (создаётся initializer'ом)
+_worker_context: Optional[CryptContext] = None
+
+
+def _init_worker(context_kwargs: Dict[str, Any]) -> None:
+    """Инициализация процесса пула"""
+
+    global _worker_context
+    _worker_context = CryptContext(**context_kwargs)
+
+
+def _hash_in_worker(password: str) -> str:
+    return _worker_context.hash(password)
+
+
+def _verify_in_worker(plain_password: str, hashed_password: str) -> bool:
+    return _worker_context.verify(plain_password, hashed_password)
+
+
+def _verify_and_update_in_worker(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    return _worker_context.verify_and_update(plain_password, hashed_password)
+
 
 class PasswordService:
-    """ Класс для работы с паролями """
+    """
+    Класс для работы с паролями
+
+    Режимы async-методов (PASSWORD_HASH_MODE):
+    - "thread":  argon2 выполняется в пуле потоков (argon2-cffi
+      отпускает GIL, event loop не блокируется)
+    - "process": argon2 выполняется в пуле процессов
+
+    В обоих режимах одновременно работает не больше
+    memory_budget / memory_cost хешей, остальные ждут
+    не дольше queue_timeout и получают 503
+
+    Новые хеши — argon2; bcrypt хеши и хеши с устаревшими параметрами
+    перехешируются при входе (verify_and_update)
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        workers: int = 2,
+        memory_budget_mb: int = 512,
+        queue_timeout: float = 2.0,
+        time_cost: int = 3,
+        memory_cost: int = 65536,
+        parallelism: int = 4,
+    ):
 
-    def __init__(self):
+        self.mode = mode
+        self.workers = workers
+        self.memory_budget_mb = memory_budget_mb
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.rejected = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._configure(time_cost, memory_cost, parallelism)
 
-        self.pwd_context = CryptContext(
-            schemes=["argon2"],
-            deprecated="auto"
+    def _configure(
+        self,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int
+    ) -> None:
+        """Создание контекста хеширования и лимита параллелизма"""
+
+        self._context_kwargs = {
+            "schemes": ["argon2", "bcrypt"],
+            "deprecated": "auto",
+            "argon2__time_cost": time_cost,
+            # Хеши с меньшим time_cost считаются устаревшими
+            "argon2__min_rounds": time_cost,
+            "argon2__memory_cost": memory_cost,
+            "argon2__parallelism": parallelism,
+        }
+        self.pwd_context = CryptContext(**self._context_kwargs)
+
+        # Лимит: сколько хешей помещается в бюджет памяти (memory_cost в KiB)
+        self.max_concurrency = max(
+            1,
+            min(self.workers, self.memory_budget_mb * 1024 // memory_cost)
         )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def reconfigure(
+        self,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int
+    ) -> None:
+        """
+        Смена параметров argon2 (например, после калибровки)
+
+        Вызывается до обработки запросов: пул процессов пересоздаётся
+        с новым контекстом при следующем обращении. Пока есть
+        незавершённые хеши, смена лимита запрещена — они вернут
+        слот в старый семафор
+        """
+
+        if self.in_flight:
+            raise RuntimeError(
+                "PasswordService.reconfigure() with hashes in flight")
+        self.shutdown()
+        self._configure(time_cost, memory_cost, parallelism)
 
     def verify_password(
         self,
@@ -27,6 +135,23 @@ class PasswordService:
             hashed_password
         )
 
+    def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Проверка пароля с перехешированием
+
+        Возвращает: (пароль верен, новый хеш или None,
+        если схема и параметры хеша актуальны)
+        """
+
+        return self.pwd_context.verify_and_update(
+            plain_password,
+            hashed_password
+        )
+
     def hash_password(
         self,
         password: str
@@ -34,3 +159,114 @@ class PasswordService:
         """ Хэширование пароля """
 
         return self.pwd_context.hash(password)
+
+    async def verify_password_async(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> bool:
+        """ Проверка пароля без блокировки event loop """
+
+        return await self._run(
+            _verify_in_worker,
+            self.verify_password,
+            plain_password,
+            hashed_password
+        )
+
+    async def verify_and_update_async(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """ Проверка с перехешированием без блокировки event loop """
+
+        return await self._run(
+            _verify_and_update_in_worker,
+            self.verify_and_update,
+            plain_password,
+            hashed_password
+        )
+
+    async def hash_password_async(
+        self,
+        password: str
+    ) -> str:
+        """ Хэширование пароля без блокировки event loop """
+
+        return await self._run(
+            _hash_in_worker,
+            self.hash_password,
+            password
+        )
+
+    async def _run(
+        self,
+        worker_fn: Callable[..., Any],
+        inline_fn: Callable[..., Any],
+        *args: Any
+    ) -> Any:
+        """Выполнение с back-pressure в пуле потоков или процессов"""
+
+        # Слот возвращается в тот семафор, из которого взят
+        semaphore = await self._acquire_slot()
+        self.in_flight += 1
+        try:
+            if self.mode != "process":
+                return await asyncio.to_thread(inline_fn, *args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_pool(),
+                worker_fn,
+                *args
+            )
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+
+    async def _acquire_slot(self) -> asyncio.Semaphore:
+        """Ожидание свободного слота не дольше queue_timeout"""
+
+        semaphore = self._semaphore
+        if self.queue_timeout <= 0 and semaphore.locked():
+            self.rejected += 1
+            raise ServiceUnavailableException()
+
+        try:
+            await asyncio.wait_for(
+                semaphore.acquire(),
+                timeout=self.queue_timeout if self.queue_timeout > 0 else None
+            )
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise ServiceUnavailableException() from None
+        return semaphore
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Ленивое создание пула (spawn: процесс сервиса многопоточный)"""
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._context_kwargs,)
+            )
+        return self._pool
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики для мониторинга"""
+
+        return {
+            "mode": self.mode,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Остановка пула процессов"""
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
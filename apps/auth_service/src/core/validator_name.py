@@ -14,14 +14,14 @@ class UserUniquenessValidator:
     ):
         self.user_repo = user_repo
 
-    def validate(
+    async def validate(
         self,
         user_name: str,
         email: str
     ) -> None:
         """ Проверка уникальности user_name и email """
 
-        if self.user_repo.get_user_by_user_name(user_name):
+        if await self.user_repo.get_user_by_user_name(user_name):
             raise ConflictException(
                 message="Пользователь с таким именем уже существует",
                 details={
@@ -30,7 +30,7 @@ class UserUniquenessValidator:
                 }
             )
 
-        if self.user_repo.get_user_by_email(email):
+        if await self.user_repo.get_user_by_email(email):
             raise ConflictException(
                 message="Пользователь с таким email уже существует",
                 details={
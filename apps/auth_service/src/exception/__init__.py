@@ -6,12 +6,14 @@ from .base import (
     AppException,
     ConflictException,
     NotFoundException,
+    ServiceUnavailableException,
     ValidationException,
 )
 from .auth import (
     InvalidCredentialsException,
     InvalidTokenException,
     TokenExpiredException,
+    TooManyAttemptsException,
 )
 
 __all__ = [
@@ -21,8 +23,10 @@ __all__ = [
     "InvalidCredentialsException",
     "InvalidTokenException",
     "TokenExpiredException",
+    "TooManyAttemptsException",
     # Общие
     "ConflictException",
     "NotFoundException",
+    "ServiceUnavailableException",
     "ValidationException",
 ]
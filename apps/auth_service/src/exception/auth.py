@@ -1,5 +1,7 @@
 """ Исключения аутентификации """
 
+from typing import Any, Dict, Optional
+
 from .base import AppException
 
 
@@ -43,3 +45,19 @@ class TokenExpiredException(AppException):
             status_code=401,
             code="TOKEN_EXPIRED"
         )
+
+
+class TooManyAttemptsException(AppException):
+    """429 - Слишком много попыток входа"""
+
+    def __init__(
+        self,
+        message: str = "Слишком много попыток входа, повторите позже",
+        details: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            message=message,
+            status_code=429,
+            code="TOO_MANY_ATTEMPTS",
+            details=details
+        )
@@ -77,3 +77,19 @@ class ValidationException(AppException):
             code="VALIDATION_ERROR",
             details=details
         )
+
+
+class ServiceUnavailableException(AppException):
+    """503 - Сервис временно перегружен"""
+
+    def __init__(
+        self,
+        message: str = "Сервис перегружен, повторите попытку позже",
+        details: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            message=message,
+            status_code=503,
+            code="SERVICE_UNAVAILABLE",
+            details=details
+        )
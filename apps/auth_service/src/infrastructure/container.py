@@ -17,18 +17,29 @@ from backend.service_user.src.config import (
     ApiConfig,
     AuthConfig,
     CORSConfig,
-    GrpcConfig
+    GrpcConfig,
+    PoolConfig
 )
 from backend.service_user.src.core import (
     JWTService,
     PasswordService,
-    AuthValidator
+    AuthValidator,
+    LoginThrottle,
+    VerifiedTokenCache
 )
 from backend.shared.database import (
     DataBaseConfig,
     ConnectionManager,
     SessionManager
 )
+from backend.shared.metrics import (
+    instrument_pool,
+    instrument_statement_cache
+)
+from backend.service_user.src.infrastructure.database import (
+    create_async_engine_from,
+    create_session_factory
+)
 from backend.service_user.src.service.auth_service import AuthMapper
 
 
@@ -57,6 +68,7 @@ class Container(containers.DeclarativeContainer):
     cors_config = providers.Factory(CORSConfig)
     db_config = providers.Factory(DataBaseConfig)
     grpc_config = providers.Factory(GrpcConfig)
+    pool_config = providers.Factory(PoolConfig)
 
     # ==========================================
     # Сессия
@@ -68,19 +80,70 @@ class Container(containers.DeclarativeContainer):
         database_config=db_config
     )
 
-    # Сессии создаются из engine
+    # Сессии создаются из engine (синхронные: gRPC сервер)
     session_manager = providers.Factory(
         SessionManager,
         engine=connection_manager.provided.engine
     )
 
+    # Асинхронный engine на то же подключение (HTTP API)
+    async_engine = providers.Singleton(
+        create_async_engine_from,
+        engine=connection_manager.provided.engine,
+        pool_config=pool_config
+    )
+
+    # Метрики пулов обоих engine (создаются при старте, см. lifespan)
+    sync_pool_metrics = providers.Singleton(
+        instrument_pool,
+        engine=connection_manager.provided.engine,
+        name="sync"
+    )
+    async_pool_metrics = providers.Singleton(
+        instrument_pool,
+        engine=async_engine,
+        name="async"
+    )
+
+    # Метрики кеша скомпилированных выражений обоих engine
+    sync_statement_cache_metrics = providers.Singleton(
+        instrument_statement_cache,
+        engine=connection_manager.provided.engine,
+        name="sync"
+    )
+    async_statement_cache_metrics = providers.Singleton(
+        instrument_statement_cache,
+        engine=async_engine,
+        name="async"
+    )
+
+    # Фабрика асинхронных сессий
+    async_session_factory = providers.Singleton(
+        create_session_factory,
+        engine=async_engine
+    )
+
     # ==========================================
     # STATELESS CORE СЕРВИСЫ
     # ==========================================
 
-    # Сервис для работы с паролями (без состояния)
+    # Сервис для работы с паролями (пул процессов общий на приложение)
     password_service = providers.Singleton(
-        PasswordService
+        PasswordService,
+        mode=auth_config.provided.PASSWORD_HASH_MODE,
+        workers=auth_config.provided.PASSWORD_HASH_WORKERS,
+        memory_budget_mb=auth_config.provided.PASSWORD_HASH_MEMORY_BUDGET_MB,
+        queue_timeout=auth_config.provided.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+        time_cost=auth_config.provided.ARGON2_TIME_COST,
+        memory_cost=auth_config.provided.ARGON2_MEMORY_COST,
+        parallelism=auth_config.provided.ARGON2_PARALLELISM,
+    )
+
+    # Кеш проверенных токенов (общий для HTTP и gRPC)
+    token_cache = providers.Singleton(
+        VerifiedTokenCache,
+        max_size=auth_config.provided.TOKEN_CACHE_SIZE,
+        max_ttl=auth_config.provided.TOKEN_CACHE_TTL_SECONDS,
     )
 
     # Сервис для работы с JWT токенами (без состояния)
@@ -92,6 +155,20 @@ class Container(containers.DeclarativeContainer):
         # Время жизни токенов
         access_token_expire_minutes=auth_config.provided.ACCESS_TOKEN_EXPIRE_MINUTES,
         refresh_token_expire_days=auth_config.provided.REFRESH_TOKEN_EXPIRE_DAYS,
+        token_cache=token_cache,
+        # Бэкенд и ключи для асимметричных алгоритмов
+        backend=auth_config.provided.JWT_BACKEND,
+        private_key_path=auth_config.provided.PRIVATE_KEY_PATH,
+        public_key_path=auth_config.provided.PUBLIC_KEY_PATH,
+    )
+
+    # Счётчики попыток входа (состояние общее на процесс)
+    login_throttle = providers.Singleton(
+        LoginThrottle,
+        window_seconds=auth_config.provided.LOGIN_THROTTLE_WINDOW_SECONDS,
+        max_per_ip=auth_config.provided.LOGIN_MAX_ATTEMPTS_PER_IP,
+        max_per_email=auth_config.provided.LOGIN_MAX_ATTEMPTS_PER_EMAIL,
+        shards=auth_config.provided.LOGIN_THROTTLE_SHARDS,
     )
 
     # Валидатор аутентификации
@@ -0,0 +1,71 @@
+"""
+Асинхронный engine для User Service
+
+Строится из того же подключения, что и синхронный engine
+из backend.shared.database: меняется только драйвер
+"""
+
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
+
+from backend.service_user.src.config import PoolConfig
+
+
+# Синхронный драйвер -> асинхронный
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgresql+psycopg": "postgresql+psycopg",
+    "postgresql+asyncpg": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "sqlite+aiosqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: URL) -> URL:
+    """ URL с асинхронным драйвером """
+
+    drivername = _ASYNC_DRIVERS.get(url.drivername)
+    if drivername is None:
+        raise ValueError(
+            f"Нет асинхронного драйвера для '{url.drivername}'"
+        )
+    return url.set(drivername=drivername)
+
+
+def create_async_engine_from(
+    engine: Engine,
+    pool_config: PoolConfig
+) -> AsyncEngine:
+    """ Асинхронный engine с тем же подключением, что и у engine """
+
+    return create_async_engine(
+        to_async_url(engine.url),
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=pool_config.DB_POOL_SIZE,
+        max_overflow=pool_config.DB_MAX_OVERFLOW,
+        pool_timeout=pool_config.DB_POOL_TIMEOUT,
+        pool_use_lifo=pool_config.DB_POOL_USE_LIFO,
+        query_cache_size=pool_config.DB_QUERY_CACHE_SIZE
+    )
+
+
+def create_session_factory(
+    engine: AsyncEngine
+) -> async_sessionmaker[AsyncSession]:
+    """ Фабрика асинхронных сессий """
+
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        # Объекты остаются доступны после commit (без lazy load)
+        expire_on_commit=False,
+        autoflush=False
+    )
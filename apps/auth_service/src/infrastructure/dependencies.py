@@ -8,8 +8,10 @@ FastAPI Dependencies для User Service
 """
 
 
+from typing import AsyncGenerator
+
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.service_user.src.infrastructure.container import container
 from backend.service_user.src.repositories import (
@@ -26,17 +28,12 @@ from backend.service_user.src.service import (
 # ==========================================
 
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency для получения сессии БД
+    Dependency для получения асинхронной сессии БД
     """
-    session_manager = container.session_manager()
-    session = session_manager.SessionLocal()
-
-    try:
+    async with container.async_session_factory()() as session:
         yield session
-    finally:
-        session.close()
 
 
 # ==========================================
@@ -44,14 +41,14 @@ def get_db():
 # ==========================================
 
 def get_user_repository(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> SQLUserRepository:
     """ Dependency для получения репозитория пользователей """
     return SQLUserRepository(db)
 
 
 def get_token_repository(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> SQLTokenRepository:
     """ Dependency для получения репозитория токенов """
     return SQLTokenRepository(db)
@@ -74,7 +71,8 @@ def get_auth_service(
         jwt_service=container.jwt_service(),
         auth_config=container.auth_config(),
         auth_validator=container.auth_validator(),
-        mapper=container.auth_mapper()
+        mapper=container.auth_mapper(),
+        login_throttle=container.login_throttle()
     )
 
 
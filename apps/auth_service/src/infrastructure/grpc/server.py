@@ -11,6 +11,7 @@ from google.rpc import status_pb2
 
 
 from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.models.user import User
 from backend.shared.logging.logger import get_logger
 from backend.shared.proto import user_service_pb2, user_service_pb2_grpc
 
@@ -91,11 +92,10 @@ class UserServiceServicer(user_service_pb2_grpc.UserServiceServicer):
 
     def GetUserById(self, request, context):
         """Получение пользователя по ID"""
+        # gRPC сервер работает в пуле потоков: синхронная сессия
         session_manager = container.session_manager()
-        user_repo_class = container.sql_user_repository()
 
         with session_manager.SessionLocal() as session:
-            user_repo = user_repo_class(session)
             try:
                 try:
                     user_id = UUID(request.user_id)
@@ -110,7 +110,7 @@ class UserServiceServicer(user_service_pb2_grpc.UserServiceServicer):
                         exists=False
                     )
 
-                user = user_repo.get_user_by_id(user_id)
+                user = session.get(User, user_id)
 
                 if not user:
                     return user_service_pb2.GetUserByIdResponse(
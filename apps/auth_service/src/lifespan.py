@@ -4,12 +4,17 @@
 Отвечает ТОЛЬКО за:
 - Миграции базы данных
 - Подключение к БД
+- Фоновое сохранение попыток входа
+- Фоновую очистку просроченных и отозванных refresh токенов
 - Очистку при завершении
 
 """
 
+import asyncio
 import os
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta, timezone
 
 from fastapi import FastAPI
 from alembic import command
@@ -17,6 +22,98 @@ from alembic.config import Config
 
 from backend.shared.database import ConnectionManager, DataBaseConfig
 from backend.shared.logging.logger import get_logger
+from backend.shared.security import calibrate_argon2
+from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.repositories import (
+    SQLLoginAttemptRepository,
+    SQLTokenRepository
+)
+
+
+async def _restore_login_throttle() -> None:
+    """Восстановление счётчиков попыток входа из БД"""
+
+    throttle = container.login_throttle()
+    since = datetime.now(timezone.utc) - timedelta(seconds=throttle.window)
+    async with container.async_session_factory()() as session:
+        throttle.restore(
+            await SQLLoginAttemptRepository(session).get_since(since))
+
+
+async def _flush_login_attempts(batch_size: int) -> None:
+    """Сохранение накопленных попыток входа пачками"""
+
+    throttle = container.login_throttle()
+    async with container.async_session_factory()() as session:
+        repo = SQLLoginAttemptRepository(session)
+        while batch := throttle.drain(batch_size):
+            try:
+                await repo.add_many(batch)
+            except Exception:
+                await session.rollback()
+                throttle.requeue(batch)
+                raise
+    throttle.prune()
+
+
+async def _login_attempt_flusher(interval: float, batch_size: int, logger):
+    """Периодическое сохранение попыток входа"""
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await _flush_login_attempts(batch_size)
+        except Exception as exc:
+            logger.error("Failed to flush login attempts", error=str(exc))
+
+
+async def _purge_tokens(
+    batch_size: int,
+    pause: float,
+    budget: float
+) -> tuple[int, int]:
+    """
+    Удаление токенов пачками с паузой между ними
+
+    Прогон заканчивается, когда пачка неполная (удалять больше нечего)
+    или истёк бюджет времени. Returns: (удалено строк, пачек)
+    """
+
+    deadline = time.monotonic() + budget
+    purged = batches = 0
+    async with container.async_session_factory()() as session:
+        repo = SQLTokenRepository(session)
+        while True:
+            deleted = await repo.purge_batch(
+                datetime.now(timezone.utc), batch_size)
+            purged += deleted
+            batches += 1
+            if deleted < batch_size or time.monotonic() >= deadline:
+                return purged, batches
+            await asyncio.sleep(pause)
+
+
+async def _token_purger(auth_config, logger):
+    """Периодическая очистка refresh токенов"""
+
+    while True:
+        await asyncio.sleep(auth_config.TOKEN_PURGE_INTERVAL_SECONDS)
+        started = time.monotonic()
+        try:
+            purged, batches = await _purge_tokens(
+                auth_config.TOKEN_PURGE_BATCH_SIZE,
+                auth_config.TOKEN_PURGE_BATCH_PAUSE_SECONDS,
+                auth_config.TOKEN_PURGE_TIME_BUDGET_SECONDS
+            )
+        except Exception as exc:
+            logger.error("Failed to purge refresh tokens", error=str(exc))
+            continue
+        logger.info(
+            "Refresh tokens purged",
+            rows=purged,
+            batches=batches,
+            seconds=round(time.monotonic() - started, 3)
+        )
 
 
 @asynccontextmanager
@@ -47,6 +144,39 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to connect to database")
         raise Exception("Не удалось подключиться к базе данных")
 
+    # Метрики пулов соединений и кеша компиляции — до первого запроса
+    container.sync_pool_metrics()
+    container.async_pool_metrics()
+    container.sync_statement_cache_metrics()
+    container.async_statement_cache_metrics()
+
+    # Калибровка стоимости argon2 под железо узла
+    auth_config = container.auth_config()
+    if auth_config.PASSWORD_HASH_TARGET_MS > 0:
+        time_cost = await asyncio.to_thread(
+            calibrate_argon2,
+            auth_config.PASSWORD_HASH_TARGET_MS,
+            auth_config.ARGON2_MEMORY_COST,
+            auth_config.ARGON2_PARALLELISM
+        )
+        container.password_service().reconfigure(
+            time_cost,
+            auth_config.ARGON2_MEMORY_COST,
+            auth_config.ARGON2_PARALLELISM
+        )
+        logger.info("Password hashing calibrated", time_cost=time_cost)
+
+    # Счётчики попыток входа и их фоновое сохранение
+    await _restore_login_throttle()
+    flusher = asyncio.create_task(_login_attempt_flusher(
+        auth_config.LOGIN_ATTEMPT_FLUSH_INTERVAL_SECONDS,
+        auth_config.LOGIN_ATTEMPT_BATCH_SIZE,
+        logger
+    ))
+    purger = None
+    if auth_config.TOKEN_PURGE_INTERVAL_SECONDS > 0:
+        purger = asyncio.create_task(_token_purger(auth_config, logger))
+
     logger.info(
         "User Service started",
         docs_url="http://127.0.0.1:8000/docs",
@@ -57,4 +187,16 @@ async def lifespan(app: FastAPI):
     yield
 
     # Очистка при завершении
+    for task in (flusher, purger):
+        if task is None:
+            continue
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    try:
+        await _flush_login_attempts(auth_config.LOGIN_ATTEMPT_BATCH_SIZE)
+    except Exception as exc:
+        logger.error("Failed to flush login attempts", error=str(exc))
+    container.password_service().shutdown()
+    await container.async_engine().dispose()
     logger.info("User Service shutdown")
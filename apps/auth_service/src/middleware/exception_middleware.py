@@ -11,6 +11,7 @@ from backend.service_user.src.exception import (
     InvalidCredentialsException,
     InvalidTokenException,
     TokenExpiredException,
+    TooManyAttemptsException,
 )
 
 
@@ -59,6 +60,15 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
                     "INVALID_TOKEN"
                 ))
 
+        except TooManyAttemptsException as exc:
+            return JSONResponse(
+                status_code=exc.status_code,
+                content=exc.to_dict(),
+                headers={
+                    "Retry-After": str(exc.details.get("retry_after", 60))
+                }
+            )
+
         except AppException as exc:
             logger.error(
                 "App exception",
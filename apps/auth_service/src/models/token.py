@@ -5,10 +5,12 @@
 from datetime import datetime
 
 from sqlalchemy import (
-    String,
+    LargeBinary,
     Boolean,
     DateTime,
-    ForeignKey
+    ForeignKey,
+    Index,
+    text
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -23,6 +25,19 @@ from backend.shared.models.base_model import BaseModel
 class RefreshToken(BaseModel):
     """Модель refresh token для JWT аутентификации"""
 
+    __table_args__ = (
+        # Отозванные до истечения токены для фоновой очистки
+        # (частичный индекс: в нём только отозванные строки)
+        Index(
+            "ix_refresh_tokens_revoked_id",
+            "id",
+            # Условие как в запросе очистки: в SQLite is_revoked
+            # сравнивается с 1, иначе индекс не подходит к запросу
+            postgresql_where=text("is_revoked"),
+            sqlite_where=text("is_revoked = 1")
+        ),
+    )
+
     user_id: Mapped[UUIDType] = mapped_column(
         ForeignKey(
             "users.id",
@@ -33,12 +48,13 @@ class RefreshToken(BaseModel):
         comment='ID пользователя'
     )
 
-    token: Mapped[str] = mapped_column(
-        String(255),
+    # Хранится только SHA-256 токена: 32 байта вместо JWT
+    # произвольной длины, сам токен в БД не попадает
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         unique=True,
-        index=True,
         nullable=False,
-        comment='Значение токена'
+        comment='SHA-256 значения токена'
     )
 
     is_revoked: Mapped[bool] = mapped_column(
@@ -50,6 +66,7 @@ class RefreshToken(BaseModel):
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        index=True,
         comment='Время истечения'
     )
 
@@ -1,7 +1,9 @@
+from .login_attempt_repository import LoginAttemptRepositoryProtocol
 from .user_repository import UserRepositoryProtocol
 from .token_repository import TokenRepositoryProtocol
 
 __all__ = [
+    "LoginAttemptRepositoryProtocol",
     "UserRepositoryProtocol",
     "TokenRepositoryProtocol"
 ]
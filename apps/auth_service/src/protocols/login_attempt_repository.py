@@ -0,0 +1,20 @@
+
+from datetime import datetime
+from typing import Any, Dict, List, Protocol, Tuple
+
+
+class LoginAttemptRepositoryProtocol(Protocol):
+    """
+    Protocol (интерфейс) для журнала попыток входа
+    """
+
+    async def add_many(self, attempts: List[Dict[str, Any]]) -> None:
+        """Пакетное сохранение попыток"""
+        ...
+
+    async def get_since(
+        self,
+        since: datetime
+    ) -> List[Tuple[str, str, bool, datetime]]:
+        """Попытки начиная с since по времени: (ip, email, успех, время)"""
+        ...
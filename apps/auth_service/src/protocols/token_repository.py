@@ -1,5 +1,6 @@
 
 
+from datetime import datetime
 from typing import Protocol, Optional
 from uuid import UUID
 
@@ -12,28 +13,28 @@ class TokenRepositoryProtocol(Protocol):
     Protocol (интерфейс) для репозитория токенов
     """
 
-    def create_refresh_token(
+    async def create_refresh_token(
         self,
         token_data: RefreshTokenDataDTO
     ) -> RefreshToken:
         """Создание refresh токена"""
         ...
 
-    def get_valid_token(
+    async def get_valid_token(
         self,
         token: str
     ) -> Optional[RefreshToken]:
         """Получение валидного токена"""
         ...
 
-    def revoke_token(self, token: str) -> bool:
+    async def revoke_token(self, token: str) -> bool:
         """Отзыв токена"""
         ...
 
-    def revoke_user_tokens(self, user_id: UUID) -> None:
+    async def revoke_user_tokens(self, user_id: UUID) -> None:
         """Отзыв всех токенов пользователя"""
         ...
 
-    def cleanup_expired_tokens(self) -> int:
-        """Очистка просроченных токенов"""
+    async def purge_batch(self, now: datetime, batch_size: int) -> int:
+        """Удаление пачки просроченных и отозванных токенов"""
         ...
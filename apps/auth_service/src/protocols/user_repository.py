@@ -13,7 +13,7 @@ class UserRepositoryProtocol(Protocol):
     как UserRepositoryProtocol. Не нужно наследоваться!
     """
 
-    def create_user_with_default_role(self, user_data: dict) -> User:
+    async def create_user_with_default_role(self, user_data: dict) -> User:
         """
         Создание пользователя с ролью по умолчанию
 
@@ -22,7 +22,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_user_by_user_name(self, user_name: str) -> Optional[User]:
+    async def get_user_by_user_name(self, user_name: str) -> Optional[User]:
         """
         Поиск пользователя по имени
 
@@ -31,7 +31,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """
         Поиск пользователя по email
 
@@ -40,7 +40,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_user_by_id(self, user_id: UUID) -> Optional[User]:
+    async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """
         Поиск пользователя по ID
 
@@ -49,7 +49,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_active_user_by_user_name(self, user_name: str) -> Optional[User]:
+    async def get_active_user_by_user_name(self, user_name: str) -> Optional[User]:
         """
         Поиск активного пользователя по имени
 
@@ -58,7 +58,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_active_user_by_email(self, email: str) -> Optional[User]:
+    async def get_active_user_by_email(self, email: str) -> Optional[User]:
         """
         Поиск активного пользователя по email
 
@@ -67,7 +67,17 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def activate_user(self, user_id: UUID) -> None:
+    async def update_password_hash(self, user_id: UUID, hashed_password: str) -> None:
+        """
+        Замена хеша пароля (перехеширование при входе)
+
+        :param user_id: ID пользователя
+        :param hashed_password: Новый хеш пароля
+        :return: None
+        """
+        ...
+
+    async def activate_user(self, user_id: UUID) -> None:
         """
         Активация пользователя
 
@@ -1,8 +1,10 @@
 from .sql_user_repository import SQLUserRepository
 from .sql_token_repository import SQLTokenRepository
+from .sql_login_attempt_repository import SQLLoginAttemptRepository
 
 __all__ = [
     "SQLUserRepository",
     "SQLRoleRepository",
-    "SQLTokenRepository"
+    "SQLTokenRepository",
+    "SQLLoginAttemptRepository"
 ]
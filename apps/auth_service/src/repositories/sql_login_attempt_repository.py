@@ -0,0 +1,43 @@
+"""
+Репозиторий для журнала попыток входа
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.service_user.src.models.login_attempt import LoginAttempt
+
+
+class SQLLoginAttemptRepository:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add_many(self, attempts: List[Dict[str, Any]]) -> None:
+        """Пакетная вставка попыток (один executemany)"""
+
+        if not attempts:
+            return
+        await self.db.execute(insert(LoginAttempt), attempts)
+        await self.db.commit()
+
+    async def get_since(
+        self,
+        since: datetime
+    ) -> List[Tuple[str, str, bool, datetime]]:
+        """Попытки начиная с since по времени: (ip, email, успех, время)"""
+
+        result = await self.db.execute(
+            select(
+                LoginAttempt.ip_address,
+                LoginAttempt.email,
+                LoginAttempt.is_successful,
+                LoginAttempt.created_at
+            ).where(
+                LoginAttempt.created_at >= since
+            ).order_by(LoginAttempt.created_at)
+        )
+        return result.all()
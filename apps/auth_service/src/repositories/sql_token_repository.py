@@ -1,24 +1,43 @@
 """
 Репозиторий для работы с refresh токенами
+
+В БД хранится только SHA-256 токена; поиск и отзыв — по дайджесту
 """
 
+import hashlib
 from typing import Optional
 from datetime import datetime, timezone
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import Select, bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from backend.service_user.src.models.token import RefreshToken
 from backend.service_user.src.schemas.auth.auth_dto import RefreshTokenDataDTO
 
+# Условие действующего токена (параметры: digest, now)
+_IS_VALID = (
+    RefreshToken.token_hash == bindparam("digest"),
+    RefreshToken.is_revoked.is_(False),
+    RefreshToken.expires_at > bindparam("now")
+)
+# Поиск и отзыв действующего токена собраны один раз
+_VALID_TOKEN = select(RefreshToken).where(*_IS_VALID)
+_REVOKE_TOKEN = update(RefreshToken).where(*_IS_VALID).values(is_revoked=True)
+
+
+def token_digest(token: str) -> bytes:
+    """ SHA-256 токена — ключ хранения и поиска """
+
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
 
 class SQLTokenRepository:
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_refresh_token(
+    async def create_refresh_token(
         self,
         token_data: RefreshTokenDataDTO
     ) -> RefreshToken:
@@ -26,52 +45,76 @@ class SQLTokenRepository:
 
         refresh_token = RefreshToken(
             user_id=token_data.user_id,
-            token=token_data.token,
+            token_hash=token_digest(token_data.token),
             expires_at=token_data.expires_at
         )
         self.db.add(refresh_token)
-        self.db.commit()
-        self.db.refresh(refresh_token)
+        await self.db.commit()
+        await self.db.refresh(refresh_token)
         return refresh_token
 
-    def get_valid_token(
+    async def get_valid_token(
         self,
         token: str
     ) -> Optional[RefreshToken]:
         """Получение валидного токена"""
 
-        return self.db.query(RefreshToken).filter(
-            and_(
-                RefreshToken.token == token,
-                RefreshToken.is_revoked.is_(False),
-                RefreshToken.expires_at > datetime.now(timezone.utc)
-            )
-        ).first()
+        return await self.db.scalar(
+            _VALID_TOKEN,
+            {"digest": token_digest(token), "now": datetime.now(timezone.utc)}
+        )
 
-    def revoke_token(self, token: str) -> bool:
+    async def revoke_token(self, token: str) -> bool:
         """Отзыв токена"""
 
-        refresh_token = self.get_valid_token(token)
-        if refresh_token:
-            refresh_token.is_revoked = True
-            self.db.commit()
-            return True
-        return False
+        result = await self.db.execute(
+            _REVOKE_TOKEN,
+            {"digest": token_digest(token), "now": datetime.now(timezone.utc)},
+            execution_options={"synchronize_session": False}
+        )
+        await self.db.commit()
+        return result.rowcount > 0
 
-    def revoke_user_tokens(self, user_id: UUID) -> None:
+    async def revoke_user_tokens(self, user_id: UUID) -> None:
         """Отзыв всех токенов пользователя"""
 
-        self.db.query(RefreshToken).filter(
-            RefreshToken.user_id == user_id
-        ).update({"is_revoked": True})
-        self.db.commit()
+        await self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id)
+            .values(is_revoked=True)
+        )
+        await self.db.commit()
 
-    def cleanup_expired_tokens(self) -> int:
-        """Очистка просроченных токенов"""
+    async def purge_batch(self, now: datetime, batch_size: int) -> int:
+        """
+        Удаление пачки просроченных, затем отозванных токенов
 
-        expired_count = self.db.query(RefreshToken).filter(
-            RefreshToken.expires_at < datetime.now(timezone.utc)
-        ).delete()
+        Ключи пачки выбираются по индексу (expires_at или частичному
+        индексу отозванных), поэтому каждая транзакция короткая
+        """
 
-        self.db.commit()
-        return expired_count
+        deleted = await self._delete_ids(
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < now)
+            .order_by(RefreshToken.expires_at)
+            .limit(batch_size)
+        )
+        if deleted < batch_size:
+            # Условие совпадает с условием частичного индекса,
+            # порядок по id — его ключ: пачка читается из индекса
+            deleted += await self._delete_ids(
+                select(RefreshToken.id)
+                .where(RefreshToken.is_revoked)
+                .order_by(RefreshToken.id)
+                .limit(batch_size - deleted)
+            )
+        await self.db.commit()
+        return deleted
+
+    async def _delete_ids(self, ids: Select) -> int:
+        result = await self.db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.id.in_(ids.scalar_subquery())),
+            execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
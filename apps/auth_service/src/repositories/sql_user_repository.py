@@ -2,21 +2,29 @@
 SQLAlchemy реализация репозитория пользователей
 """
 
+from typing import Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.service_user.src.exception.base import ConflictException
 from backend.service_user.src.models.user import User
 from backend.shared.models.enums import ROLES
 
+# Частые выборки собраны один раз, параметры передаются при выполнении
+_BY_USER_NAME = select(User).where(User.user_name == bindparam("user_name"))
+_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_ACTIVE_BY_USER_NAME = _BY_USER_NAME.where(User.is_active.is_(True))
+_ACTIVE_BY_EMAIL = _BY_EMAIL.where(User.is_active.is_(True))
+
 
 class SQLUserRepository:
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_user_with_default_role(self, user_data: dict) -> User:
+    async def create_user_with_default_role(self, user_data: dict) -> User:
         """
         Создание пользователя с ролью по умолчанию.
 
@@ -48,40 +56,52 @@ class SQLUserRepository:
         user = User(**user_data)
 
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         return user
 
-    def get_user_by_user_name(self, user_name: str):
+    async def get_user_by_user_name(self, user_name: str) -> Optional[User]:
         """Поиск пользователя по имени"""
-        return self.db.query(User).filter(User.user_name == user_name).first()
+        return await self.db.scalar(_BY_USER_NAME, {"user_name": user_name})
 
-    def get_user_by_email(self, email: str):
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """Поиск пользователя по email"""
-        return self.db.query(User).filter(User.email == email).first()
+        return await self.db.scalar(_BY_EMAIL, {"email": email})
 
-    def get_user_by_id(self, user_id: UUID):
+    async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """Поиск пользователя по ID"""
-        return self.db.query(User).filter(User.id == user_id).first()
+        return await self.db.get(User, user_id)
 
-    def get_active_user_by_user_name(self, user_name: str):
+    async def get_active_user_by_user_name(
+        self,
+        user_name: str
+    ) -> Optional[User]:
         """Поиск активного пользователя по имени"""
-        return self.db.query(User).filter(
-            User.user_name == user_name,
-            User.is_active is True
-        ).first()
+        return await self.db.scalar(
+            _ACTIVE_BY_USER_NAME, {"user_name": user_name})
 
-    def get_active_user_by_email(self, email: str):
+    async def get_active_user_by_email(self, email: str) -> Optional[User]:
         """Поиск активного пользователя по email"""
-        user = self.db.query(User).filter(
-            User.email == email,
-            User.is_active is True
-        ).first()
-
-        return user
-
-    def activate_user(self, user_id: UUID):
+        return await self.db.scalar(_ACTIVE_BY_EMAIL, {"email": email})
+
+    async def update_password_hash(
+        self,
+        user_id: UUID,
+        hashed_password: str
+    ) -> None:
+        """Замена хеша пароля"""
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(hashed_password=hashed_password)
+        )
+        await self.db.commit()
+
+    async def activate_user(self, user_id: UUID) -> None:
         """Активация пользователя"""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        user.is_active is True
-        self.db.commit()
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=True)
+        )
+        await self.db.commit()
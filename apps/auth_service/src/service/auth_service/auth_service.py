@@ -11,6 +11,7 @@ from backend.service_user.src.exception import (
     InvalidCredentialsException)
 from backend.service_user.src.config import AuthConfig
 from backend.service_user.src.core import (
+    LoginThrottle,
     PasswordService,
     JWTService,
     AuthValidator
@@ -35,7 +36,8 @@ class AuthService:
         auth_config: AuthConfig,
         auth_validator: AuthValidator,
         mapper: AuthMapper,
-        token_repo: TokenRepositoryProtocol
+        token_repo: TokenRepositoryProtocol,
+        login_throttle: LoginThrottle
     ):
         self.user_repo = user_repo
         self.password_service = password_service
@@ -44,44 +46,76 @@ class AuthService:
         self.auth_validator = auth_validator
         self.mapper = mapper
         self.token_repo = token_repo
+        self.login_throttle = login_throttle
 
-    def authenticate_and_create_tokens(
+    async def authenticate_and_create_tokens(
         self,
         email: str,
-        password: str
+        password: str,
+        ip_address: str,
+        user_agent: Optional[str] = None
     ) -> Optional[TokenPairDTO]:
         """
         Аутентификация и создание токенов
         Возвращает: TokenPairDTO или None при ошибке
         """
-        # Шаг 1: Аутентификация пользователя
-        user = self.user_repo.get_user_by_email(email)
-
-        # Шаг 2: Валидация пароля
-        if not self._verify_password(password, user):
-            raise InvalidCredentialsException()
-
-        # Шаг 3: Валидация пользователя
-        if not self.auth_validator.validate_user_for_auth(user):
+        # Шаг 0: Лимит попыток (резерв до дорогой проверки хеша)
+        reserved_at = self.login_throttle.check(ip_address, email)
+
+        try:
+            # Шаг 1: Аутентификация пользователя
+            user = await self.user_repo.get_user_by_email(email)
+
+            # Шаг 2: Валидация пароля
+            failure_reason = None
+            if not await self._verify_password(password, user):
+                failure_reason = "invalid_credentials"
+
+            # Шаг 3: Валидация пользователя
+            elif not self.auth_validator.validate_user_for_auth(user):
+                failure_reason = "user_inactive"
+        except Exception:
+            # Пароль не проверен (БД, 503 пула хеширования): не попытка
+            self.login_throttle.release(ip_address, email, reserved_at)
+            raise
+
+        self.login_throttle.record(
+            ip_address,
+            email,
+            is_successful=failure_reason is None,
+            reserved_at=reserved_at,
+            user_id=user.id if user else None,
+            user_agent=user_agent,
+            failure_reason=failure_reason
+        )
+        if failure_reason:
             raise InvalidCredentialsException()
 
         # Шаг 4: Создание токенов
-        return self.create_tokens(user)
+        return await self.create_tokens(user)
 
-    def _verify_password(
+    async def _verify_password(
         self,
         password: str,
         user: Optional[User]
     ) -> bool:
-        """Проверка пароля"""
+        """
+        Проверка пароля (argon2 не блокирует event loop)
+
+        Устаревший хеш (bcrypt или старые параметры argon2)
+        перезаписывается новым после успешной проверки
+        """
         if not user:
             return False
-        return self.password_service.verify_password(
+        is_valid, new_hash = await self.password_service.verify_and_update_async(
             password,
             user.hashed_password
         )
+        if is_valid and new_hash:
+            await self.user_repo.update_password_hash(user.id, new_hash)
+        return is_valid
 
-    def create_tokens(self, user: User) -> TokenPairDTO:
+    async def create_tokens(self, user: User) -> TokenPairDTO:
         """Создание пары токенов"""
         # Access токен
         access_token = self.jwt_service.create_access_token({
@@ -105,28 +139,28 @@ class AuthService:
             )
         )
 
-        self.token_repo.create_refresh_token(refresh_data)
+        await self.token_repo.create_refresh_token(refresh_data)
 
         return self.mapper.to_token_pair(
             access_token,
             refresh_token
         )
 
-    def refresh_access_token(
+    async def refresh_access_token(
         self,
         refresh_token: str
     ) -> Optional[TokenPairDTO]:
         """Обновление токенов"""
 
-        valid_token = self.token_repo.get_valid_token(refresh_token)
+        valid_token = await self.token_repo.get_valid_token(refresh_token)
 
         if not valid_token:
             return None
 
-        user = self.user_repo.get_user_by_id(valid_token.user_id)
+        user = await self.user_repo.get_user_by_id(valid_token.user_id)
 
         if not user:
             return None
 
-        self.token_repo.revoke_token(refresh_token)
-        return self.create_tokens(user)
+        await self.token_repo.revoke_token(refresh_token)
+        return await self.create_tokens(user)
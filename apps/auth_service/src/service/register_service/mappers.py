@@ -15,10 +15,13 @@ class UserRegistrationMapper:
     def __init__(self, password_service: PasswordService):
         self.password_service = password_service
 
-    def api_to_dto(self, user_create: UserCreate) -> UserRegistrationDTO:
+    async def api_to_dto(
+        self,
+        user_create: UserCreate
+    ) -> UserRegistrationDTO:
         """Конвертация API схемы во внутренний DTO"""
 
-        hashed_password = self.password_service.hash_password(
+        hashed_password = await self.password_service.hash_password_async(
             user_create.password)
 
         return UserRegistrationDTO(
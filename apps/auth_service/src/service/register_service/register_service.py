@@ -30,7 +30,7 @@ class RegisterService:
         self.validator = UserUniquenessValidator(user_repo)
         self.mapper = UserRegistrationMapper(password_service)
 
-    def register_user(self, user_data: UserCreate) -> UserResponseDTO:
+    async def register_user(self, user_data: UserCreate) -> UserResponseDTO:
         """
         Регистрация пользователя
         Returns:
@@ -38,16 +38,16 @@ class RegisterService:
         """
 
         # 1. Валидация
-        self.validator.validate(
+        await self.validator.validate(
             user_data.user_name,
             user_data.email
         )
 
         # 2. Маппинг (хеширование пароля)
-        user_dto = self.mapper.api_to_dto(user_data)
+        user_dto = await self.mapper.api_to_dto(user_data)
 
         # 3. Создание
-        user = self.user_repo.create_user_with_default_role(
+        user = await self.user_repo.create_user_with_default_role(
             user_dto.to_repository_dict())
 
         # 4. Возврат DTO
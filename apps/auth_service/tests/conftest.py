@@ -0,0 +1,138 @@
+"""
+Общие фикстуры тестов.
+
+Каждый тест получает пустую SQLite БД (aiosqlite) во временном каталоге
+со схемой из ORM моделей. statement_log считает SQL, который движок
+отправляет в драйвер, — на нём построены тесты числа запросов.
+
+Тесты синхронные: сценарий целиком выполняется в asyncio.run,
+движок создаётся и закрывается внутри одного event loop.
+"""
+
+# Импорты для асинхронных контекстных менеджеров
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+
+import pytest
+# Импорты генерации тестовых ключей подписи
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+# Импорты SQLAlchemy: события движка и асинхронный движок
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+# Импорты модуля JWT (кольцо ключей и кеш проверенных токенов)
+from backend.src.app.core import security
+from backend.src.app.core.keyring import KeyRing
+# Импорты базы моделей (пакет models регистрирует все таблицы)
+from backend.src.app.models import BaseModel
+
+
+class StatementLog:
+    """
+    SQL, выполненный движком, пока лог подключён.
+
+    Attributes:
+        statements: Текст каждого выполненного выражения.
+        parameters: Параметры каждого выражения (в том же порядке).
+        commits: Число COMMIT, отправленных в драйвер.
+        rollbacks: Число ROLLBACK, отправленных в драйвер.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+        self.statements: list[str] = []
+        self.parameters: list = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def __enter__(self) -> "StatementLog":
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        event.listen(self._engine, "commit", self._on_commit)
+        event.listen(self._engine, "rollback", self._on_rollback)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+        event.remove(self._engine, "commit", self._on_commit)
+        event.remove(self._engine, "rollback", self._on_rollback)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    def _on_commit(self, conn) -> None:
+        self.commits += 1
+
+    def _on_rollback(self, conn) -> None:
+        self.rollbacks += 1
+
+    def of_kind(self, keyword: str) -> list[str]:
+        """Выражения, начинающиеся с keyword (SELECT, INSERT, ...)."""
+        return [
+            statement for statement in self.statements
+            if statement.lstrip().upper().startswith(keyword)
+        ]
+
+
+@pytest.fixture
+def database(tmp_path) -> Callable[[], AsyncIterator[AsyncEngine]]:
+    """
+    Фабрика движка над пустой БД со схемой моделей.
+
+    Использование: `async with database() as engine: ...`
+    """
+
+    @asynccontextmanager
+    async def open_database() -> AsyncIterator[AsyncEngine]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.create_all)
+        try:
+            yield engine
+        finally:
+            await engine.dispose()
+
+    return open_database
+
+
+@pytest.fixture
+def statement_log() -> Callable[[AsyncEngine], StatementLog]:
+    """Фабрика StatementLog: `with statement_log(engine) as log: ...`"""
+    return StatementLog
+
+
+@pytest.fixture
+def jwt_keys(tmp_path, monkeypatch) -> Iterator[KeyRing]:
+    """
+    Кольцо ключей приложения над свежей парой RS256 во временном каталоге.
+
+    Как в приложении, замена ключа сбрасывает кеш проверенных токенов;
+    кеш очищается и до, и после теста.
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_path = tmp_path / "private.pem"
+    public_path = tmp_path / "public.pem"
+    private_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    public_path.write_bytes(key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ))
+    keyring = KeyRing(
+        backend=security.jwt_backend,
+        algorithm="RS256",
+        signing_kid="primary",
+        private_key_path=private_path,
+        public_key_paths={"primary": public_path},
+        check_interval=0.0,
+        on_change=security.token_cache.clear,
+    )
+    monkeypatch.setattr(security, "keyring", keyring)
+    monkeypatch.setattr(security.settings, "JWT_ALGORITHM", "RS256")
+    security.token_cache.clear()
+    yield keyring
+    security.token_cache.clear()
@@ -0,0 +1,75 @@
+"""
+Бэкенды JWT взаимозаменяемы: токен, подписанный одним бэкендом,
+проверяется другим — смена JWT_BACKEND не разлогинивает клиентов.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from backend.shared.security import TokenError, get_jwt_backend
+
+_BACKENDS = ["jose", "pyjwt"]
+
+
+def _pem_pair(algorithm: str) -> tuple[str, str]:
+    if algorithm == "RS256":
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem.decode(), public_pem.decode()
+
+
+@pytest.fixture(scope="module", params=["RS256", "ES256"])
+def keys(request) -> tuple[str, str, str]:
+    return (request.param, *_pem_pair(request.param))
+
+
+@pytest.mark.parametrize("signer", _BACKENDS)
+@pytest.mark.parametrize("verifier", _BACKENDS)
+def test_backends_read_each_others_tokens(keys, signer, verifier):
+    algorithm, private_pem, public_pem = keys
+    sign, verify = get_jwt_backend(signer), get_jwt_backend(verifier)
+    exp = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+    token = sign.encode(
+        {"sub": "ann@example.com", "exp": exp},
+        sign.load_private_key(private_pem, algorithm),
+        algorithm=algorithm,
+        headers={"kid": "primary"},
+    )
+
+    assert verify.get_unverified_header(token)["kid"] == "primary"
+    claims = verify.decode(
+        token, verify.load_public_key(public_pem, algorithm), algorithms=[algorithm]
+    )
+    assert claims == {"sub": "ann@example.com", "exp": int(exp.timestamp())}
+
+
+@pytest.mark.parametrize("verifier", _BACKENDS)
+def test_tampered_token_is_rejected_by_both(keys, verifier):
+    algorithm, private_pem, public_pem = keys
+    backend = get_jwt_backend(verifier)
+    token = backend.encode(
+        {"sub": "ann@example.com"},
+        backend.load_private_key(private_pem, algorithm),
+        algorithm=algorithm,
+    )
+    header, payload, signature = token.split(".")
+    forged = ".".join([header, payload, signature[::-1]])
+
+    with pytest.raises(TokenError):
+        backend.decode(
+            forged, backend.load_public_key(public_pem, algorithm), algorithms=[algorithm]
+        )
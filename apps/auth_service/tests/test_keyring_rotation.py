@@ -0,0 +1,109 @@
+"""
+Кеш проверенных токенов и ротация ключей: замена или удаление файла
+ключа сбрасывает кеш, и токен, подписанный выведенным ключом, больше
+не принимается из кеша. Статистика обоих кешей видна в /metrics/db.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from backend.shared.security import TokenError
+from backend.src.app.application import create_app
+from backend.src.app.core import security
+from backend.src.app.core.keyring import KeyRing
+
+EMAIL = "ann@example.com"
+
+
+def _write_pair(private_path: Path, public_path: Path) -> None:
+    """Новая пара RS256 на место старой (новый inode, как при выкладке)."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    for path, pem in (
+        (private_path, key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )),
+        (public_path, key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )),
+    ):
+        staged = path.with_suffix(".new")
+        staged.write_bytes(pem)
+        os.replace(staged, path)
+
+
+def test_unchanged_keys_keep_cached_tokens(jwt_keys):
+    token = security.create_access_token(EMAIL)
+    security.decode_token_cached(token)
+    security.decode_token_cached(token)
+
+    stats = security.token_cache.stats()
+    assert (stats["size"], stats["hits"]) == (1, 1)
+
+
+def test_rotated_key_clears_cache_and_rejects_old_tokens(jwt_keys, tmp_path):
+    token = security.create_access_token(EMAIL)
+    assert security.decode_token_cached(token)["sub"] == EMAIL
+
+    _write_pair(tmp_path / "private.pem", tmp_path / "public.pem")
+
+    with pytest.raises(TokenError):
+        security.decode_token_cached(token)
+    fresh = security.create_access_token(EMAIL)
+    assert security.decode_token_cached(fresh)["sub"] == EMAIL
+    assert security.token_cache.stats()["size"] == 1
+
+
+def test_dropped_kid_clears_cache(jwt_keys, tmp_path, monkeypatch):
+    retired_private, retired_public = tmp_path / "old.key", tmp_path / "old.pub"
+    _write_pair(retired_private, retired_public)
+    keyring = KeyRing(
+        backend=security.jwt_backend,
+        algorithm="RS256",
+        signing_kid="primary",
+        private_key_path=tmp_path / "private.pem",
+        public_key_paths={"primary": tmp_path / "public.pem", "old": retired_public},
+        check_interval=0.0,
+        on_change=security.token_cache.clear,
+    )
+    monkeypatch.setattr(security, "keyring", keyring)
+    retired_token = security.jwt_backend.encode(
+        {"sub": EMAIL, "exp": 4_102_444_800},
+        security.jwt_backend.load_private_key(retired_private.read_text(), "RS256"),
+        algorithm="RS256",
+        headers={"kid": "old"},
+    )
+    token = security.create_access_token(EMAIL)
+    security.decode_token_cached(retired_token)
+    security.decode_token_cached(token)
+
+    retired_public.unlink()
+    keyring.refresh()
+
+    assert security.token_cache.stats()["size"] == 0
+    # Токен выведенного ключа больше не берётся из кеша
+    with pytest.raises(FileNotFoundError):
+        security.decode_token_cached(retired_token)
+    assert security.decode_token_cached(token)["sub"] == EMAIL
+
+
+def test_metrics_report_token_and_principal_caches():
+    async def scenario():
+        transport = httpx.ASGITransport(app=create_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/v1/metrics/db")
+
+    response = asyncio.run(scenario())
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert {"size", "hits", "misses", "evictions"} <= body["token_cache"].keys()
+    assert {"size", "hits", "misses", "invalidations"} <= body["principal_cache"].keys()
@@ -0,0 +1,62 @@
+"""
+Метрики пула: ожидание считается только при исчерпанном пуле,
+замер выдачи переживает engine.dispose().
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from backend.shared.metrics import PoolMetrics
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=QueuePool,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_opening_connections_below_capacity_is_not_a_wait(engine):
+    metrics = PoolMetrics("test").attach(engine)
+
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot()
+    assert (snapshot["checkouts"], snapshot["connects"]) == (2, 2)
+    assert snapshot["waits"] == 0
+
+
+def test_exhausted_pool_counts_wait_and_timeout(engine):
+    metrics = PoolMetrics("test").attach(engine)
+
+    with engine.connect(), engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    snapshot = metrics.snapshot()
+    assert (snapshot["waits"], snapshot["timeouts"]) == (1, 1)
+    assert snapshot["wait_seconds_max"] >= 0.05
+
+
+def test_acquire_timing_survives_dispose(engine):
+    metrics = PoolMetrics("test").attach(engine)
+    engine.dispose()
+
+    with engine.connect(), engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["timeouts"] == 1
+    assert snapshot["size"] == 2
@@ -0,0 +1,180 @@
+"""
+Инвалидация кеша субъектов: изменения пользователя сбрасывают снимок
+в этом воркере сразу и ещё раз после COMMIT, канал доносит сброс до
+остальных кешей, а ошибка обработчика не останавливает подписку Redis.
+"""
+
+import asyncio
+import logging
+
+import httpx
+import pytest
+from starlette.requests import Request
+
+from backend.src.app.application import create_app
+from backend.src.app.core import database as db
+from backend.src.app.core.constants import Role
+from backend.src.app.core.principal import Principal
+from backend.src.app.core.principal_cache import (
+    LocalInvalidationChannel,
+    PrincipalCache,
+    RedisInvalidationChannel,
+    principal_cache,
+)
+from backend.src.app.core.security import create_access_token
+from backend.src.app.models import User
+from backend.src.app.repositories.user import UserRepository
+
+EMAIL = "ann@example.com"
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": [], "client": ("10.0.0.1", 5000)})
+
+
+def _principal(user: User) -> Principal:
+    return Principal(user.id, user.email, user.role, user.is_active)
+
+
+@pytest.fixture(autouse=True)
+def _empty_principal_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture
+def use_engine(monkeypatch):
+    """Зависимости core.database над тестовым движком, без реплик."""
+
+    def use(engine) -> None:
+        monkeypatch.setattr(
+            db, "async_session_factory", db._create_session_factory(engine)
+        )
+        monkeypatch.setattr(
+            db,
+            "read_only_session_factory",
+            db._create_session_factory(engine, read_only=True),
+        )
+        monkeypatch.setattr(db, "replicas", db.ReplicaSet([], eject_seconds=30))
+
+    return use
+
+
+async def _seed(engine) -> tuple[User, User]:
+    async with db._create_session_factory(engine)() as session:
+        ann = User(first_name="Ann", last_name="Lee", email=EMAIL, password_hash="x")
+        admin = User(
+            first_name="Root", last_name="Admin", email="root@example.com",
+            password_hash="x", role=Role.ADMIN,
+        )
+        session.add_all([ann, admin])
+        await session.commit()
+        return ann, admin
+
+
+@pytest.mark.parametrize("fields", [{"first_name": "Anna"}, {"is_active": False}])
+def test_update_fields_drops_principal_now_and_after_commit(database, use_engine, fields):
+    async def scenario():
+        async with database() as engine:
+            ann, _ = await _seed(engine)
+            use_engine(engine)
+            stale = _principal(ann)
+            principal_cache.put(EMAIL, stale)
+
+            sessions = db.get_session(_request())
+            session = await sessions.__anext__()
+            user = await UserRepository(session).get_by_id(ann.id)
+            await UserRepository(session).update_fields(user, **fields)
+            dropped_before_commit = principal_cache.get(EMAIL) is None
+            # Параллельный запрос успел перечитать старую строку до COMMIT
+            principal_cache.put(EMAIL, stale)
+            with pytest.raises(StopAsyncIteration):
+                await sessions.__anext__()
+            return dropped_before_commit, principal_cache.get(EMAIL), session.info
+
+    dropped_before_commit, cached, info = asyncio.run(scenario())
+
+    assert dropped_before_commit
+    assert cached is None
+    assert "stale_principals" not in info
+
+
+def test_deactivated_user_is_rejected_on_next_request(database, use_engine, jwt_keys):
+    async def scenario():
+        async with database() as engine:
+            ann, admin = await _seed(engine)
+            use_engine(engine)
+            principal_cache.put(EMAIL, _principal(ann))
+            transport = httpx.ASGITransport(app=create_app())
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                deleted = await client.delete(
+                    f"/api/v1/users/{ann.id}",
+                    headers={"Authorization": f"Bearer {create_access_token(admin.email)}"},
+                )
+                cached = principal_cache.get(EMAIL)
+                me = await client.get(
+                    "/api/v1/auth/me",
+                    headers={"Authorization": f"Bearer {create_access_token(EMAIL)}"},
+                )
+            return deleted, cached, me
+
+    deleted, cached, me = asyncio.run(scenario())
+
+    assert deleted.status_code == 204, deleted.text
+    assert cached is None
+    assert me.status_code == 401
+
+
+def test_local_channel_reaches_second_cache():
+    async def scenario():
+        channel = LocalInvalidationChannel()
+        caches = [PrincipalCache(max_size=10, ttl=60, channel=channel) for _ in range(2)]
+        principal = Principal(None, EMAIL, Role.USER, True)
+        for cache in caches:
+            await cache.start()
+            cache.put(EMAIL, principal)
+            cache.put("bob@example.com", principal)
+
+        await caches[0].invalidate_everywhere([EMAIL])
+        await caches[0].stop()
+        return caches
+
+    first, second = asyncio.run(scenario())
+
+    for cache in (first, second):
+        assert cache.get(EMAIL) is None
+        assert cache.get("bob@example.com") is not None
+        assert cache.stats()["invalidations"] == 1
+
+
+class _PubSub:
+    """Подписка Redis с заранее заданными сообщениями."""
+
+    def __init__(self, subjects: list[str]) -> None:
+        self._subjects = subjects
+
+    async def listen(self):
+        for subject in self._subjects:
+            yield {"type": "message", "data": subject}
+
+
+def test_redis_listener_survives_handler_error(caplog):
+    handled = []
+
+    async def handler(subject: str) -> None:
+        if subject == "broken@example.com":
+            raise RuntimeError("boom")
+        handled.append(subject)
+
+    # Без подключения к Redis: проверяется только цикл подписки
+    channel = RedisInvalidationChannel.__new__(RedisInvalidationChannel)
+    pubsub = _PubSub([EMAIL, "broken@example.com", "bob@example.com"])
+
+    with caplog.at_level(logging.ERROR, logger="task_manager.principal_cache"):
+        asyncio.run(channel._listen(pubsub, handler))
+
+    assert handled == [EMAIL, "bob@example.com"]
+    assert "broken@example.com" in caplog.text
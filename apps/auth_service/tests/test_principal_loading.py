@@ -0,0 +1,111 @@
+"""
+Загрузка субъекта для авторизации: один узкий SELECT без коллекций задач.
+"""
+
+import asyncio
+import re
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from backend.src.app.core.constants import TaskStatus, TokenType
+from backend.src.app.core.database import _create_session_factory
+from backend.src.app.core.principal_cache import principal_cache
+from backend.src.app.models import Task, User
+from backend.src.app.repositories.user import UserRepository
+from backend.src.app.services.auth import service as auth_service
+
+EMAIL = "heavy@example.com"
+TASKS_TABLE = re.compile(r"\btasks\b")
+
+
+async def _seed_heavy_user(session, tasks: int) -> User:
+    """Пользователь с задачами в обеих коллекциях (assigned и completed)."""
+    user = User(
+        first_name="Heavy", last_name="User", email=EMAIL, password_hash="x"
+    )
+    session.add(user)
+    await session.flush()
+    session.add_all(
+        Task(
+            title=f"task {i}",
+            status=TaskStatus.COMPLETED,
+            assigned_to_id=user.id,
+            completed_by_id=user.id,
+        )
+        for i in range(tasks)
+    )
+    await session.commit()
+    return user
+
+
+@pytest.fixture(autouse=True)
+def _empty_principal_cache():
+    principal_cache.invalidate(EMAIL)
+    yield
+    principal_cache.invalidate(EMAIL)
+
+
+def test_get_principal_is_one_select_of_user_columns(database, statement_log):
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            async with factory() as session:
+                user = await _seed_heavy_user(session, tasks=50)
+            async with factory() as session:
+                with statement_log(engine) as log:
+                    principal = await UserRepository(session).get_principal(EMAIL)
+            return user, principal, log
+
+    user, principal, log = asyncio.run(scenario())
+
+    assert (principal.id, principal.email, principal.is_active) == (user.id, EMAIL, True)
+    assert len(log.statements) == 1
+    assert not TASKS_TABLE.search(log.statements[0])
+
+
+def test_get_by_email_does_not_load_task_collections(database, statement_log):
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            async with factory() as session:
+                await _seed_heavy_user(session, tasks=50)
+            async with factory() as session:
+                with statement_log(engine) as log:
+                    user = await UserRepository(session).get_by_email(EMAIL)
+                    # Коллекции загружаются только явно (raise_on_sql)
+                    with pytest.raises(InvalidRequestError):
+                        user.assigned_tasks
+            return log
+
+    log = asyncio.run(scenario())
+
+    assert len(log.statements) == 1
+    assert not any(TASKS_TABLE.search(s) for s in log.statements)
+
+
+def test_get_current_user_queries_once_then_hits_cache(database, statement_log, monkeypatch):
+    monkeypatch.setattr(
+        auth_service,
+        "decode_token_cached",
+        lambda token: {"type": TokenType.ACCESS, "sub": EMAIL},
+    )
+
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            async with factory() as session:
+                await _seed_heavy_user(session, tasks=50)
+            counts = []
+            for _ in range(2):
+                async with factory() as session:
+                    service = auth_service.AuthService(UserRepository(session))
+                    with statement_log(engine) as log:
+                        principal = await service.get_current_user("token")
+                    counts.append(len(log.statements))
+            return principal, counts
+
+    principal, counts = asyncio.run(scenario())
+
+    assert principal.email == EMAIL
+    assert counts == [1, 0]
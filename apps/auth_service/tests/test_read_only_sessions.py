@@ -0,0 +1,165 @@
+"""
+Маршруты только на чтение: сессия get_read_session не открывает
+транзакцию и не фиксирует её — ни BEGIN, ни COMMIT не доходят до БД,
+в том числе при загрузке текущего пользователя мимо кеша субъектов.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.util import await_only
+from starlette.requests import Request
+
+from backend.src.app.application import create_app
+from backend.src.app.core import database as db
+from backend.src.app.core.principal_cache import principal_cache
+from backend.src.app.core.security import create_access_token
+from backend.src.app.models import Task, User
+from backend.src.app.repositories.task import TaskRepository
+from backend.src.app.repositories.user import UserRepository
+
+
+def _request() -> Request:
+    return Request({"type": "http", "headers": [], "client": ("10.0.0.1", 5000)})
+
+
+class DriverTrace:
+    """
+    SQL, который выполнил сам SQLite, включая неявные BEGIN/COMMIT
+    драйвера (sqlite3 trace callback). Подключается до первого соединения.
+    """
+
+    def __init__(self, engine) -> None:
+        self.statements: list[str] = []
+        event.listen(engine.sync_engine, "connect", self._on_connect)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        await_only(dbapi_connection._connection.set_trace_callback(self.statements.append))
+
+    def transaction_control(self) -> list[str]:
+        return [
+            statement for statement in self.statements
+            if statement.split()[0].upper() in ("BEGIN", "COMMIT", "ROLLBACK")
+        ]
+
+
+@pytest.fixture
+def use_engine(monkeypatch):
+    """Зависимости core.database над тестовым движком, без реплик."""
+
+    def use(engine) -> None:
+        monkeypatch.setattr(
+            db, "async_session_factory", db._create_session_factory(engine)
+        )
+        monkeypatch.setattr(
+            db,
+            "read_only_session_factory",
+            db._create_session_factory(engine, read_only=True),
+        )
+        monkeypatch.setattr(db, "replicas", db.ReplicaSet([], eject_seconds=30))
+
+    return use
+
+
+async def _seed(engine) -> Task:
+    async with db._create_session_factory(engine)() as session:
+        user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+        session.add(user)
+        await session.flush()
+        task = Task(title="seeded", created_by_id=user.id)
+        session.add(task)
+        await session.commit()
+        return task
+
+
+async def _read(session, task_id) -> None:
+    """Чтения GET маршрутов: задача по id и список пользователей."""
+    assert await TaskRepository(session).get_by_id(task_id) is not None
+    assert await UserRepository(session).get_all()
+
+
+def _run_reads(database, statement_log, use_engine, dependency):
+    async def scenario():
+        async with database() as engine:
+            task = await _seed(engine)
+            await engine.dispose()
+            trace = DriverTrace(engine)
+            use_engine(engine)
+            with statement_log(engine) as log:
+                async with asynccontextmanager(dependency)(_request()) as session:
+                    await _read(session, task.id)
+                    connection = await session.connection()
+                    isolation = connection.sync_connection.get_execution_options().get(
+                        "isolation_level"
+                    )
+            return log, trace, isolation
+
+    return asyncio.run(scenario())
+
+
+def test_read_session_issues_no_begin_or_commit(database, statement_log, use_engine):
+    log, trace, isolation = _run_reads(
+        database, statement_log, use_engine, db.get_read_session
+    )
+
+    assert isolation == "AUTOCOMMIT"
+    assert log.commits == 0
+    assert log.statements and log.of_kind("SELECT") == log.statements
+    assert trace.transaction_control() == []
+
+
+def test_write_session_commits_for_comparison(database, statement_log, use_engine):
+    log, _, isolation = _run_reads(
+        database, statement_log, use_engine, db.get_session
+    )
+
+    assert isolation is None
+    assert log.commits == 1
+
+
+def test_read_session_rejects_writes(database, use_engine):
+    async def scenario():
+        async with database() as engine:
+            use_engine(engine)
+            async with asynccontextmanager(db.get_read_session)(_request()) as session:
+                session.add(User(first_name="B", last_name="C", email="b@c.d", password_hash="x"))
+                with pytest.raises(InvalidRequestError):
+                    await session.flush()
+
+    asyncio.run(scenario())
+
+
+def test_authenticated_get_route_issues_no_begin_or_commit(
+    database, statement_log, use_engine, jwt_keys
+):
+    async def scenario():
+        async with database() as engine:
+            task = await _seed(engine)
+            await engine.dispose()
+            trace = DriverTrace(engine)
+            use_engine(engine)
+            # Пользователь загружается из БД, а не из кеша
+            principal_cache.clear()
+            token = create_access_token("ann@example.com")
+            transport = httpx.ASGITransport(app=create_app())
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                with statement_log(engine) as log:
+                    response = await client.get(
+                        f"/api/v1/tasks/{task.id}",
+                        headers={"Authorization": f"Bearer {token}"},
+                    )
+            return response, log, trace
+
+    response, log, trace = asyncio.run(scenario())
+
+    assert response.status_code == 200, response.text
+    # Principal и задача — два SELECT без транзакции
+    assert len(log.of_kind("SELECT")) == 2
+    assert log.commits == 0
+    assert trace.transaction_control() == []
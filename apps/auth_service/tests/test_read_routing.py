@@ -0,0 +1,62 @@
+"""
+Маршрутизация чтений: ключ read-your-writes и исключение реплик.
+"""
+
+import asyncio
+
+from starlette.requests import Request
+
+from backend.src.app.core import database
+
+
+def _request(authorization: str | None = None, host: str = "10.0.0.1") -> Request:
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "headers": headers, "client": (host, 5000)})
+
+
+def test_client_key_follows_token_subject(monkeypatch):
+    claims = {"old-token": {"sub": "ann@example.com"}, "new-token": {"sub": "ann@example.com"}}
+    monkeypatch.setattr(database, "decode_token_cached", lambda token: claims[token])
+
+    before_refresh = database._client_key(_request("Bearer old-token"))
+    after_refresh = database._client_key(_request("Bearer new-token", host="10.0.0.2"))
+
+    assert before_refresh == after_refresh == "sub:ann@example.com"
+
+
+def test_client_key_falls_back_to_address_for_invalid_token(monkeypatch):
+    def reject(token):
+        raise database.TokenError("bad token")
+
+    monkeypatch.setattr(database, "decode_token_cached", reject)
+
+    assert database._client_key(_request("Bearer garbage")) == "addr:10.0.0.1"
+    assert database._client_key(_request()) == "addr:10.0.0.1"
+
+
+def test_read_session_ejects_unreachable_replica(tmp_path, monkeypatch):
+    healthy = tmp_path / "replica.db"
+    replicas = database.ReplicaSet(
+        [
+            # Каталога нет: SQLite не откроет файл
+            f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}",
+            f"sqlite+aiosqlite:///{healthy}",
+        ],
+        eject_seconds=30,
+    )
+    monkeypatch.setattr(database, "replicas", replicas)
+
+    async def scenario():
+        try:
+            async with database.read_session() as session:
+                url = session.get_bind().url
+            healthy_left = replicas.stats()["healthy"]
+        finally:
+            await replicas.dispose()
+        return url, healthy_left
+
+    url, healthy_left = asyncio.run(scenario())
+
+    assert url.database == str(healthy)
+    assert replicas.ejections == 1
+    assert healthy_left == 1
@@ -0,0 +1,177 @@
+"""
+Асинхронные репозитории user-service на AsyncSession: пользователи
+и refresh токены (в БД только SHA-256 токена).
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.service_user.src.exception.base import ConflictException
+from backend.service_user.src.infrastructure.database import create_session_factory
+# Пакет models регистрирует таблицы user-service
+from backend.service_user.src.models import RefreshToken, User
+from backend.service_user.src.repositories.sql_token_repository import (
+    SQLTokenRepository,
+    token_digest,
+)
+from backend.service_user.src.repositories.sql_user_repository import SQLUserRepository
+from backend.service_user.src.schemas.auth.auth_dto import RefreshTokenDataDTO
+from backend.shared.models.base_model import BaseModel
+
+
+@pytest.fixture
+def sessions(tmp_path) -> Callable[[], AsyncIterator[async_sessionmaker[AsyncSession]]]:
+    """
+    Фабрика сессий над пустой БД со схемой user-service.
+
+    Использование: `async with sessions() as factory: ...`
+    """
+
+    @asynccontextmanager
+    async def open_sessions() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.create_all)
+        try:
+            yield create_session_factory(engine)
+        finally:
+            await engine.dispose()
+
+    return open_sessions
+
+
+def _user_data(name: str, **values) -> dict:
+    return {
+        "user_name": name,
+        "email": f"{name}@example.com",
+        "hashed_password": "hash",
+        **values,
+    }
+
+
+def _token_data(user_id, token: str, expires_in: timedelta = timedelta(days=7)):
+    return RefreshTokenDataDTO(
+        user_id=user_id,
+        token=token,
+        expires_at=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+def test_created_user_is_found_by_name_email_and_id(sessions):
+    async def scenario():
+        async with sessions() as factory:
+            async with factory() as session:
+                created = await SQLUserRepository(session).create_user_with_default_role(
+                    _user_data("ann")
+                )
+            async with factory() as session:
+                repository = SQLUserRepository(session)
+                return created, (
+                    await repository.get_user_by_user_name("ann"),
+                    await repository.get_user_by_email("ann@example.com"),
+                    await repository.get_user_by_id(created.id),
+                    await repository.get_user_by_email("bob@example.com"),
+                )
+
+    created, (by_name, by_email, by_id, missing) = asyncio.run(scenario())
+
+    assert created.role_name == "user"
+    assert by_name.id == by_email.id == by_id.id == created.id
+    assert missing is None
+
+
+def test_unknown_role_is_rejected_before_insert(sessions):
+    async def scenario():
+        async with sessions() as factory:
+            async with factory() as session:
+                with pytest.raises(ConflictException):
+                    await SQLUserRepository(session).create_user_with_default_role(
+                        _user_data("ann", role_name="root")
+                    )
+            async with factory() as session:
+                return (await session.scalars(select(User))).all()
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_active_lookups_skip_inactive_until_activated(sessions):
+    async def scenario():
+        async with sessions() as factory:
+            async with factory() as session:
+                repository = SQLUserRepository(session)
+                user = await repository.create_user_with_default_role(
+                    _user_data("ann", is_active=False)
+                )
+                before = (
+                    await repository.get_active_user_by_email("ann@example.com"),
+                    await repository.get_active_user_by_user_name("ann"),
+                )
+                await repository.activate_user(user.id)
+                await repository.update_password_hash(user.id, "rehashed")
+            async with factory() as session:
+                repository = SQLUserRepository(session)
+                after = await repository.get_active_user_by_email("ann@example.com")
+            return before, after
+
+    before, after = asyncio.run(scenario())
+
+    assert before == (None, None)
+    assert after.is_active and after.hashed_password == "rehashed"
+
+
+def test_refresh_token_is_stored_as_digest_and_revoked_once(sessions):
+    async def scenario():
+        async with sessions() as factory:
+            async with factory() as session:
+                user = await SQLUserRepository(session).create_user_with_default_role(
+                    _user_data("ann")
+                )
+                repository = SQLTokenRepository(session)
+                await repository.create_refresh_token(_token_data(user.id, "refresh-1"))
+                await repository.create_refresh_token(
+                    _token_data(user.id, "expired", expires_in=-timedelta(minutes=1))
+                )
+            async with factory() as session:
+                repository = SQLTokenRepository(session)
+                stored = (await session.scalars(select(RefreshToken.token_hash))).all()
+                valid = await repository.get_valid_token("refresh-1")
+                expired = await repository.get_valid_token("expired")
+                first = await repository.revoke_token("refresh-1")
+                second = await repository.revoke_token("refresh-1")
+                after = await repository.get_valid_token("refresh-1")
+            return user, stored, valid, expired, (first, second), after
+
+    user, stored, valid, expired, revoked, after = asyncio.run(scenario())
+
+    assert sorted(stored) == sorted([token_digest("refresh-1"), token_digest("expired")])
+    assert valid.user_id == user.id
+    assert expired is None
+    assert revoked == (True, False)
+    assert after is None
+
+
+def test_revoke_user_tokens_leaves_other_users_alone(sessions):
+    async def scenario():
+        async with sessions() as factory:
+            async with factory() as session:
+                users = SQLUserRepository(session)
+                ann = await users.create_user_with_default_role(_user_data("ann"))
+                bob = await users.create_user_with_default_role(_user_data("bob"))
+                tokens = SQLTokenRepository(session)
+                for user, token in ((ann, "ann-1"), (ann, "ann-2"), (bob, "bob-1")):
+                    await tokens.create_refresh_token(_token_data(user.id, token))
+                await tokens.revoke_user_tokens(ann.id)
+            async with factory() as session:
+                tokens = SQLTokenRepository(session)
+                return [
+                    await tokens.get_valid_token(token) is not None
+                    for token in ("ann-1", "ann-2", "bob-1")
+                ]
+
+    assert asyncio.run(scenario()) == [False, False, True]
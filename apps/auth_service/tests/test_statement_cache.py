@@ -0,0 +1,46 @@
+"""
+Кеш компиляции: готовые выражения репозиториев после первого вызова
+берутся из кеша движка — счётчик попаданий растёт, промахов нет.
+"""
+
+import asyncio
+
+from backend.shared.metrics import StatementCacheMetrics
+from backend.src.app.core.database import _create_session_factory
+from backend.src.app.models import User
+from backend.src.app.repositories.user import UserRepository
+
+CALLS = 5
+
+
+def test_repeated_lookups_hit_the_statement_cache(database):
+    async def scenario():
+        async with database() as engine:
+            metrics = StatementCacheMetrics("test").attach(engine)
+            factory = _create_session_factory(engine)
+            async with factory() as session:
+                user = User(first_name="Ann", last_name="Lee",
+                            email="ann@example.com", password_hash="x")
+                session.add(user)
+                await session.commit()
+
+            async def lookups(repository: UserRepository) -> None:
+                await repository.get_by_email("Ann@example.com")
+                await repository.get_principal("ann@example.com")
+                await repository.email_exists("ann@example.com")
+                await repository.get_by_id(user.id)
+
+            async with factory() as session:
+                repository = UserRepository(session)
+                await lookups(repository)  # первая компиляция каждого выражения
+                before = metrics.snapshot()
+                for _ in range(CALLS):
+                    await lookups(repository)
+                after = metrics.snapshot()
+            return before, after
+
+    before, after = asyncio.run(scenario())
+
+    assert after["hits"] - before["hits"] == 4 * CALLS
+    assert after["misses"] == before["misses"]
+    assert after["uncached"] == before["uncached"]
@@ -0,0 +1,113 @@
+"""
+Планы запросов к tasks: выборки репозитория идут по составным индексам
+модели Task, а не полным сканированием (EXPLAIN QUERY PLAN в SQLite).
+"""
+
+import asyncio
+
+from sqlalchemy import insert, inspect, text
+
+from backend.src.app.core.constants import TaskStatus
+from backend.service_user.scripts.create_missing_indexes import create_missing_indexes
+from backend.src.app.core.database import _create_session_factory
+from backend.src.app.models import Task, User
+from backend.src.app.models.base import uuid7
+from backend.src.app.repositories.task import TaskRepository
+
+TASKS = 500
+STATUSES = [TaskStatus.CREATED, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED]
+
+
+async def _seed(session) -> list[User]:
+    """Задачи всех статусов, распределённые между несколькими пользователями."""
+    users = [
+        User(first_name="U", last_name=str(i), email=f"u{i}@example.com", password_hash="x")
+        for i in range(5)
+    ]
+    session.add_all(users)
+    await session.flush()
+    await session.execute(insert(Task), [
+        {
+            "id": uuid7(),
+            "title": f"task {i}",
+            "status": STATUSES[i % len(STATUSES)],
+            "assigned_to_id": users[i % len(users)].id,
+            "created_by_id": users[(i + 1) % len(users)].id,
+        }
+        for i in range(TASKS)
+    ])
+    await session.commit()
+    # Статистика для планировщика, как на живой БД
+    await session.execute(text("ANALYZE"))
+    return users
+
+
+def _plan(database, statement_log, query) -> str:
+    """План последнего выражения, выполненного query(repository, users)."""
+
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            async with factory() as session:
+                users = await _seed(session)
+            async with factory() as session:
+                with statement_log(engine) as log:
+                    await query(TaskRepository(session), users)
+                connection = await session.connection()
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {log.statements[-1]}", log.parameters[-1]
+                )
+                return "\n".join(row.detail for row in result)
+
+    return asyncio.run(scenario())
+
+
+def test_get_all_by_status_uses_status_created_at_index(database, statement_log):
+    async def query(repository, users):
+        await repository.get_all_by_status(TaskStatus.IN_PROGRESS)
+
+    plan = _plan(database, statement_log, query)
+
+    assert "ix_tasks_status_created_at" in plan
+    # Порядок по created_at берётся из индекса, без сортировки
+    assert "TEMP B-TREE" not in plan
+
+
+def test_get_assigned_to_user_uses_assignee_index(database, statement_log):
+    async def query(repository, users):
+        await repository.get_assigned_to_user(users[0].id)
+
+    plan = _plan(database, statement_log, query)
+
+    assert "ix_tasks_assigned_to_id_status" in plan
+
+
+def test_keyset_page_uses_created_at_id_index(database, statement_log):
+    async def query(repository, users):
+        _, cursor = await repository.get_page(limit=20)
+        await repository.get_page(limit=20, cursor=cursor)
+
+    plan = _plan(database, statement_log, query)
+
+    assert "ix_tasks_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_create_missing_indexes_adds_only_absent_indexes(database):
+    async def scenario():
+        async with database() as engine:
+            async with engine.begin() as conn:
+                await conn.execute(text("DROP INDEX ix_tasks_status_created_at"))
+            created = await create_missing_indexes(engine)
+            again = await create_missing_indexes(engine)
+            async with engine.connect() as conn:
+                names = await conn.run_sync(
+                    lambda sync: {index["name"] for index in inspect(sync).get_indexes("tasks")}
+                )
+            return created, again, names
+
+    created, again, names = asyncio.run(scenario())
+
+    assert created == ["ix_tasks_status_created_at"]
+    assert again == []
+    assert {index.name for index in Task.__table__.indexes} <= names
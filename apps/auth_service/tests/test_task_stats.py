@@ -0,0 +1,174 @@
+"""
+Счётчики task_stats: переходы берут старое состояние из самого UPDATE
+(без предварительной блокировки), сверка не расходится с пересчётом.
+"""
+
+import asyncio
+import uuid
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from backend.src.app.core.constants import Role, TaskStatus
+from backend.src.app.core.database import _create_session_factory
+from backend.src.app.core.principal import Principal
+from backend.src.app.models import Task, User
+from backend.src.app.models.task import TaskStat
+from backend.src.app.repositories import task as task_repositories
+from backend.src.app.repositories.task import (
+    TaskRepository,
+    TaskStatsRepository,
+    _update_returning_old,
+)
+from backend.src.app.repositories.user import UserRepository
+from backend.src.app.schemas.task import TaskCreate
+from backend.src.app.services.notifications.service import NotificationService
+from backend.src.app.services.tasks.service import TaskService
+
+
+def _service(session) -> TaskService:
+    return TaskService(
+        TaskRepository(session),
+        UserRepository(session),
+        NotificationService(),
+        TaskStatsRepository(session),
+    )
+
+
+def _admin(user: User) -> Principal:
+    return Principal(id=user.id, email=user.email, role=Role.ADMIN, is_active=True)
+
+
+async def _seed(factory, tasks: int) -> tuple[User, list]:
+    """Пользователь и `tasks` новых задач, созданных через сервис (со счётчиками)."""
+    async with factory() as session:
+        user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+        session.add(user)
+        await session.commit()
+        service = _service(session)
+        created = [
+            await service.create(TaskCreate(title=f"task {i}"), _admin(user))
+            for i in range(tasks)
+        ]
+        await session.commit()
+    return user, [task.id for task in created]
+
+
+async def _counts(session) -> dict:
+    return {
+        (stat.status, stat.assignee_id): stat.count
+        for stat in await TaskStatsRepository(session).get_all()
+    }
+
+
+def _run_transitions(database, statement_log):
+    """Переходы всех видов над 6 задачами; счётчики, сверка и лог переходов."""
+
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            user, task_ids = await _seed(factory, tasks=6)
+            async with factory() as session:
+                service = _service(session)
+                actor = _admin(user)
+                with statement_log(engine) as log:
+                    await service.assign(task_ids[0], user.id, actor)
+                    await service.complete(task_ids[0], actor)
+                    await service.assign_many(task_ids[1:4], user.id, actor)
+                    await service.complete_many(task_ids[3:5], actor)
+                    await service.delete_many(task_ids[4:], actor)
+                await session.commit()
+            async with factory() as session:
+                counts = await _counts(session)
+                drift = await TaskStatsRepository(session).reconcile()
+                await session.commit()
+            return user, counts, drift, log
+
+    return asyncio.run(scenario())
+
+
+def test_transitions_keep_counters_equal_to_recount(database, statement_log):
+    user, counts, drift, _ = _run_transitions(database, statement_log)
+
+    assert drift == {}
+    assert counts == {
+        (TaskStatus.IN_PROGRESS, user.id): 2,
+        (TaskStatus.COMPLETED, user.id): 2,
+    }
+
+
+def test_other_dialects_take_the_portable_path(database, statement_log, monkeypatch):
+    # Диалект без RETURNING и ON CONFLICT (MySQL): блокировки строк,
+    # UPDATE счётчика, INSERT недостающего
+    monkeypatch.setattr(task_repositories, "_dialect", lambda session: "mysql")
+
+    user, counts, drift, log = _run_transitions(database, statement_log)
+
+    assert drift == {}
+    assert counts == {
+        (TaskStatus.IN_PROGRESS, user.id): 2,
+        (TaskStatus.COMPLETED, user.id): 2,
+    }
+    assert not any("ON CONFLICT" in statement for statement in log.statements)
+    assert not any(
+        "RETURNING" in statement for statement in log.of_kind("UPDATE") + log.of_kind("DELETE")
+    )
+
+
+def test_assign_reads_no_locked_state_before_update(database, statement_log):
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            user, task_ids = await _seed(factory, tasks=1)
+            async with factory() as session:
+                with statement_log(engine) as log:
+                    await _service(session).assign(task_ids[0], user.id, _admin(user))
+                await session.commit()
+            return log
+
+    log = asyncio.run(scenario())
+
+    assert not any("FOR UPDATE" in statement for statement in log.statements)
+    assert len(log.of_kind("UPDATE")) == 1
+    # Счётчики — одним upsert, последним выражением транзакции
+    assert log.statements[-1].lstrip().upper().startswith("INSERT INTO TASK_STATS")
+
+
+def test_postgresql_transition_is_one_statement_returning_old_state():
+    statement = _update_returning_old(
+        [uuid.UUID(int=1)],
+        [Task.status == TaskStatus.CREATED],
+        {"status": TaskStatus.IN_PROGRESS},
+    )
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith('WITH "old" AS')
+    assert "FOR UPDATE" in sql
+    assert 'RETURNING' in sql and '"old".status' in sql and '"old".assigned_to_id' in sql
+
+
+def test_reconcile_corrects_drift_under_write_lock(database, statement_log):
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            await _seed(factory, tasks=3)
+            async with factory() as session:
+                await session.execute(update(TaskStat).values(count=TaskStat.count + 5))
+                await session.commit()
+            async with factory() as session:
+                with statement_log(engine) as log:
+                    drift = await TaskStatsRepository(session).reconcile()
+                await session.commit()
+            async with factory() as session:
+                again = await TaskStatsRepository(session).reconcile()
+                await session.commit()
+            return drift, again, log
+
+    drift, again, log = asyncio.run(scenario())
+
+    assert dict(drift) == {(TaskStatus.CREATED, None): -5}
+    assert again == {}
+    # SQLite: запись блокируется до пересчёта, а не после
+    assert log.statements[0] == "BEGIN IMMEDIATE"
+
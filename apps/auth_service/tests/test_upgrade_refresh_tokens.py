@@ -0,0 +1,170 @@
+"""
+Разовый переход refresh_tokens: token → token_hash (SHA-256).
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    func,
+    inspect,
+    insert,
+    select,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from backend.service_user.scripts.upgrade_refresh_tokens import contract, expand
+from backend.service_user.src.repositories.sql_token_repository import (
+    SQLTokenRepository,
+    token_digest,
+)
+
+# Схема до перехода: JWT целиком в уникальной колонке token
+_OLD = Table(
+    "refresh_tokens",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("user_id", Uuid, nullable=False),
+    Column("token", String(255), unique=True, nullable=False),
+    Column("is_revoked", Boolean, default=False),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def _row(token: str, **values) -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "user_id": uuid.uuid4(),
+        "token": token,
+        "expires_at": datetime.now(timezone.utc) + timedelta(days=7),
+        **values,
+    }
+
+
+async def _schema(conn) -> tuple[dict, bool]:
+    def read(sync_conn):
+        inspector = inspect(sync_conn)
+        columns = {c["name"]: c for c in inspector.get_columns("refresh_tokens")}
+        unique = any(
+            c["column_names"] == ["token_hash"]
+            for c in inspector.get_unique_constraints("refresh_tokens")
+        )
+        return columns, unique
+
+    return await conn.run_sync(read)
+
+
+def test_expand_then_contract_rehashes_every_row(tmp_path):
+    tokens = [f"header.payload-{i}.signature" for i in range(5)]
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tokens.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(_OLD.metadata.create_all)
+                await conn.execute(insert(_OLD), [_row(token) for token in tokens])
+
+            expanded = await expand(engine, batch_size=2)
+            # Старый экземпляр во время выкатки пишет только token
+            async with engine.begin() as conn:
+                await conn.execute(insert(_OLD), [_row("issued.during.rollout")])
+            contracted = await contract(engine, batch_size=2)
+            repeated = await expand(engine, batch_size=2), await contract(engine, batch_size=2)
+
+            async with engine.begin() as conn:
+                columns, unique = await _schema(conn)
+                digests = set((await conn.exec_driver_sql(
+                    "SELECT token_hash FROM refresh_tokens"
+                )).scalars())
+            async with engine.begin() as conn:
+                with pytest.raises(IntegrityError):
+                    await conn.exec_driver_sql(
+                        "UPDATE refresh_tokens SET token_hash = NULL"
+                    )
+            return expanded, contracted, repeated, columns, unique, digests
+        finally:
+            await engine.dispose()
+
+    expanded, contracted, repeated, columns, unique, digests = asyncio.run(scenario())
+
+    assert (expanded, contracted, repeated) == (5, 1, (0, 0))
+    assert "token" not in columns
+    assert unique and not columns["token_hash"]["nullable"]
+    assert digests == {token_digest(t) for t in [*tokens, "issued.during.rollout"]}
+
+
+def test_contract_requires_expand(tmp_path):
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tokens.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(_OLD.metadata.create_all)
+            with pytest.raises(RuntimeError):
+                await contract(engine, batch_size=2)
+            async with engine.connect() as conn:
+                columns, _ = await _schema(conn)
+            return columns
+        finally:
+            await engine.dispose()
+
+    assert "token" in asyncio.run(scenario())
+
+
+def test_expand_creates_indexes_used_by_purge_batch(tmp_path, statement_log):
+    expired = datetime.now(timezone.utc) - timedelta(days=1)
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tokens.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(_OLD.metadata.create_all)
+                # executemany берёт колонки из первой строки: по вставке на вид
+                await conn.execute(
+                    insert(_OLD), [_row(f"expired-{i}", expires_at=expired) for i in range(3)]
+                )
+                await conn.execute(
+                    insert(_OLD), [_row(f"revoked-{i}", is_revoked=True) for i in range(3)]
+                )
+                await conn.execute(insert(_OLD), [_row(f"active-{i}") for i in range(3)])
+            await expand(engine, batch_size=100)
+            await expand(engine, batch_size=100)
+            await contract(engine, batch_size=100)
+            async with engine.begin() as conn:
+                await conn.exec_driver_sql("ANALYZE")
+
+            async with AsyncSession(engine) as session:
+                with statement_log(engine) as log:
+                    deleted = await SQLTokenRepository(session).purge_batch(
+                        datetime.now(timezone.utc), batch_size=5
+                    )
+            plans = []
+            async with engine.connect() as conn:
+                for statement, parameters in zip(log.statements, log.parameters):
+                    if statement.lstrip().upper().startswith("DELETE"):
+                        result = await conn.exec_driver_sql(
+                            f"EXPLAIN QUERY PLAN {statement}", parameters
+                        )
+                        plans.append("\n".join(row.detail for row in result))
+                left = await conn.scalar(select(func.count()).select_from(_OLD))
+            return deleted, plans, left
+        finally:
+            await engine.dispose()
+
+    deleted, plans, left = asyncio.run(scenario())
+
+    assert deleted == 5 and left == 4
+    expired_plan, revoked_plan = plans
+    assert "ix_refresh_tokens_expires_at" in expired_plan
+    # Пачка отозванных читается из частичного индекса в порядке id
+    assert "ix_refresh_tokens_revoked_id" in revoked_plan
+    assert "TEMP B-TREE" not in revoked_plan
@@ -0,0 +1,129 @@
+"""
+Ключи uuid7 и UUIDType: идентификаторы строго растут даже внутри одной
+миллисекунды, несут версию 7 и вариант RFC, а UUIDType хранит их как
+BINARY(16) и читает старые значения CHAR(36) и нативный uuid PostgreSQL.
+"""
+
+import asyncio
+import time
+import uuid
+
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.src.app.models import base
+from backend.src.app.models.base import UUIDType, uuid7
+
+FROZEN_MS = 1_700_000_000_000
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Часы остановлены на одной миллисекунде, последний id сброшен."""
+    monkeypatch.setattr(base, "_uuid7_last", (0, 0))
+    monkeypatch.setattr(time, "time_ns", lambda: FROZEN_MS * 1_000_000)
+
+
+def _ms(value: uuid.UUID) -> int:
+    return value.int >> 80
+
+
+def test_ids_increase_within_one_millisecond(frozen_clock):
+    ids = [uuid7() for _ in range(1000)]
+
+    assert all(a < b for a, b in zip(ids, ids[1:]))
+    # Начальная последовательность < 0x800, 1000 шагов не переполняют 12 бит
+    assert {_ms(value) for value in ids} == {FROZEN_MS}
+    # Порядок байтов совпадает с порядком UUID — так их сравнивает индекс
+    assert sorted(value.bytes for value in ids) == [value.bytes for value in ids]
+
+
+def test_sequence_overflow_borrows_next_millisecond(frozen_clock):
+    ids = [uuid7() for _ in range(5000)]
+
+    assert all(a < b for a, b in zip(ids, ids[1:]))
+    assert _ms(ids[-1]) == FROZEN_MS + 1
+
+
+def test_clock_step_back_keeps_ids_increasing(monkeypatch):
+    monkeypatch.setattr(base, "_uuid7_last", (0, 0))
+    clock = iter([FROZEN_MS, FROZEN_MS - 5_000, FROZEN_MS + 1])
+    monkeypatch.setattr(time, "time_ns", lambda: next(clock) * 1_000_000)
+
+    first, stepped_back, after = uuid7(), uuid7(), uuid7()
+
+    assert first < stepped_back < after
+    assert _ms(stepped_back) == FROZEN_MS
+
+
+def test_version_and_variant_bits():
+    before = time.time_ns() // 1_000_000
+    ids = [uuid7() for _ in range(100)]
+    after = time.time_ns() // 1_000_000
+
+    for value in ids:
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        assert before <= _ms(value) <= after + 1
+
+
+def test_binary16_round_trip_and_legacy_char36(tmp_path):
+    """Новые id пишутся 16 байтами; строки CHAR(36) старых записей читаются как UUID."""
+    metadata = MetaData()
+    things = Table("things", metadata, Column("id", UUIDType, primary_key=True))
+    legacy = Table("things", MetaData(), Column("id", String(36), primary_key=True))
+    new_id, old_id = uuid7(), uuid.uuid4()
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uuid.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.create_all)
+                await conn.execute(insert(things), [{"id": new_id}])
+                # Запись, сохранённая до перехода на BINARY(16)
+                await conn.execute(insert(legacy), [{"id": str(old_id)}])
+            async with engine.connect() as conn:
+                stored = (await conn.exec_driver_sql(
+                    "SELECT typeof(id), length(id) FROM things ORDER BY typeof(id)"
+                )).all()
+                loaded = (await conn.execute(select(things.c.id))).scalars().all()
+                found = (await conn.execute(
+                    select(things.c.id).where(things.c.id == str(new_id))
+                )).scalar_one()
+            return stored, loaded, found
+        finally:
+            await engine.dispose()
+
+    stored, loaded, found = asyncio.run(scenario())
+
+    assert stored == [("blob", 16), ("text", 36)]
+    assert sorted(loaded) == sorted([new_id, old_id])
+    assert all(type(value) is uuid.UUID for value in loaded)
+    assert found == new_id
+
+
+@pytest.mark.parametrize("value", [
+    "0190f5a4-7b3c-7def-8123-456789abcdef",
+    uuid.UUID("0190f5a4-7b3c-7def-8123-456789abcdef").bytes,
+    uuid.UUID("0190f5a4-7b3c-7def-8123-456789abcdef"),
+])
+def test_bind_accepts_str_bytes_and_uuid(value):
+    expected = uuid.UUID("0190f5a4-7b3c-7def-8123-456789abcdef")
+    column = UUIDType()
+
+    assert column.process_bind_param(value, sqlite.dialect()) == expected.bytes
+    if not isinstance(value, bytes):
+        assert column.process_bind_param(value, postgresql.dialect()) == expected
+
+
+def test_postgresql_uses_native_uuid():
+    column = UUIDType()
+    dialect = postgresql.dialect()
+    value = uuid7()
+
+    assert isinstance(column.load_dialect_impl(dialect), postgresql.UUID)
+    assert column.process_result_value(value, dialect) is value
+    assert column.process_result_value(str(value), dialect) == value
+    assert column.process_bind_param(None, dialect) is None
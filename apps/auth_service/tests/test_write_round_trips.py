@@ -0,0 +1,97 @@
+"""
+Записи без лишних обращений: INSERT/UPDATE ... RETURNING вместо
+flush + refresh, и ни одного выражения, если менять нечего.
+"""
+
+import asyncio
+
+from backend.src.app.core.constants import TaskStatus
+from backend.src.app.core.database import _create_session_factory
+from backend.src.app.models import Task, User
+from backend.src.app.repositories.task import TaskRepository
+from backend.src.app.repositories.user import UserRepository
+
+
+async def _seed(session) -> tuple[User, Task]:
+    user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+    session.add(user)
+    await session.flush()
+    task = Task(title="seeded", created_by_id=user.id)
+    session.add(task)
+    await session.commit()
+    return user, task
+
+
+def _run(database, statement_log, action):
+    """Сид, затем action(session, user, task) под statement_log."""
+
+    async def scenario():
+        async with database() as engine:
+            factory = _create_session_factory(engine)
+            async with factory() as session:
+                user, task = await _seed(session)
+            async with factory() as session:
+                task = await session.get(Task, task.id)
+                user = await session.get(User, user.id)
+                with statement_log(engine) as log:
+                    result = await action(session, user, task)
+                await session.commit()
+            return result, log
+
+    return asyncio.run(scenario())
+
+
+def test_add_is_one_insert_returning_server_defaults(database, statement_log):
+    async def action(session, user, task):
+        return await TaskRepository(session).add(Task(title="new", created_by_id=user.id))
+
+    task, log = _run(database, statement_log, action)
+
+    assert task.created_at is not None and task.updated_at is not None
+    assert len(log.statements) == 1
+    assert log.of_kind("INSERT") and "RETURNING" in log.statements[0]
+
+
+def test_update_fields_is_one_update_without_select(database, statement_log):
+    async def action(session, user, task):
+        return await TaskRepository(session).update_fields(task, title="renamed")
+
+    task, log = _run(database, statement_log, action)
+
+    assert task.title == "renamed"
+    assert len(log.statements) == 1
+    assert log.of_kind("UPDATE")
+
+
+def test_update_fields_without_changes_issues_nothing(database, statement_log):
+    async def action(session, user, task):
+        await TaskRepository(session).update_fields(task, title=task.title)
+        await UserRepository(session).update_fields(user, first_name=user.first_name)
+
+    _, log = _run(database, statement_log, action)
+
+    assert log.statements == []
+
+
+def test_assign_is_one_conditional_update_returning_old_state(database, statement_log):
+    async def action(session, user, task):
+        return await TaskRepository(session).assign(task.id, user.id), user.id
+
+    ((task, before), user_id), log = _run(database, statement_log, action)
+
+    assert (task.status, task.assigned_to_id) == (TaskStatus.IN_PROGRESS, user_id)
+    assert before == (TaskStatus.CREATED, None)
+    # SQLite reads the old state first; no FOR UPDATE pre-lock either way
+    assert len(log.of_kind("UPDATE")) == 1 and "RETURNING" in log.of_kind("UPDATE")[0]
+    assert not any("FOR UPDATE" in statement for statement in log.statements)
+
+
+def test_complete_is_one_conditional_update_returning_old_state(database, statement_log):
+    async def action(session, user, task):
+        return await TaskRepository(session).complete(task.id, completed_by_id=user.id)
+
+    (task, before), log = _run(database, statement_log, action)
+
+    assert task.status == TaskStatus.COMPLETED
+    assert before == (TaskStatus.CREATED, None)
+    assert len(log.of_kind("UPDATE")) == 1 and "RETURNING" in log.of_kind("UPDATE")[0]
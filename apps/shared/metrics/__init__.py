@@ -0,0 +1,12 @@
+from backend.shared.metrics.pool import PoolMetrics, instrument_pool
+from backend.shared.metrics.statement_cache import (
+    StatementCacheMetrics,
+    instrument_statement_cache,
+)
+
+__all__ = [
+    "PoolMetrics",
+    "StatementCacheMetrics",
+    "instrument_pool",
+    "instrument_statement_cache",
+]
@@ -0,0 +1,205 @@
+"""
+Модуль метрик пула соединений SQLAlchemy.
+
+Общий для сервисов: синхронные (gRPC) и асинхронные (HTTP API) движки
+инструментируются одинаково. Показывает, откуда берётся задержка
+под нагрузкой: из самой БД или из ожидания свободного соединения в пуле.
+
+Счётчики и gauge'и:
+- checkouts / checkout_seconds_* — все выдачи соединений и их длительность
+- waits / wait_seconds_*         — выдачи, когда пул был исчерпан
+                                   (pool_size + max_overflow выдано)
+- timeouts                       — ожидания, завершившиеся pool_timeout
+- in_use / idle / overflow       — соединений выдано, свободно, сверх pool_size
+"""
+
+# Импорты для блокировок (пул используется из нескольких потоков)
+import threading
+# Импорты для замера времени
+import time
+# Импорты для типизации
+from typing import Any
+
+# Импорты SQLAlchemy: события пула и ошибка ожидания
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool
+
+
+class PoolMetrics:
+    """
+    Метрики пула соединений одного движка.
+
+    Подписка на события идёт через движок, поэтому переживает
+    engine.dispose(): новый пул получает те же обработчики, а замер
+    выдачи переустанавливается на него по событию engine_disposed.
+
+    Attributes:
+        name: Имя пула в ответе метрик (primary, replica-0, ...).
+        checkouts: Число выдач соединений.
+        waits: Число выдач, которым пришлось ждать исчерпанный пул.
+        timeouts: Число ожиданий, превысивших pool_timeout.
+        in_use: Соединений выдано сейчас.
+        connects: Открыто новых DBAPI соединений.
+        invalidations: Соединений признано нерабочими.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._engine: Engine | None = None
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine | AsyncEngine) -> "PoolMetrics":
+        """
+        Подключение к пулу движка через события SQLAlchemy.
+
+        Args:
+            engine: Синхронный или асинхронный движок.
+
+        Returns:
+            PoolMetrics: Этот же объект (для цепочки вызовов).
+        """
+        self._engine = getattr(engine, "sync_engine", engine)
+        event.listen(self._engine, "checkout", self._on_checkout)
+        event.listen(self._engine, "checkin", self._on_checkin)
+        event.listen(self._engine, "connect", self._on_connect)
+        event.listen(self._engine, "invalidate", self._on_invalidate)
+        event.listen(self._engine, "engine_disposed", self._on_disposed)
+        self._time_acquire(self._engine.pool)
+        return self
+
+    @property
+    def pool(self) -> Pool | None:
+        """Текущий пул движка (после dispose() — уже новый)."""
+        return self._engine.pool if self._engine is not None else None
+
+    def _time_acquire(self, pool: Pool) -> None:
+        """
+        Замер времени получения соединения из пула.
+
+        Событий «до выдачи» у пула нет, поэтому оборачивается
+        _do_get экземпляра — точка, где пул ждёт свободное соединение.
+        """
+        do_get = pool._do_get
+        capacity = self._capacity(pool)
+
+        def timed_do_get() -> Any:
+            # Ждать придётся, только если выданы все соединения,
+            # включая overflow; иначе пул отдаст свободное или откроет новое
+            waited = capacity is not None and pool.checkedout() >= capacity
+            started = time.perf_counter()
+            try:
+                return do_get()
+            except PoolTimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                raise
+            finally:
+                self._observe(time.perf_counter() - started, waited)
+
+        pool._do_get = timed_do_get
+
+    @staticmethod
+    def _capacity(pool: Pool) -> int | None:
+        """
+        Максимум одновременно выданных соединений.
+
+        None — пул без очереди или без предела (max_overflow=-1):
+        выдача никогда не ждёт.
+        """
+        size = getattr(pool, "size", None)
+        max_overflow = getattr(pool, "_max_overflow", None)
+        if size is None or max_overflow is None or max_overflow < 0:
+            return None
+        return size() + max_overflow
+
+    def _observe(self, seconds: float, waited: bool) -> None:
+        with self._lock:
+            self.checkout_seconds_total += seconds
+            self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+            if waited:
+                self.waits += 1
+                self.wait_seconds_total += seconds
+                self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def _on_disposed(self, engine: Engine) -> None:
+        # dispose() заменил пул: замер выдачи ставится на новый
+        self._time_acquire(engine.pool)
+
+    @staticmethod
+    def _idle(pool: Pool | None) -> int | None:
+        """Свободных соединений в пуле (None — пул без очереди)."""
+        checkedin = getattr(pool, "checkedin", None)
+        return checkedin() if checkedin else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Текущие значения для endpoint метрик.
+
+        Returns:
+            dict: Счётчики, задержки (секунды) и gauge'и пула.
+        """
+        pool = self.pool
+        size = getattr(pool, "size", None)
+        overflow = getattr(pool, "overflow", None)
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": size() if size else None,
+                "in_use": self.in_use,
+                "idle": self._idle(pool),
+                # QueuePool считает overflow от -pool_size: отрицательное — запас
+                "overflow": max(overflow(), 0) if overflow else None,
+                "checkouts": self.checkouts,
+                "checkout_seconds_total": self.checkout_seconds_total,
+                "checkout_seconds_max": self.checkout_seconds_max,
+                "waits": self.waits,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+            }
+
+
+def instrument_pool(engine: Engine | AsyncEngine, name: str) -> PoolMetrics:
+    """
+    Метрики пула движка.
+
+    Args:
+        engine: Синхронный или асинхронный движок.
+        name: Имя пула в ответе метрик.
+
+    Returns:
+        PoolMetrics: Подключённые метрики.
+    """
+    return PoolMetrics(name).attach(engine)
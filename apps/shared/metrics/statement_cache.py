@@ -0,0 +1,105 @@
+"""
+Модуль метрик кеша скомпилированных SQL выражений.
+
+SQLAlchemy кеширует компиляцию выражения по его cache key
+(query_cache_size записей на движок). Каждое выполнение помечается
+как попадание, промах или выполнение без кеша — по этим отметкам
+видно, окупается ли кеш и хватает ли его размера.
+
+Общий для сервисов: синхронные и асинхронные движки инструментируются
+одинаково.
+"""
+
+# Импорты для блокировок (движок используется из нескольких потоков)
+import threading
+# Импорты для типизации
+from typing import Any
+
+# Импорты SQLAlchemy: события движка и отметки кеша
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class StatementCacheMetrics:
+    """
+    Метрики кеша компиляции одного движка.
+
+    Attributes:
+        name: Имя движка в ответе метрик (primary, replica-0, ...).
+        hits: Выполнения со скомпилированным выражением из кеша.
+        misses: Выполнения, потребовавшие компиляции.
+        uncached: Выполнения без кеша (строковый SQL, кеш выключен и т.п.).
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+        self._engine: Engine | None = None
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine | AsyncEngine) -> "StatementCacheMetrics":
+        """
+        Подключение к движку через событие before_cursor_execute.
+
+        Args:
+            engine: Синхронный или асинхронный движок.
+
+        Returns:
+            StatementCacheMetrics: Этот же объект (для цепочки вызовов).
+        """
+        self._engine = getattr(engine, "sync_engine", engine)
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def _on_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        cache_hit = getattr(context, "cache_hit", None)
+        with self._lock:
+            if cache_hit is CACHE_HIT:
+                self.hits += 1
+            elif cache_hit is CACHE_MISS:
+                self.misses += 1
+            else:
+                self.uncached += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Текущие значения для endpoint метрик.
+
+        Returns:
+            dict: Счётчики, доля попаданий и заполненность кеша.
+        """
+        cache = getattr(self._engine, "_compiled_cache", None)
+        with self._lock:
+            hits, misses, uncached = self.hits, self.misses, self.uncached
+        cached = hits + misses
+        return {
+            "name": self.name,
+            "hits": hits,
+            "misses": misses,
+            "uncached": uncached,
+            "hit_ratio": hits / cached if cached else 0.0,
+            "size": len(cache) if cache is not None else None,
+            "capacity": getattr(cache, "capacity", None),
+        }
+
+
+def instrument_statement_cache(
+    engine: Engine | AsyncEngine, name: str
+) -> StatementCacheMetrics:
+    """
+    Метрики кеша компиляции движка.
+
+    Args:
+        engine: Синхронный или асинхронный движок.
+        name: Имя движка в ответе метрик.
+
+    Returns:
+        StatementCacheMetrics: Подключённые метрики.
+    """
+    return StatementCacheMetrics(name).attach(engine)
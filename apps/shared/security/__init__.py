@@ -0,0 +1,21 @@
+from backend.shared.security.jwt_backends import (
+    JWTBackend,
+    TokenError,
+    get_jwt_backend,
+)
+from backend.shared.security.password_calibration import (
+    HashParams,
+    calibrate,
+    calibrate_argon2,
+)
+from backend.shared.security.token_cache import VerifiedTokenCache
+
+__all__ = [
+    "HashParams",
+    "JWTBackend",
+    "TokenError",
+    "VerifiedTokenCache",
+    "calibrate",
+    "calibrate_argon2",
+    "get_jwt_backend",
+]
@@ -0,0 +1,184 @@
+"""
+Модуль сменных бэкендов подписи/проверки JWT.
+
+Общий для сервисов. Бэкенд выбирается настройкой JWT_BACKEND:
+- "jose"  — python-jose (RS256, ES256, HS256);
+- "pyjwt" — PyJWT + cryptography (RS256, ES256, EdDSA, HS256).
+
+Все бэкенды сообщают об ошибках одним исключением TokenError,
+поэтому сервисы не зависят от конкретной библиотеки.
+"""
+
+# Импорты для типизации
+from typing import Any, Protocol
+
+
+class TokenError(Exception):
+    """Токен невалидный, истёк или подписан неизвестным ключом."""
+
+
+class JWTBackend(Protocol):
+    """
+    Протокол бэкенда JWT.
+
+    Ключи разбираются один раз (load_*_key), а затем передаются
+    в encode/decode уже готовыми объектами.
+    """
+
+    name: str
+
+    def load_private_key(self, pem: str, algorithm: str) -> Any:
+        """Разбор ключа подписи."""
+        ...
+
+    def load_public_key(self, pem: str, algorithm: str) -> Any:
+        """Разбор ключа проверки."""
+        ...
+
+    def encode(
+        self,
+        claims: dict,
+        key: Any,
+        algorithm: str,
+        headers: dict | None = None,
+    ) -> str:
+        """Подпись полезной нагрузки."""
+        ...
+
+    def decode(self, token: str, key: Any, algorithms: list[str]) -> dict:
+        """Проверка подписи и срока действия токена."""
+        ...
+
+    def get_unverified_header(self, token: str) -> dict:
+        """Заголовок токена без проверки подписи."""
+        ...
+
+
+# ── python-jose ──────────────────────────────────────────────────────────────
+
+class JoseBackend:
+    """Бэкенд на python-jose (исторический, без поддержки EdDSA)."""
+
+    name = "jose"
+
+    def __init__(self) -> None:
+        from jose import JWTError, jwk, jwt
+        self._jwt = jwt
+        self._jwk = jwk
+        self._error = JWTError
+
+    def _construct(self, pem: str, algorithm: str) -> Any:
+        if algorithm == "EdDSA":
+            raise ValueError(
+                "python-jose не поддерживает EdDSA — используйте JWT_BACKEND=pyjwt"
+            )
+        return self._jwk.construct(pem, algorithm)
+
+    def load_private_key(self, pem: str, algorithm: str) -> Any:
+        return self._construct(pem, algorithm)
+
+    def load_public_key(self, pem: str, algorithm: str) -> Any:
+        return self._construct(pem, algorithm)
+
+    def encode(
+        self,
+        claims: dict,
+        key: Any,
+        algorithm: str,
+        headers: dict | None = None,
+    ) -> str:
+        return self._jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+    def decode(self, token: str, key: Any, algorithms: list[str]) -> dict:
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._error as exc:
+            raise TokenError(str(exc)) from exc
+
+    def get_unverified_header(self, token: str) -> dict:
+        try:
+            return self._jwt.get_unverified_header(token)
+        except self._error as exc:
+            raise TokenError(str(exc)) from exc
+
+
+# ── PyJWT ────────────────────────────────────────────────────────────────────
+
+class PyJWTBackend:
+    """Бэкенд на PyJWT + cryptography (быстрее, поддерживает EdDSA)."""
+
+    name = "pyjwt"
+
+    def __init__(self) -> None:
+        import jwt
+        from jwt.algorithms import get_default_algorithms
+        self._jwt = jwt
+        self._algorithms = get_default_algorithms()
+
+    def _prepare(self, pem: str, algorithm: str) -> Any:
+        try:
+            algorithm_impl = self._algorithms[algorithm]
+        except KeyError:
+            raise ValueError(
+                f"Алгоритм {algorithm} недоступен в PyJWT "
+                "(установите пакет cryptography)"
+            ) from None
+        return algorithm_impl.prepare_key(pem)
+
+    def load_private_key(self, pem: str, algorithm: str) -> Any:
+        return self._prepare(pem, algorithm)
+
+    def load_public_key(self, pem: str, algorithm: str) -> Any:
+        return self._prepare(pem, algorithm)
+
+    def encode(
+        self,
+        claims: dict,
+        key: Any,
+        algorithm: str,
+        headers: dict | None = None,
+    ) -> str:
+        return self._jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+    def decode(self, token: str, key: Any, algorithms: list[str]) -> dict:
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._jwt.PyJWTError as exc:
+            raise TokenError(str(exc)) from exc
+
+    def get_unverified_header(self, token: str) -> dict:
+        try:
+            return self._jwt.get_unverified_header(token)
+        except self._jwt.PyJWTError as exc:
+            raise TokenError(str(exc)) from exc
+
+
+# Реестр доступных бэкендов (имя из настроек → класс)
+_BACKENDS: dict[str, type] = {
+    JoseBackend.name: JoseBackend,
+    PyJWTBackend.name: PyJWTBackend,
+}
+
+
+def get_jwt_backend(name: str) -> JWTBackend:
+    """
+    Создание бэкенда JWT по имени из настроек.
+
+    Библиотека импортируется только для выбранного бэкенда.
+
+    Args:
+        name: Имя бэкенда ("jose" или "pyjwt").
+
+    Returns:
+        JWTBackend: Экземпляр бэкенда.
+
+    Raises:
+        ValueError: Если бэкенд неизвестен.
+    """
+    try:
+        backend_class = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Неизвестный JWT бэкенд '{name}'. Допустимы: {sorted(_BACKENDS)}"
+        ) from None
+    return backend_class()
@@ -0,0 +1,140 @@
+"""
+Модуль калибровки стоимости хеширования паролей.
+
+Замеряет скорость argon2 и bcrypt на текущем железе и подбирает параметры
+под целевую задержку одного хеша.
+
+Общий для сервисов: HTTP API калибрует argon2 и bcrypt при старте
+(PASSWORD_HASH_TARGET_MS > 0), gRPC сервис — только argon2 (bcrypt хеши
+у него лишь проверяются и перехешируются). CLI обоих сервисов
+(`python -m ...core.password_calibration`) печатают результат через cli().
+"""
+
+# Импорты для разбора аргументов CLI
+import argparse
+# Импорты для измерения времени
+import time
+# Импорты для неизменяемых контейнеров
+from dataclasses import dataclass
+
+# Импорты passlib хешеров
+from passlib.hash import argon2, bcrypt
+
+# Пароль-образец для замеров
+_PROBE = "calibration-probe-password"
+# Границы подбора параметров
+_MAX_ARGON2_TIME_COST = 32
+_MIN_BCRYPT_ROUNDS = 10
+_MAX_BCRYPT_ROUNDS = 16
+
+
+@dataclass(frozen=True, slots=True)
+class HashParams:
+    """Параметры стоимости хеширования."""
+
+    argon2_time_cost: int
+    argon2_memory_cost: int
+    argon2_parallelism: int
+    bcrypt_rounds: int
+
+
+def _measure_ms(handler, samples: int = 3) -> float:
+    """
+    Медианное время одного хеша в миллисекундах.
+
+    Args:
+        handler: Настроенный passlib хешер.
+        samples: Число замеров.
+
+    Returns:
+        float: Медиана времени хеширования (мс).
+    """
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        handler.hash(_PROBE)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def calibrate_argon2(target_ms: float, memory_cost: int, parallelism: int) -> int:
+    """
+    Подбор time_cost argon2 при фиксированной памяти.
+
+    Время argon2 растёт линейно от time_cost, поэтому достаточно
+    замера при time_cost=1.
+
+    Args:
+        target_ms: Целевое время одного хеша (мс).
+        memory_cost: Память на хеш (KiB) — не меняется, от неё зависит
+            допустимый параллелизм.
+        parallelism: Число потоков на хеш.
+
+    Returns:
+        int: Подобранный time_cost.
+    """
+    per_pass = _measure_ms(
+        argon2.using(time_cost=1, memory_cost=memory_cost, parallelism=parallelism)
+    )
+    return max(1, min(_MAX_ARGON2_TIME_COST, round(target_ms / per_pass)))
+
+
+def calibrate_bcrypt(target_ms: float) -> int:
+    """
+    Подбор числа раундов bcrypt (каждый раунд удваивает время).
+
+    Args:
+        target_ms: Целевое время одного хеша (мс).
+
+    Returns:
+        int: Число раундов с временем, ближайшим к целевому.
+    """
+    base = _measure_ms(bcrypt.using(rounds=_MIN_BCRYPT_ROUNDS))
+    best, best_diff = _MIN_BCRYPT_ROUNDS, abs(base - target_ms)
+    for rounds in range(_MIN_BCRYPT_ROUNDS + 1, _MAX_BCRYPT_ROUNDS + 1):
+        estimate = base * 2 ** (rounds - _MIN_BCRYPT_ROUNDS)
+        if abs(estimate - target_ms) < best_diff:
+            best, best_diff = rounds, abs(estimate - target_ms)
+    return best
+
+
+def calibrate(target_ms: float, memory_cost: int, parallelism: int) -> HashParams:
+    """
+    Калибровка всех схем хеширования под целевую задержку.
+
+    Args:
+        target_ms: Целевое время одного хеша (мс).
+        memory_cost: Память на argon2 хеш (KiB).
+        parallelism: Число потоков на argon2 хеш.
+
+    Returns:
+        HashParams: Подобранные параметры.
+    """
+    return HashParams(
+        argon2_time_cost=calibrate_argon2(target_ms, memory_cost, parallelism),
+        argon2_memory_cost=memory_cost,
+        argon2_parallelism=parallelism,
+        bcrypt_rounds=calibrate_bcrypt(target_ms),
+    )
+
+
+def cli(memory_cost: int, parallelism: int, bcrypt_rounds: bool = True) -> None:
+    """
+    CLI калибровки: печатает параметры в формате .env.
+
+    Args:
+        memory_cost: Память на argon2 хеш (KiB) из настроек сервиса.
+        parallelism: Число потоков на argon2 хеш из настроек сервиса.
+        bcrypt_rounds: Подбирать и печатать BCRYPT_ROUNDS.
+    """
+    parser = argparse.ArgumentParser(description="Калибровка стоимости хеширования")
+    parser.add_argument("--target-ms", type=float, default=250.0,
+                        help="Целевое время одного хеша (мс)")
+    args = parser.parse_args()
+
+    print(f"ARGON2_TIME_COST={calibrate_argon2(args.target_ms, memory_cost, parallelism)}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={parallelism}")
+    if bcrypt_rounds:
+        print(f"BCRYPT_ROUNDS={calibrate_bcrypt(args.target_ms)}")
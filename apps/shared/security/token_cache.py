@@ -0,0 +1,153 @@
+"""
+Модуль кеша проверенных JWT токенов.
+
+Клиенты повторяют один и тот же bearer токен сотни раз за время его жизни,
+поэтому результат проверки подписи кешируется в ограниченном LRU кеше.
+Ключ — SHA-256 дайджест токена, значение — расшифрованные claims.
+Запись живёт не дольше `exp` токена.
+
+Общий для сервисов: HTTP API держит один экземпляр на процесс,
+gRPC сервис — singleton в DI контейнере.
+"""
+
+# Импорты для вычисления дайджеста токена
+import hashlib
+# Импорты для блокировок (кеш используется из нескольких потоков)
+import threading
+# Импорты для работы со временем
+import time
+# Импорты для LRU порядка записей
+from collections import OrderedDict
+# Импорты для типизации
+from collections.abc import Callable
+from typing import Any
+
+
+class VerifiedTokenCache:
+    """
+    Потокобезопасный LRU кеш проверенных токенов с TTL.
+
+    Attributes:
+        max_size: Максимальное число записей (0 — кеш выключен).
+        max_ttl: Максимальное время жизни записи (секунды).
+        hits: Число попаданий.
+        misses: Число промахов.
+        evictions: Число вытесненных по размеру записей.
+    """
+
+    def __init__(self, max_size: int, max_ttl: float) -> None:
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # дайджест → (момент истечения по epoch, claims)
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Ключ кеша: сам токен в памяти не хранится."""
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """
+        Получение claims ранее проверенного токена.
+
+        Args:
+            token: JWT токен.
+
+        Returns:
+            dict | None: Копия claims или None при промахе/истечении.
+        """
+        if self.max_size <= 0:
+            return None
+        key = self._digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, claims = entry
+            if expires_at <= now:
+                # Токен истёк — запись больше не действительна
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return dict(claims)
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        """
+        Сохранение claims успешно проверенного токена.
+
+        Токены без числового `exp` не кешируются.
+
+        Args:
+            token: JWT токен.
+            claims: Расшифрованная полезная нагрузка.
+        """
+        exp = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(exp, (int, float)):
+            return
+        now = time.time()
+        # Запись истекает не позже токена
+        expires_at = min(float(exp), now + self.max_ttl)
+        if expires_at <= now:
+            return
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_decode(
+        self,
+        token: str,
+        decode: Callable[[str], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Claims из кеша или результат полной проверки токена.
+
+        Args:
+            token: JWT токен.
+            decode: Функция полной проверки (исключения пробрасываются).
+
+        Returns:
+            dict: Расшифрованная полезная нагрузка.
+        """
+        claims = self.get(token)
+        if claims is None:
+            claims = decode(token)
+            self.put(token, claims)
+        return claims
+
+    def clear(self) -> None:
+        """Удаление всех записей (например, после ротации ключей)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Счётчики кеша для мониторинга.
+
+        Returns:
+            dict: Размер, попадания, промахи, вытеснения и доля попаданий.
+        """
+        with self._lock:
+            size = len(self._entries)
+            hits, misses = self.hits, self.misses
+            evictions = self.evictions
+        total = hits + misses
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_ratio": hits / total if total else 0.0,
+        }
@@ -1,34 +1,102 @@
 """Task repository."""
 
 import uuid
-from typing import Optional
-from sqlalchemy import select
+from collections import Counter, defaultdict
+from typing import Any, Optional
+from sqlalchemy import (
+    ColumnElement,
+    Update,
+    and_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from backend.src.app.core.constants import TaskStatus
-from backend.src.app.models.task import Task
+from backend.src.app.models.task import NO_ASSIGNEE, Task, TaskStat
+from backend.src.app.models.user import User
 from backend.src.app.repositories.base import BaseRepository
 
+# (status, assigned_to_id) — the key tasks are counted by in task_stats
+TaskState = tuple[TaskStatus, Optional[uuid.UUID]]
+# A task after a transition, with its state before it
+Moved = tuple[Task, TaskState]
+
+# Advisory lock key held by the transaction that reconciles task_stats
+_RECONCILE_LOCK = 0x7461736B5F737473  # "task_sts"
+
+# Built once; executed with {"task_id": ...}
+_BY_ID_WITH_RELATIONS = (
+    select(Task)
+    .where(Task.id == bindparam("task_id"))
+    .options(
+        selectinload(Task.assigned_to),
+        selectinload(Task.completed_by),
+        selectinload(Task.created_by),
+    )
+)
+
+
+def _dialect(session: AsyncSession) -> str:
+    """
+    Dialect name. postgresql and sqlite get dedicated statements;
+    any other dialect takes the portable path (row locks, no RETURNING).
+    """
+    return session.get_bind().dialect.name
+
+
+def _update_returning_old(
+    task_ids: list[uuid.UUID],
+    conditions: list[ColumnElement[bool]],
+    values: dict[str, Any],
+) -> Update:
+    """
+    WITH old AS (SELECT ... FOR UPDATE)
+    UPDATE tasks ... FROM old RETURNING tasks.*, old.status, old.assigned_to_id
+
+    The CTE locks the matching rows and yields their state before the
+    UPDATE, so one statement both transitions the tasks and tells which
+    task_stats counters they leave.
+    """
+    old = (
+        select(Task.id, Task.status, Task.assigned_to_id)
+        .where(Task.id.in_(task_ids), *conditions)
+        .with_for_update()
+        .cte("old")
+    )
+    return (
+        update(Task)
+        .where(Task.id == old.c.id)
+        .values(**values)
+        .returning(Task, old.c.status, old.c.assigned_to_id)
+    )
+
 
 class TaskRepository(BaseRepository[Task]):
     model_class = Task
 
     async def get_by_id_with_relations(self, task_id: uuid.UUID) -> Optional[Task]:
         result = await self._session.execute(
-            select(Task)
-            .where(Task.id == task_id)
-            .options(
-                selectinload(Task.assigned_to),
-                selectinload(Task.completed_by),
-                selectinload(Task.created_by),
-            )
+            _BY_ID_WITH_RELATIONS, {"task_id": task_id}
         )
         return result.scalar_one_or_none()
 
     async def get_all_by_status(self, status: TaskStatus) -> list[Task]:
         result = await self._session.execute(
-            select(Task).where(Task.status == status)
+            select(Task)
+            .where(Task.status == status)
+            .order_by(Task.created_at.desc())
         )
         return list(result.scalars().all())
 
@@ -38,9 +106,325 @@ class TaskRepository(BaseRepository[Task]):
         )
         return list(result.scalars().all())
 
+    # ── Transitions: conditional UPDATE ... RETURNING the old state too ─────
+    # Tasks that don't meet the precondition (or are missing) are left out
+
+    async def _transition(
+        self,
+        task_ids: list[uuid.UUID],
+        conditions: list[ColumnElement[bool]],
+        **values: Any,
+    ) -> list[Moved]:
+        if not task_ids:
+            return []
+        dialect = _dialect(self._session)
+        if dialect == "postgresql":
+            result = await self._session.execute(
+                _update_returning_old(task_ids, conditions, values),
+                execution_options={"populate_existing": True, "synchronize_session": False},
+            )
+            return [(task, (status, assignee_id)) for task, status, assignee_id in result]
+        if dialect == "sqlite":
+            return await self._transition_if_unchanged(task_ids, conditions, values)
+        return await self._transition_locked(task_ids, conditions, values)
+
+    async def _transition_if_unchanged(
+        self,
+        task_ids: list[uuid.UUID],
+        conditions: list[ColumnElement[bool]],
+        values: dict[str, Any],
+    ) -> list[Moved]:
+        """
+        SQLite: read the old state, then UPDATE only rows still in it.
+
+        SQLite's RETURNING can't reference a FROM table, and pysqlite runs
+        the SELECT before its transaction begins. The observed state goes
+        into the UPDATE's WHERE instead, so a task changed in between is
+        not updated (and is reported as a miss) rather than miscounted.
+        """
+        result = await self._session.execute(
+            select(Task.id, Task.status, Task.assigned_to_id)
+            .where(Task.id.in_(task_ids), *conditions)
+        )
+        observed: dict[TaskState, list[uuid.UUID]] = defaultdict(list)
+        for row in result:
+            observed[(row.status, row.assigned_to_id)].append(row.id)
+        if not observed:
+            return []
+        unchanged = or_(*(
+            and_(
+                Task.id.in_(ids),
+                Task.status == status,
+                Task.assigned_to_id.is_not_distinct_from(assignee_id),
+            )
+            for (status, assignee_id), ids in observed.items()
+        ))
+        result = await self._session.execute(
+            update(Task)
+            .where(unchanged, *conditions)
+            .values(**values)
+            .returning(Task),
+            execution_options={"populate_existing": True, "synchronize_session": False},
+        )
+        before = {task_id: state for state, ids in observed.items() for task_id in ids}
+        return [(task, before[task.id]) for task in result.scalars()]
+
+    async def _lock_states(
+        self, conditions: list[ColumnElement[bool]]
+    ) -> dict[uuid.UUID, TaskState]:
+        """SELECT ... FOR UPDATE: the matching tasks' state, locked until commit."""
+        result = await self._session.execute(
+            select(Task.id, Task.status, Task.assigned_to_id)
+            .where(*conditions)
+            .with_for_update()
+        )
+        return {row.id: (row.status, row.assigned_to_id) for row in result}
+
+    async def _transition_locked(
+        self,
+        task_ids: list[uuid.UUID],
+        conditions: list[ColumnElement[bool]],
+        values: dict[str, Any],
+    ) -> list[Moved]:
+        """
+        Other dialects: lock the rows and read their state, UPDATE them,
+        read them back. Three statements, but nothing beyond FOR UPDATE
+        is needed (MySQL has neither UPDATE ... FROM a CTE nor RETURNING).
+        """
+        before = await self._lock_states([Task.id.in_(task_ids), *conditions])
+        if not before:
+            return []
+        await self._session.execute(
+            update(Task).where(Task.id.in_(before)).values(**values),
+            execution_options={"synchronize_session": False},
+        )
+        result = await self._session.execute(
+            select(Task).where(Task.id.in_(before)),
+            execution_options={"populate_existing": True},
+        )
+        return [(task, before[task.id]) for task in result.scalars()]
+
+    @staticmethod
+    def _can_assign(assignee_id: uuid.UUID) -> list[ColumnElement[bool]]:
+        return [
+            Task.status == TaskStatus.CREATED,
+            exists().where(User.id == assignee_id),
+        ]
+
+    @staticmethod
+    def _can_complete(assignee_id: Optional[uuid.UUID]) -> list[ColumnElement[bool]]:
+        """`assignee_id` restricts completion to the task's assignee."""
+        conditions = [Task.status != TaskStatus.COMPLETED]
+        if assignee_id is not None:
+            conditions.append(Task.assigned_to_id == assignee_id)
+        return conditions
+
+    async def assign(
+        self, task_id: uuid.UUID, assignee_id: uuid.UUID
+    ) -> Optional[Moved]:
+        moved = await self.assign_many([task_id], assignee_id)
+        return moved[0] if moved else None
+
+    async def complete(
+        self,
+        task_id: uuid.UUID,
+        completed_by_id: uuid.UUID,
+        assignee_id: Optional[uuid.UUID] = None,
+    ) -> Optional[Moved]:
+        moved = await self.complete_many([task_id], completed_by_id, assignee_id)
+        return moved[0] if moved else None
+
+    # ── Bulk transitions: the same preconditions, one statement per batch ──
+
+    async def assign_many(
+        self, task_ids: list[uuid.UUID], assignee_id: uuid.UUID
+    ) -> list[Moved]:
+        return await self._transition(
+            task_ids,
+            self._can_assign(assignee_id),
+            assigned_to_id=assignee_id,
+            status=TaskStatus.IN_PROGRESS,
+        )
+
+    async def complete_many(
+        self,
+        task_ids: list[uuid.UUID],
+        completed_by_id: uuid.UUID,
+        assignee_id: Optional[uuid.UUID] = None,
+    ) -> list[Moved]:
+        return await self._transition(
+            task_ids,
+            self._can_complete(assignee_id),
+            status=TaskStatus.COMPLETED,
+            completed_by_id=completed_by_id,
+        )
+
+    async def delete_many(
+        self,
+        task_ids: list[uuid.UUID],
+        created_by_id: Optional[uuid.UUID] = None,
+    ) -> dict[uuid.UUID, TaskState]:
+        """
+        DELETE ... RETURNING the deleted tasks' last state.
+
+        `created_by_id` restricts deletion to the task's creator.
+        """
+        if not task_ids:
+            return {}
+        conditions = [Task.id.in_(task_ids)]
+        if created_by_id is not None:
+            conditions.append(Task.created_by_id == created_by_id)
+        if _dialect(self._session) not in ("postgresql", "sqlite"):
+            # No DELETE ... RETURNING: lock and read the state first
+            deleted = await self._lock_states(conditions)
+            if deleted:
+                await self._session.execute(
+                    delete(Task).where(Task.id.in_(deleted)),
+                    execution_options={"synchronize_session": False},
+                )
+            return deleted
+        result = await self._session.execute(
+            delete(Task)
+            .where(*conditions)
+            .returning(Task.id, Task.status, Task.assigned_to_id),
+            execution_options={"synchronize_session": False},
+        )
+        return {row.id: (row.status, row.assigned_to_id) for row in result}
+
     async def update_fields(self, task: Task, **fields) -> Task:
-        for key, value in fields.items():
-            setattr(task, key, value)
-        await self._session.flush()
-        await self._session.refresh(task)
+        # None is a real value here (e.g. unassigning), unlike the base;
+        # one UPDATE ... RETURNING, or nothing if no field changed
+        if self._apply(task, fields, skip_none=False):
+            await self._session.flush()
         return task
+
+
+class TaskStatsRepository:
+    """
+    Counters in task_stats, changed by deltas and reconciled by recount.
+
+    Every create and assign moves the (CREATED, NO_ASSIGNEE) counter, so
+    concurrent creates/assigns queue on that one row lock until their
+    transactions commit. Keep the counter update the last statement of
+    the transaction; if the queue shows up in lock waits, split the row
+    into shards (an extra key column summed on read).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_all(self) -> list[TaskStat]:
+        result = await self._session.execute(
+            select(TaskStat).where(TaskStat.count != 0)
+        )
+        return list(result.scalars().all())
+
+    async def apply(self, deltas: Counter[TaskState]) -> None:
+        """
+        Add the deltas with one upsert:
+        INSERT ... ON CONFLICT (status, assignee_id) DO UPDATE count = count + delta.
+        Other dialects update the counters one by one (see _apply_each).
+
+        Rows go in key order so concurrent writers lock them the same way.
+        """
+        rows = sorted(
+            (
+                {"status": status, "assignee_id": assignee_id or NO_ASSIGNEE, "count": delta}
+                for (status, assignee_id), delta in deltas.items()
+                if delta
+            ),
+            key=lambda row: (row["status"], row["assignee_id"]),
+        )
+        if not rows:
+            return
+        dialect = _dialect(self._session)
+        if dialect == "postgresql":
+            stmt = pg_insert(TaskStat)
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(TaskStat)
+        else:
+            await self._apply_each(rows)
+            return
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TaskStat.status, TaskStat.assignee_id],
+                set_={"count": TaskStat.count + stmt.excluded.count},
+            ),
+            rows,
+        )
+
+    async def _apply_each(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Portable upsert: UPDATE count = count + delta, INSERT if no row matched.
+
+        An INSERT that loses a race with another writer's INSERT of the
+        same counter fails on the primary key; its savepoint is rolled
+        back and the delta goes in with the UPDATE after all.
+        """
+        for row in rows:
+            if await self._add_to(row):
+                continue
+            try:
+                async with self._session.begin_nested():
+                    await self._session.execute(insert(TaskStat).values(**row))
+            except IntegrityError:
+                await self._add_to(row)
+
+    async def _add_to(self, row: dict[str, Any]) -> bool:
+        result = await self._session.execute(
+            update(TaskStat)
+            .where(
+                TaskStat.status == row["status"],
+                TaskStat.assignee_id == row["assignee_id"],
+            )
+            .values(count=TaskStat.count + row["count"]),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount > 0
+
+    async def reconcile(self) -> Optional[Counter[TaskState]]:
+        """
+        Recount tasks with GROUP BY and apply the difference.
+
+        Must be the first thing in the session's transaction. The recount
+        and the counters are read from one snapshot: REPEATABLE READ on
+        PostgreSQL (a counter moved after the snapshot fails the upsert
+        with a serialization error instead of being overwritten), the
+        write lock taken up front (BEGIN IMMEDIATE) on SQLite. Other
+        dialects lock every counter row first (SELECT ... FOR UPDATE), so
+        writers wait on their counter update until the corrections commit.
+
+        Only one instance reconciles at a time: on PostgreSQL the others
+        find the advisory lock taken and skip the run.
+
+        Returns the corrections that were applied (empty if no drift),
+        or None if another instance is reconciling.
+        """
+        dialect = _dialect(self._session)
+        if dialect == "postgresql":
+            await self._session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+            locked = await self._session.scalar(
+                select(func.pg_try_advisory_xact_lock(_RECONCILE_LOCK))
+            )
+            if not locked:
+                return None
+        elif dialect == "sqlite":
+            await self._session.execute(text("BEGIN IMMEDIATE"))
+        else:
+            await self._session.execute(select(TaskStat.status).with_for_update())
+
+        result = await self._session.execute(
+            select(Task.status, Task.assigned_to_id, func.count())
+            .group_by(Task.status, Task.assigned_to_id)
+        )
+        drift: Counter[TaskState] = Counter({
+            (status, assignee_id): count for status, assignee_id, count in result
+        })
+        for stat in await self.get_all():
+            assignee_id = None if stat.assignee_id == NO_ASSIGNEE else stat.assignee_id
+            drift[(stat.status, assignee_id)] -= stat.count
+        drift = Counter({key: delta for key, delta in drift.items() if delta})
+        await self.apply(drift)
+        return drift
@@ -3,15 +3,29 @@
 import uuid
 from typing import Optional
 
-from sqlalchemy import Enum, ForeignKey, String
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.src.app.core.constants import TaskStatus
+from backend.src.app.core.database import Base
 from backend.src.app.models.base import BaseModel, UUIDType
 
+# task_stats key for unassigned tasks (primary key columns can't be NULL)
+NO_ASSIGNEE = uuid.UUID(int=0)
+
 
 class Task(BaseModel):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Newest-first keyset listing and export
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # get_all_by_status, newest first within a status
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+        # get_assigned_to_user, complete-by-assignee checks
+        Index("ix_tasks_assigned_to_id_status", "assigned_to_id", "status"),
+        # Tasks a user created, newest first
+        Index("ix_tasks_created_by_id_created_at", "created_by_id", "created_at"),
+    )
 
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -45,3 +59,20 @@ class Task(BaseModel):
 
     def __str__(self) -> str:
         return f"Task({self.title!r}, status={self.status})"
+
+
+class TaskStat(Base):
+    """
+    Materialized task count per (status, assignee).
+
+    Kept up to date by TaskService on every write and periodically
+    reconciled against a GROUP BY over tasks.
+    """
+
+    __tablename__ = "task_stats"
+
+    status: Mapped[TaskStatus] = mapped_column(
+        Enum(TaskStatus, name="taskstatus"), primary_key=True
+    )
+    assignee_id: Mapped[uuid.UUID] = mapped_column(UUIDType, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
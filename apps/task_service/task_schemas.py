@@ -4,7 +4,7 @@ import uuid
 from typing import Optional
 from pydantic import Field, ConfigDict
 
-from backend.src.app.core.constants import TaskStatus
+from backend.src.app.core.constants import BULK_MAX_ITEMS, TaskStatus
 from backend.src.app.schemas.base import BaseSchema, TimestampedSchema
 
 
@@ -29,3 +29,42 @@ class TaskOut(TimestampedSchema):
     assigned_to_id: Optional[uuid.UUID]
     completed_by_id: Optional[uuid.UUID]
     created_by_id: Optional[uuid.UUID]
+
+
+# ── Bulk ──────────────────────────────────────────────────────────────────────
+
+class TaskBulkCreate(BaseSchema):
+    items: list[TaskCreate] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkIds(BaseSchema):
+    task_ids: list[uuid.UUID] = Field(min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkAssign(TaskBulkIds):
+    assignee_id: uuid.UUID
+
+
+class TaskBulkItemResult(BaseSchema):
+    """Outcome for one item, in request order."""
+
+    id: Optional[uuid.UUID]
+    status_code: int
+    task: Optional[TaskOut] = None
+    error: Optional[str] = None
+
+
+# ── Stats ─────────────────────────────────────────────────────────────────────
+
+class TaskAssigneeStats(BaseSchema):
+    assignee_id: uuid.UUID
+    total: int
+    by_status: dict[TaskStatus, int]
+    completion_rate: float
+
+
+class TaskStatsOut(BaseSchema):
+    total: int
+    by_status: dict[TaskStatus, int]
+    completion_rate: float
+    by_assignee: list[TaskAssigneeStats]
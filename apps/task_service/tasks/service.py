@@ -4,107 +4,292 @@ Task service — business logic layer.
 Rules:
   - Only CREATED tasks can be assigned.
   - Only assigned user or admin can complete a task.
+  - Only task creator or admin can delete a task.
   - Notifications are dispatched via NotificationService after state changes.
+
+Bulk operations apply the same rules as single-task ones, but as one
+set-based statement per batch, and report a result per item.
+
+Every write moves the task_stats counters in the same transaction, so
+get_stats() never scans tasks.
 """
 
 import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
 from typing import Optional
 
 from backend.src.app.core.constants import TaskStatus, Role
+from backend.src.app.core.principal import Principal
+from backend.src.app.exceptions.base import AppException
 from backend.src.app.exceptions.http import ForbiddenError, NotFoundError, UnprocessableError
-from backend.src.app.models.task import Task
-from backend.src.app.models.user import User
-from backend.src.app.repositories.task import TaskRepository
+from backend.src.app.models.task import NO_ASSIGNEE, Task
+from backend.src.app.repositories.task import Moved, TaskRepository, TaskState, TaskStatsRepository
 from backend.src.app.repositories.user import UserRepository
-from backend.src.app.schemas.task import TaskCreate, TaskOut, TaskUpdate
+from backend.src.app.schemas.task import (
+    TaskAssigneeStats,
+    TaskBulkItemResult,
+    TaskCreate,
+    TaskOut,
+    TaskStatsOut,
+    TaskUpdate,
+)
 from backend.src.app.services.notifications.service import NotificationService
 
 
+# ── Rule violations ───────────────────────────────────────────────────────────
+# A transition that matched no row is explained from the task's current
+# state; shared by the single and bulk paths.
+
+def _assign_error(task: Optional[Task], task_id: uuid.UUID, assignee_id: uuid.UUID) -> AppException:
+    if not task:
+        return NotFoundError("Task", str(task_id))
+    if task.status != TaskStatus.CREATED:
+        return UnprocessableError("Only CREATED tasks can be assigned")
+    return NotFoundError("User", str(assignee_id))
+
+
+def _complete_error(task: Optional[Task], task_id: uuid.UUID) -> AppException:
+    if not task:
+        return NotFoundError("Task", str(task_id))
+    if task.status == TaskStatus.COMPLETED:
+        return UnprocessableError("Task is already completed")
+    return ForbiddenError("Only the assigned user or admin can complete a task")
+
+
+def _delete_error(task: Optional[Task], task_id: uuid.UUID) -> AppException:
+    if not task:
+        return NotFoundError("Task", str(task_id))
+    return ForbiddenError("Only task creator or admin can delete a task")
+
+
+def _restrict_to(actor: Principal) -> Optional[uuid.UUID]:
+    """Admins act on any task; everyone else only on their own."""
+    return None if actor.role == Role.ADMIN else actor.id
+
+
+def _state(task: Task) -> TaskState:
+    return task.status, task.assigned_to_id
+
+
+def _completion_rate(by_status: Mapping[TaskStatus, int]) -> float:
+    total = sum(by_status.values())
+    return by_status.get(TaskStatus.COMPLETED, 0) / total if total else 0.0
+
+
 class TaskService:
     def __init__(
         self,
         task_repo: TaskRepository,
         user_repo: UserRepository,
         notification_service: NotificationService,
+        stats_repo: TaskStatsRepository,
     ) -> None:
         self._tasks = task_repo
         self._users = user_repo
         self._notify = notification_service
+        self._stats = stats_repo
 
     # ── Read ──────────────────────────────────────────────────────────────────
 
+    # Reads select only the TaskOut columns and skip ORM hydration
+
     async def get_by_id(self, task_id: uuid.UUID) -> TaskOut:
-        task = await self._tasks.get_by_id(task_id)
+        task = await self._tasks.get_by_id_projected(TaskOut, task_id)
         if not task:
             raise NotFoundError("Task", str(task_id))
-        return TaskOut.model_validate(task)
+        return task
 
     async def get_all(self) -> list[TaskOut]:
         tasks = await self._tasks.get_all()
         return [TaskOut.model_validate(t) for t in tasks]
 
+    async def get_page(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> tuple[list[TaskOut], Optional[str]]:
+        """Keyset page, newest first, plus the cursor of the next page."""
+        return await self._tasks.get_page_projected(TaskOut, limit, cursor)
+
+    async def get_stats(self) -> TaskStatsOut:
+        """Aggregates from the task_stats counters, not from tasks."""
+        by_status: Counter[TaskStatus] = Counter()
+        by_assignee: dict[uuid.UUID, Counter[TaskStatus]] = {}
+        for stat in await self._stats.get_all():
+            by_status[stat.status] += stat.count
+            if stat.assignee_id != NO_ASSIGNEE:
+                by_assignee.setdefault(stat.assignee_id, Counter())[stat.status] += stat.count
+        return TaskStatsOut(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            completion_rate=_completion_rate(by_status),
+            by_assignee=[
+                TaskAssigneeStats(
+                    assignee_id=assignee_id,
+                    total=sum(counts.values()),
+                    by_status=counts,
+                    completion_rate=_completion_rate(counts),
+                )
+                for assignee_id, counts in by_assignee.items()
+            ],
+        )
+
     # ── Write ─────────────────────────────────────────────────────────────────
 
-    async def create(self, data: TaskCreate, created_by: User) -> TaskOut:
+    async def create(self, data: TaskCreate, created_by: Principal) -> TaskOut:
         task = Task(
             title=data.title,
             description=data.description,
             created_by_id=created_by.id,
         )
         task = await self._tasks.add(task)
+        await self._count(added=[_state(task)])
         return TaskOut.model_validate(task)
 
-    async def update(self, task_id: uuid.UUID, data: TaskUpdate, actor: User) -> TaskOut:
+    async def update(self, task_id: uuid.UUID, data: TaskUpdate, actor: Principal) -> TaskOut:
         task = await self._tasks.get_by_id(task_id)
         if not task:
             raise NotFoundError("Task", str(task_id))
 
+        before = _state(task)
         updates = data.model_dump(exclude_unset=True)
         task = await self._tasks.update_fields(task, **updates)
+        await self._count(removed=[before], added=[_state(task)])
         return TaskOut.model_validate(task)
 
-    async def delete(self, task_id: uuid.UUID, actor: User) -> None:
+    async def delete(self, task_id: uuid.UUID, actor: Principal) -> None:
         task = await self._tasks.get_by_id(task_id)
-        if not task:
-            raise NotFoundError("Task", str(task_id))
-        if actor.role != Role.ADMIN and task.created_by_id != actor.id:
-            raise ForbiddenError("Only task creator or admin can delete a task")
+        restrict = _restrict_to(actor)
+        if not task or (restrict is not None and task.created_by_id != restrict):
+            raise _delete_error(task, task_id)
         await self._tasks.delete(task)
+        await self._count(removed=[_state(task)])
 
-    async def assign(self, task_id: uuid.UUID, assignee_id: uuid.UUID, actor: User) -> TaskOut:
-        task = await self._tasks.get_by_id(task_id)
-        if not task:
-            raise NotFoundError("Task", str(task_id))
-        if task.status != TaskStatus.CREATED:
-            raise UnprocessableError("Only CREATED tasks can be assigned")
+    # Transitions check their preconditions inside a single UPDATE, so
+    # concurrent requests can't both pass them. Only when nothing matched
+    # is the task read again to pick the error. The UPDATE also returns
+    # each task's state before it, which moves the counters; the counter
+    # upsert goes last, so its row locks are held for the least time.
 
+    async def assign(self, task_id: uuid.UUID, assignee_id: uuid.UUID, actor: Principal) -> TaskOut:
+        moved = await self._tasks.assign(task_id, assignee_id)
+        if moved is None:
+            current = await self._tasks.get_by_id(task_id)
+            raise _assign_error(current, task_id, assignee_id)
+        task, _ = moved
         assignee = await self._users.get_by_id(assignee_id)
-        if not assignee:
-            raise NotFoundError("User", str(assignee_id))
-
-        task = await self._tasks.update_fields(
-            task,
-            assigned_to_id=assignee_id,
-            status=TaskStatus.IN_PROGRESS,
-        )
+        await self._count_moved([moved])
 
         # Fire-and-forget notification
         await self._notify.notify_task_assigned(task, assignee)
 
         return TaskOut.model_validate(task)
 
-    async def complete(self, task_id: uuid.UUID, actor: User) -> TaskOut:
-        task = await self._tasks.get_by_id(task_id)
-        if not task:
-            raise NotFoundError("Task", str(task_id))
-        if task.status == TaskStatus.COMPLETED:
-            raise UnprocessableError("Task is already completed")
-        if actor.role != Role.ADMIN and task.assigned_to_id != actor.id:
-            raise ForbiddenError("Only the assigned user or admin can complete a task")
-
-        task = await self._tasks.update_fields(
-            task,
-            status=TaskStatus.COMPLETED,
+    async def complete(self, task_id: uuid.UUID, actor: Principal) -> TaskOut:
+        moved = await self._tasks.complete(
+            task_id,
             completed_by_id=actor.id,
+            assignee_id=_restrict_to(actor),
         )
+        if moved is None:
+            current = await self._tasks.get_by_id(task_id)
+            raise _complete_error(current, task_id)
+        await self._count_moved([moved])
+        task, _ = moved
         return TaskOut.model_validate(task)
+
+    # ── Bulk ──────────────────────────────────────────────────────────────────
+
+    async def create_many(self, items: list[TaskCreate], created_by: Principal) -> list[TaskBulkItemResult]:
+        tasks = await self._tasks.add_many([
+            {
+                "title": data.title,
+                "description": data.description,
+                "created_by_id": created_by.id,
+            }
+            for data in items
+        ])
+        await self._count(added=[_state(task) for task in tasks])
+        return [
+            TaskBulkItemResult(id=task.id, status_code=201, task=TaskOut.model_validate(task))
+            for task in tasks
+        ]
+
+    async def assign_many(
+        self, task_ids: list[uuid.UUID], assignee_id: uuid.UUID, actor: Principal
+    ) -> list[TaskBulkItemResult]:
+        task_ids = list(dict.fromkeys(task_ids))
+        moved = await self._tasks.assign_many(task_ids, assignee_id)
+        tasks = [task for task, _ in moved]
+        assignee = await self._users.get_by_id(assignee_id) if tasks else None
+        await self._count_moved(moved)
+        for task in tasks:
+            await self._notify.notify_task_assigned(task, assignee)
+        return await self._bulk_results(
+            task_ids,
+            {task.id: task for task in tasks},
+            lambda task, task_id: _assign_error(task, task_id, assignee_id),
+        )
+
+    async def complete_many(self, task_ids: list[uuid.UUID], actor: Principal) -> list[TaskBulkItemResult]:
+        task_ids = list(dict.fromkeys(task_ids))
+        moved = await self._tasks.complete_many(
+            task_ids,
+            completed_by_id=actor.id,
+            assignee_id=_restrict_to(actor),
+        )
+        await self._count_moved(moved)
+        return await self._bulk_results(
+            task_ids, {task.id: task for task, _ in moved}, _complete_error
+        )
+
+    async def delete_many(self, task_ids: list[uuid.UUID], actor: Principal) -> list[TaskBulkItemResult]:
+        task_ids = list(dict.fromkeys(task_ids))
+        deleted = await self._tasks.delete_many(task_ids, created_by_id=_restrict_to(actor))
+        await self._count(removed=deleted.values())
+        return await self._bulk_results(
+            task_ids, dict.fromkeys(deleted), _delete_error, status_code=204
+        )
+
+    # ── Counters ──────────────────────────────────────────────────────────────
+
+    async def _count(
+        self, removed: Iterable[TaskState] = (), added: Iterable[TaskState] = ()
+    ) -> None:
+        deltas = Counter(added)
+        deltas.subtract(removed)
+        await self._stats.apply(deltas)
+
+    async def _count_moved(self, moved: Iterable[Moved]) -> None:
+        """Move each transitioned task from its old state to its new one."""
+        moved = list(moved)
+        await self._count(
+            removed=[before for _, before in moved],
+            added=[_state(task) for task, _ in moved],
+        )
+
+    async def _bulk_results(
+        self,
+        task_ids: list[uuid.UUID],
+        done: Mapping[uuid.UUID, Optional[Task]],
+        explain: Callable[[Optional[Task], uuid.UUID], AppException],
+        status_code: int = 200,
+    ) -> list[TaskBulkItemResult]:
+        """Per-item results; the misses are explained with one extra SELECT."""
+        missed = [task_id for task_id in task_ids if task_id not in done]
+        current = await self._tasks.get_many(missed) if missed else {}
+
+        results = []
+        for task_id in task_ids:
+            if task_id in done:
+                task = done[task_id]
+                results.append(TaskBulkItemResult(
+                    id=task_id,
+                    status_code=status_code,
+                    task=TaskOut.model_validate(task) if task else None,
+                ))
+            else:
+                error = explain(current.get(task_id), task_id)
+                results.append(TaskBulkItemResult(
+                    id=task_id, status_code=error.status_code, error=error.message
+                ))
+        return results